@@ -16,35 +16,125 @@ from string import hexdigits as HEXDIGITS
 from collections import abc
 import os
 import base64
+import time
+import blinker
 
-from ..utils import (Response, URL)
-from .torrent import (TorrentFields, Torrent)
+from ..utils import (Response, URL, Worker)
+from .torrent import (TorrentFields, Torrent, DEPENDENCIES)
 from .. import ClientError
 from ..filters.torrent import TorrentFilter
 from ..filters.file import TorrentFileFilter
 from ..utils import (Bool, Bandwidth, BoolOrBandwidth)
+from ..ttypes import TorrentFilePriority
 
 
 class _TorrentCache():
     def __init__(self, raw_torrents=()):
         self._tdict = {}  # Map torrent IDs to Torrent objects
-
-    def update(self, raw_torrents):
+        # Map torrent IDs to (timestamp, RPC fields) of their last update
+        self._updated = {}
+        # (timestamp, RPC fields) of the last update of all torrents
+        self._all_updated = (0, frozenset())
+        # Map torrent IDs to (timestamp, RPC fields) of provisional changes;
+        # RPC fields are None for removed torrents
+        self._provisional = {}
+
+    def update(self, raw_torrents, fields=(), timestamp=None, complete=False, merged=None):
+        """
+        Update or add torrents; this is a generator that yields after each torrent
+
+        fields: RPC fields that were requested for `raw_torrents`
+        timestamp: time.monotonic() when `raw_torrents` were requested
+        complete: Whether `raw_torrents` are all existing torrents
+        merged: None or return value of `_merge_raw_torrents`; merged raw
+                torrents replace cached raw torrents if these didn't change
+                since they were merged
+        """
         # import time ; start = time.time()
         tdict = self._tdict
+        if timestamp is not None:
+            updated = (timestamp, frozenset(fields))
+            if complete:
+                self._all_updated = updated
+        provisional = self._provisional
+        merged = merged or {}
         for rt in raw_torrents:
             tid = rt['id']
-            if tid in tdict:
+            prepared = merged.get(tid)
+            if tid in provisional:
+                rt = self._check_provisional(rt, timestamp)
+                prepared = None
+                if rt is None:
+                    yield
+                    continue
+            t = tdict.get(tid)
+            if prepared is not None and prepared[0] is (None if t is None else t._raw):
+                # Swap in merged raw torrent
+                _, raw_new, changed_fields, files = prepared
+                if t is None:
+                    t = tdict[tid] = Torrent(raw_new)
+                t.replace(raw_new, changed_fields, files)
+            elif t is not None:
                 # Update existing torrent
                 # log.debug('Updating torrent #%d, %d keys: %s', tid, len(rt), tuple(rt))
-                tdict[tid].update(rt)
+                t.update(rt)
             else:
                 # Add new torrent
                 # log.debug('Adding torrent #%d, %d keys: %s', tid, len(rt), tuple(rt))
                 tdict[tid] = Torrent(rt)
+            if timestamp is not None:
+                self._updated[tid] = updated
+            yield
+
+        # Torrents that are missing in a complete list requested after they
+        # were removed are gone for good
+        if complete and provisional:
+            for tid,(prov_timestamp,_) in tuple(provisional.items()):
+                if prov_timestamp <= timestamp:
+                    del provisional[tid]
         # log.debug('Updated %d cached with %d new torrents in %.3fms',
         #           len(tdict), len(raw_torrents), (time.time()-start)*1000)
 
+    def _check_provisional(self, rt, timestamp):
+        # Return raw torrent `rt` without values that are older than
+        # provisional values or None if the torrent was removed
+        prov_timestamp, prov_fields = self._provisional[rt['id']]
+        if timestamp is None or timestamp >= prov_timestamp:
+            # Requested after the change was made; `rt` confirms it or rolls
+            # it back
+            del self._provisional[rt['id']]
+            return rt
+        elif prov_fields is None:
+            return None
+        else:
+            return {field:value for field,value in rt.items()
+                    if field not in prov_fields}
+
+    def set_provisional(self, tids, raw_values):
+        """
+        Change cached torrents before the change is confirmed by a request
+
+        Until the torrents are requested again, values from requests that were
+        made before this call don't overwrite the new values.
+
+        tids: IDs of changed torrents
+        raw_values: Dictionary of RPC fields and values, callable that gets a
+                    raw torrent and returns such a dictionary or None to
+                    remove torrents
+        """
+        timestamp = time.monotonic()
+        tdict = self._tdict
+        for tid in tids:
+            if raw_values is None:
+                tdict.pop(tid, None)
+                self._updated.pop(tid, None)
+                self._provisional[tid] = (timestamp, None)
+            elif tid in tdict:
+                t = tdict[tid]
+                values = raw_values(t._raw) if callable(raw_values) else raw_values
+                t.update(values)
+                self._provisional[tid] = (timestamp, frozenset(values))
+
     def purge(self, existing_tids):
         """Remove torrents with IDs that are not in `existing_ids`"""
         tdict = self._tdict
@@ -54,6 +144,36 @@ class _TorrentCache():
             log.debug('Clearing cached torrents: %r', removed_tids)
         for tid in removed_tids:
             del tdict[tid]
+            self._updated.pop(tid, None)
+
+    def is_fresh(self, fields, max_age, ids=None):
+        """
+        Whether RPC `fields` were updated less than `max_age` seconds ago
+
+        If `ids` is None, all torrents must have been updated together,
+        otherwise only the torrents with `ids`.
+        """
+        min_timestamp = time.monotonic() - max_age
+        if ids is None:
+            updates = (self._all_updated,)
+        else:
+            updates = (self._updated.get(tid, (0, frozenset())) for tid in ids)
+        return all(timestamp >= min_timestamp and updated_fields.issuperset(fields)
+                   for timestamp,updated_fields in updates)
+
+    def get_raw(self, ids):
+        """
+        Map `ids` of cached torrents to (raw torrent, whether the file tree
+        was created)
+        """
+        tdict = self._tdict
+        return {tid:(tdict[tid]._raw, 'files' in tdict[tid]._cache)
+                for tid in ids if tid in tdict}
+
+    def ids_missing(self, fields):
+        """Return IDs of cached torrents that lack any of the RPC `fields`"""
+        return tuple(tid for tid,t in self._tdict.items()
+                     if any(field not in t._raw for field in fields))
 
     def get(self, *ids):
         """Return tuple of Torrent objects"""
@@ -71,16 +191,98 @@ class _TorrentCache():
                                         tlist=tlist or '(empty)')
 
 
+def _merge_raw_torrents(raw_torrents, raw_cached):
+    """
+    Merge requested raw torrents with cached raw torrents and create file trees
+
+    This is a generator that yields after each torrent.  It only uses its
+    arguments, which are not changed, so it can run in the worker thread.
+
+    raw_torrents: Sequence of requested raw torrents
+    raw_cached: Return value of `_TorrentCache.get_raw`
+
+    Return map of torrent IDs to (cached raw torrent or None, merged raw
+    torrent, changed RPC fields, TorrentFileTree or None) tuples; a new file
+    tree is only created if the requested raw torrent has 'fileStats' and the
+    cached file tree doesn't exist or is outdated.
+    """
+    merged = {}
+    for rt in raw_torrents:
+        tid = rt['id']
+        raw_old, has_files = raw_cached.get(tid, (None, False))
+        if raw_old is None:
+            raw_new = rt
+            changed_fields = ()
+        else:
+            changed_fields = tuple(field for field,value in rt.items()
+                                   if value is not None and value != raw_old.get(field))
+            raw_new = dict(raw_old)
+            raw_new.update(rt)
+
+        files = None
+        if 'fileStats' in rt and (not has_files or any(field in changed_fields
+                                                       for field in DEPENDENCIES['files'])):
+            snapshot = Torrent(raw_new)
+            if 'files' in snapshot:
+                files = snapshot['files']
+        merged[tid] = (raw_old, raw_new, changed_fields, files)
+        yield
+    return merged
+
+
 class TorrentAPI():
     """High-level abstraction of the Transmission RPC protocol"""
 
-    def __init__(self, rpc):
+    # RPC fields that only change when the user changes them (e.g. the list of
+    # announce URLs) are requested for all torrents at most once per
+    # STATIC_FIELDS_MAX_AGE seconds.  New torrents get them immediately.
+    STATIC_FIELDS = ('trackers',)
+    STATIC_FIELDS_MAX_AGE = 60
+
+    # Torrent actions (start, stop, etc) check torrents against cached values
+    # if they are no older than ACTION_MAX_AGE seconds
+    ACTION_MAX_AGE = 2
+
+    def __init__(self, rpc, worker=None):
         self.rpc = rpc
         self._tcache = _TorrentCache()
+        self._static_fields_updated = 0
+        self._worker = worker if worker is not None else Worker(loop=rpc.loop)
+        self._on_cache_update = blinker.Signal()
+
+    @property
+    def worker(self):
+        """
+        Worker that updates the torrent cache, creates file trees and filters
+        torrents
+        """
+        return self._worker
 
     def clearcache(self):
         """Remove all torrents from cache"""
-        self._tcache.purge(existing_tids=())
+        # The worker may be using the old cache right now
+        self._tcache = _TorrentCache()
+
+    def on_cache_update(self, callback, autoremove=True):
+        """
+        Register `callback` to be called when cached torrents are changed locally
+
+        After successful actions (start, stop, etc), cached torrents are changed
+        to their expected state until the next request confirms it.
+
+        `callback` gets this TorrentAPI instance as a positional argument and
+        the keyword argument "removed_ids", a tuple of IDs of removed torrents.
+
+        If `autoremove` is True, `callback` is removed automatically when it
+        is garbage collected.
+        """
+        self._on_cache_update.connect(callback, weak=autoremove)
+
+    async def _set_provisional(self, tids, raw_values):
+        # See _TorrentCache.set_provisional
+        await self._worker.run(self._tcache.set_provisional, tids, raw_values)
+        removed_ids = tuple(tids) if raw_values is None else ()
+        self._on_cache_update.send(self, removed_ids=removed_ids)
 
     @staticmethod
     async def _request(method, *args, **kwargs):
@@ -91,7 +293,7 @@ class TorrentAPI():
         else:
             return Response(result=result, msgs=(), success=True)
 
-    async def _map_tid_to_torrent_values(self, torrents, keys):
+    async def _map_tid_to_torrent_values(self, torrents, keys, max_age=None):
         """
         Map torrent ID to Torrent value(s)
 
@@ -105,8 +307,10 @@ class TorrentAPI():
         'torrent_values'.
 
         If request failed, return Response instance from `torrents` object.
+
+        `max_age` is passed to `torrents`.
         """
-        response = await self.torrents(torrents, keys=('id',) + tuple(keys))
+        response = await self.torrents(torrents, keys=('id',) + tuple(keys), max_age=max_age)
         if not response.success:
             return Response(success=False, torrent_values={}, msgs=response.msgs)
         else:
@@ -209,6 +413,19 @@ class TorrentAPI():
         """Unmodified 'torrent-get' request"""
         if 'id' not in fields:
             fields = ('id',) + tuple(fields)
+        requested_fields = fields
+        timestamp = time.monotonic()
+
+        static_fields = ()
+        if ids is None:
+            static_fields = tuple(f for f in fields if f in self.STATIC_FIELDS)
+            if static_fields:
+                if time.monotonic() - self._static_fields_updated < self.STATIC_FIELDS_MAX_AGE:
+                    fields = tuple(f for f in fields if f not in static_fields)
+                else:
+                    static_fields = ()
+                    self._static_fields_updated = time.monotonic()
+
         try:
             if ids is None:
                 # Request all IDs
@@ -221,25 +438,63 @@ class TorrentAPI():
                     # No IDs (i.e. empty torrent list) requested
                     raw_tlist = []
         except ClientError as e:
+            self._static_fields_updated = 0
             return Response(success=False, raw_torrents=[], msgs=[e])
         else:
-            self._tcache.update(raw_tlist)
-
-            # If we just got a list of all torrents, we can check for torrents
-            # that we still have cached but don't exist anymore and purge them.
-            if ids is None:
-                tids = tuple(t['id'] for t in raw_tlist)
-                self._tcache.purge(existing_tids=tids)
+            merged = None
+            if self._worker.threaded:
+                # Merge raw torrents and create file trees in the worker
+                # thread; _update_tcache only swaps them into the cache
+                raw_cached = self._tcache.get_raw(rt['id'] for rt in raw_tlist)
+                merged = await self._worker.run_threaded(_merge_raw_torrents,
+                                                         raw_tlist, raw_cached)
+            missing_ids = await self._worker.run(self._update_tcache, raw_tlist,
+                                                 fields=requested_fields,
+                                                 timestamp=timestamp,
+                                                 purge=ids is None,
+                                                 static_fields=static_fields,
+                                                 merged=merged)
+
+            # Request skipped static fields for torrents we haven't seen before
+            if static_fields:
+                if missing_ids:
+                    response = await self._request_torrents(('id',) + static_fields, missing_ids)
+                    if not response.success:
+                        return response
 
             return Response(success=True, raw_torrents=raw_tlist)
 
-    async def _get_torrents_by_ids(self, keys, ids=None):
+    def _update_tcache(self, raw_tlist, fields, timestamp, purge, static_fields, merged=None):
+        # Generator for the worker that returns IDs of torrents that lack any
+        # of the `static_fields`
+        tcache = self._tcache
+        yield from tcache.update(raw_tlist, fields, timestamp, complete=purge, merged=merged)
+
+        # If we just got a list of all torrents, we can check for torrents
+        # that we still have cached but don't exist anymore and purge them.
+        if purge:
+            tids = tuple(t['id'] for t in raw_tlist)
+            tcache.purge(existing_tids=tids)
+
+        # Create or update file trees here instead of when they are accessed
+        file_tids = tuple(rt['id'] for rt in raw_tlist if 'fileStats' in rt)
+        if file_tids:
+            for t in tcache.get(*file_tids):
+                yield from t.cache_files()
+
+        if static_fields:
+            return tcache.ids_missing(static_fields)
+        return ()
+
+    async def _get_torrents_by_ids(self, keys, ids=None, max_age=None):
         """
         Return a Response object with 'torrents' set to a tuple of Torrents
 
         keys: 'ALL' for all supported Torrent keys or a sequence of key
               strings (see client.ttypes.TYPES for available keys)
         ids: None for all torrents or a sequence of wanted IDs
+        max_age: None or maximum number of seconds since the wanted torrents
+                 were requested; younger torrents are not requested again
         """
         if keys == 'ALL':
             fields = TorrentFields(keys)
@@ -250,7 +505,12 @@ class TorrentAPI():
         msgs = []
         success = False
 
-        response = await self._request_torrents(fields, ids)
+        if max_age is not None and self._tcache.is_fresh(fields, max_age, ids):
+            log.debug('Using cached torrents')
+            response = Response(success=True)
+        else:
+            response = await self._request_torrents(fields, ids)
+
         if not response.success:
             return Response(success=False, torrents=(), msgs=response.msgs)
         else:
@@ -259,11 +519,11 @@ class TorrentAPI():
 
             # Get torrents from cache
             if ids is None:
-                tlist = self._tcache.get()
+                tlist = await self._worker.run(self._tcache.get)
             elif len(ids) < 1:
                 tlist = ()
             else:
-                tlist = self._tcache.get(*ids)
+                tlist = await self._worker.run(self._tcache.get, *ids)
 
                 # Provide error for requested IDs that don't exist
                 existing_ids = tuple(t['id'] for t in tlist)
@@ -277,17 +537,17 @@ class TorrentAPI():
             log.debug('Found %d torrents in %.3fms', len(tlist), (time()-start)*1e3)
         return Response(success=success, torrents=tlist, msgs=msgs)
 
-    async def _get_torrents_by_filter(self, keys, tfilter=None):
+    async def _get_torrents_by_filter(self, keys, tfilter=None, max_age=None):
         """
         Return a Response object with 'torrents' set to a tuple of Torrents
 
-        keys: See _get_torrents_by_ids
+        keys, max_age: See _get_torrents_by_ids
         tfilter: A TorrentFilter instance or None
         """
         if tfilter is None:
             log.debug('Looking for all torrents with keys: %s', keys)
             # No filter specified - just return all torrents with the specified keys
-            return await self._get_torrents_by_ids(keys=keys)
+            return await self._get_torrents_by_ids(keys=keys, max_age=max_age)
         else:
             log.debug('Looking for %s torrents with keys: %s', tfilter, keys)
             tlist = ()
@@ -298,14 +558,27 @@ class TorrentAPI():
 
             # Request all torrents with the keys needed to filter them
             log.debug('Requesting full list with filter keys: %s', tfilter.needed_keys)
-            response = await self._get_torrents_by_ids(keys=tfilter.needed_keys)
+            response = await self._get_torrents_by_ids(keys=tfilter.needed_keys, max_age=max_age)
             if response.success:
                 # Find IDs of torrents that match tfilter
-                wanted_ids = tuple(t['id'] for t in tfilter.apply(response.torrents))
+                def get_wanted_ids(tfilter, torrents, snapshots=False):
+                    wanted_ids = []
+                    for t in torrents:
+                        if snapshots:
+                            t = t.snapshot()
+                        if tfilter.match(t):
+                            wanted_ids.append(t['id'])
+                        yield
+                    return tuple(wanted_ids)
+                if self._worker.threaded:
+                    wanted_ids = await self._worker.run_threaded(get_wanted_ids, tfilter,
+                                                                 response.torrents, snapshots=True)
+                else:
+                    wanted_ids = await self._worker.run(get_wanted_ids, tfilter, response.torrents)
                 log.debug('Wanted IDs: %s', wanted_ids)
                 if len(wanted_ids) > 0:
                     # Get only wanted torrents with all wanted keys
-                    response = await self._get_torrents_by_ids(keys, wanted_ids)
+                    response = await self._get_torrents_by_ids(keys, wanted_ids, max_age=max_age)
                     if not response.success:
                         msgs.extend(response.msgs)
                     else:
@@ -322,13 +595,15 @@ class TorrentAPI():
 
             return Response(success=success, torrents=tlist, msgs=msgs)
 
-    async def torrents(self, torrents=None, keys='ALL'):
+    async def torrents(self, torrents=None, keys='ALL', max_age=None):
         """
         Fetch and return torrents
 
         torrents: Iterator of torrent IDs, TorrentFilter object (or its string
                   representation) or None for all torrents
         keys: tuple of Torrent keys to fetch or 'ALL' for all torrents
+        max_age: None to always fetch torrents or maximum number of seconds
+                 since cached torrents were fetched with all needed `keys`
 
         Return Response with the following properties:
             torrents: tuple of Torrent objects with requested torrents
@@ -336,17 +611,17 @@ class TorrentAPI():
             msgs: list of strings/`ClientError`s caused by the request
         """
         if torrents is None:
-            return await self._get_torrents_by_ids(keys)
+            return await self._get_torrents_by_ids(keys, max_age=max_age)
         elif isinstance(torrents, (str, TorrentFilter)):
-            return await self._get_torrents_by_filter(keys, tfilter=torrents)
+            return await self._get_torrents_by_filter(keys, tfilter=torrents, max_age=max_age)
         elif isinstance(torrents, abc.Sequence) and \
              all(isinstance(id, int) for id in torrents):
-            return await self._get_torrents_by_ids(keys, ids=torrents)
+            return await self._get_torrents_by_ids(keys, ids=torrents, max_age=max_age)
         else:
             raise ValueError("Invalid 'torrents' argument: {!r}".format(torrents))
 
     async def _torrent_action(self, method, torrents=None, method_args={}, check=None,
-                              keys_check=()):
+                              keys_check=(), provisional=None):
         """
         Helper method that operates on torrents (start, stop, remove, etc)
 
@@ -359,6 +634,8 @@ class TorrentAPI():
                True, `method` is applied to the torrent, otherwise not.
         keys_check: List of Torrent keys the check function needs ('id' and
                     'name' are always included)
+        provisional: None or expected changes of RPC fields after `method` was
+                     applied (see `_TorrentCache.set_provisional`)
 
         Return Response with the following properties:
             torrents: tuple of Torrents that `method` was applied to with the
@@ -373,7 +650,7 @@ class TorrentAPI():
         # Always provide some basic keys
         keys_check = set(tuple(keys_check) + ('id', 'name'))
 
-        response = await self.torrents(torrents, keys=keys_check)
+        response = await self.torrents(torrents, keys=keys_check, max_age=self.ACTION_MAX_AGE)
         if not response.success:
             return Response(success=False, torrents=(), msgs=response.msgs)
         else:
@@ -397,14 +674,17 @@ class TorrentAPI():
         if len(tlist) <= 0:
             return Response(success=False, torrents=(), msgs=msgs)
         else:
+            tids = tuple(t['id'] for t in tlist)
             try:
                 # Ignore response because it is always {}, except for
                 # 'torrent-get' requests, which this method is not meant for.
-                await method(ids=tuple(t['id'] for t in tlist), **method_args)
+                await method(ids=tids, **method_args)
             except ClientError as e:
                 msgs.append(e)
                 return Response(success=False, torrents=(), msgs=msgs)
             else:
+                if provisional is not None:
+                    await self._set_provisional(tids, provisional)
                 return Response(success=True, torrents=tuple(tlist), msgs=msgs)
 
     async def stop(self, torrents):
@@ -425,7 +705,9 @@ class TorrentAPI():
                 return (True, 'Stopping ' + t['name'])
 
         return await self._torrent_action(self.rpc.torrent_stop, torrents,
-                                          check=check, keys_check=('status',))
+                                          check=check, keys_check=('status',),
+                                          provisional={'status': 0, 'rateDownload': 0,
+                                                       'rateUpload': 0})
 
     async def start(self, torrents, force=False):
         """
@@ -451,9 +733,14 @@ class TorrentAPI():
         else:
             method = self.rpc.torrent_start
 
+        def get_status(raw):
+            # Seeding if complete, downloading otherwise
+            return {'status': 6 if raw.get('percentDone', 0) >= 1 else 4}
+
         return await self._torrent_action(method, torrents,
                                           check=check, keys_check=('status',),
-                                          method_args={'force':force})
+                                          method_args={'force':force},
+                                          provisional=get_status)
 
     async def toggle_stopped(self, torrents, force=False):
         """
@@ -514,7 +801,8 @@ class TorrentAPI():
                 return (True, 'Verifying ' + t['name'])
 
         return await self._torrent_action(self.rpc.torrent_verify, torrents,
-                                          check=check, keys_check=('status',))
+                                          check=check, keys_check=('status',),
+                                          provisional={'status': 1})
 
     async def remove(self, torrents, delete=False):
         """
@@ -537,9 +825,12 @@ class TorrentAPI():
         def create_info_msg(t):
             return (True, msg % t['name'])
 
-        return await self._torrent_action(self.rpc.torrent_remove, torrents,
-                                          check=create_info_msg,
-                                          method_args={'delete-local-data': delete})
+        response = await self._torrent_action(self.rpc.torrent_remove, torrents,
+                                              check=create_info_msg,
+                                              method_args={'delete-local-data': delete})
+        if response.success:
+            await self._set_provisional(tuple(t['id'] for t in response.torrents), None)
+        return response
 
 
     async def move(self, torrents, destination):
@@ -571,7 +862,8 @@ class TorrentAPI():
 
         return await self._torrent_action(self.rpc.torrent_set_location, torrents,
                                           check=create_info_msg, keys_check=('path',),
-                                          method_args={'move': True, 'location': destination})
+                                          method_args={'move': True, 'location': destination},
+                                          provisional={'downloadDir': destination})
 
 
     async def file_priority(self, torrents, files, priority):
@@ -640,25 +932,33 @@ class TorrentAPI():
                     msgs.extend(response.msgs)
 
         if torrent_ids:
-            response = await self.torrents(torrent_ids, keys=('id', 'name', 'files'))
-            if response.success:
-                torrents = response.torrents
+            # Cached torrents have the new priorities
+            torrents = await self._worker.run(self._tcache.get, *torrent_ids)
         return Response(torrents=torrents, success=success, msgs=msgs)
 
     async def _set_files_priority(self, priority, torrent_id, file_indexes):
         fi = tuple(file_indexes)
         log.debug('Setting priority of torrent #%d: %r: %s', torrent_id, priority, file_indexes)
         if priority in ('high', 'normal', 'low'):
-            return await self._torrent_action(
-                self.rpc.torrent_set, (torrent_id,),
-                method_args={'priority-%s' % priority: fi, 'files-wanted': fi})
+            method_args = {'priority-%s' % priority: fi, 'files-wanted': fi}
+            new_stats = {'wanted': True, 'priority': int(TorrentFilePriority(priority))}
         elif priority == 'off':
-            return await self._torrent_action(
-                self.rpc.torrent_set, (torrent_id,),
-                method_args={'files-unwanted': fi})
+            method_args = {'files-unwanted': fi}
+            new_stats = {'wanted': False}
         else:
             raise ValueError('Invalid priority: {!r}'.format(priority))
 
+        def get_fileStats(raw):
+            fileStats = list(raw.get('fileStats', ()))
+            for i in fi:
+                if i < len(fileStats):
+                    fileStats[i] = {**fileStats[i], **new_stats}
+            return {'fileStats': fileStats}
+
+        return await self._torrent_action(self.rpc.torrent_set, (torrent_id,),
+                                          method_args=method_args,
+                                          provisional=get_fileStats)
+
 
     async def _limit_rate_absolute(self, torrents, direction, limit):
         if isinstance(limit, str):
@@ -688,11 +988,13 @@ class TorrentAPI():
         return await self._limit_rate(torrents, direction, get_new_limit=add_to_current_limit)
 
     async def _limit_rate(self, torrents, direction, get_new_limit):
-        response = await self._map_tid_to_torrent_values(torrents, keys=('limit-rate-'+direction,))
+        key = 'limit-rate-' + direction
+        response = await self._map_tid_to_torrent_values(torrents, keys=('name', key),
+                                                         max_age=self.ACTION_MAX_AGE)
         if not response.success:
             return Response(success=False, torrent_set_args={}, errors=[], msgs=response.msgs)
         else:
-            current_limits = response.torrent_values
+            current_limits = {tid:values[key] for tid,values in response.torrent_values.items()}
             log.debug('Current %sload rate limits: %r', direction, current_limits)
 
         # Generate 'torrent-set' arguments for each torrent ID.  To de-duplicate
@@ -732,25 +1034,24 @@ class TorrentAPI():
         # Send one 'torrent-set' request for each list of torrent IDs
         for args,tids in torrent_set_args.items():
             response = await self._torrent_action(self.rpc.torrent_set, tids,
-                                                  method_args=dict(args))
+                                                  method_args=dict(args),
+                                                  provisional=dict(args))
             if not response.success:
                 return Response(success=False, torrents=(), msgs=response.msgs)
 
-        # Fetch torrents again and return Response with new rate limit messages
+        # Cached torrents have the new rate limits
         all_tids = sum(torrent_set_args.values(), []) + list(errors)
-        response = await self.torrents(all_tids, keys=('name', 'id', 'limit-rate-'+direction))
-        if not response.success:
-            return Response(success=False, torrents=(), msgs=response.msgs)
+        tlist = await self._worker.run(self._tcache.get, *all_tids)
         msgs = []
         success = False
-        for t in response.torrents:
+        for t in tlist:
             if t['id'] in errors:
                 msgs.append(ClientError('%s %sload rate: %s' %
                                         (t['name'], direction, errors[t['id']])))
             else:
                 success = True
                 msgs.append('%s %sload rate: %s' % (t['name'], direction, t['limit-rate-'+direction]))
-        return Response(torrents=response.torrents, success=success, msgs=msgs)
+        return Response(torrents=tlist, success=success, msgs=msgs)
 
     async def set_limit_rate_up(self, torrents, limit):
         """
@@ -848,6 +1149,7 @@ class TorrentAPI():
         args = {'trackerAdd': [str(url) for url in new_urls]}
         response = await self._torrent_action(self.rpc.torrent_set, torrents,
                                               method_args=args)
+        self._static_fields_updated = 0
         if not response.success:
             return Response(success=False, torrents=(), msgs=msgs + list(response.msgs))
         else:
@@ -916,6 +1218,7 @@ class TorrentAPI():
                                                       method_args={'trackerRemove': trkids})
                 if not response.success:
                     return Response(success=False, torrents=(), msgs=response.msgs)
+            self._static_fields_updated = 0
 
         # Get new torrent list with newly added trackers
         response = await self.torrents(tuple(remove_ids), keys=('id', 'name', 'trackers'))
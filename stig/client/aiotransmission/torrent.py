@@ -76,6 +76,13 @@ def _count_seeds(t):
         return ttypes.Count.UNKNOWN
 
 
+def _tracker_domains(t):
+    # Unlike 'trackerStats', 'trackers' only changes when trackers are added or
+    # removed, so this value usually stays cached.
+    domains = (utils.URL(tracker['announce']).domain for tracker in t['trackers'])
+    return tuple(domain for domain in domains if domain is not None)
+
+
 def _bytes_available(t):
     return t['desiredAvailable'] + t['haveValid'] + t['haveUnchecked']
 
@@ -180,6 +187,11 @@ def _make_status(t):
 
 
 def _create_TorrentFileTree(t):
+    return utils.run_generator(_iter_create_TorrentFileTree(t))
+
+
+def _iter_create_TorrentFileTree(t):
+    # Generator that yields after each file and returns the TorrentFileTree
     fileStats = t['fileStats']
     if len(fileStats) < 1:
         # filelist is empty if torrent was added by hash and metadata isn't
@@ -192,14 +204,19 @@ def _create_TorrentFileTree(t):
         tid = t['id']
         filelist = ({'id': (tid, i), **f, **fS}
                     for i,(f,fS) in enumerate(zip(t['files'], fileStats)))
-    return TorrentFileTree(t['id'], filelist, path=())
+    ftree = TorrentFileTree(t['id'], (), path=())
+    yield from ftree._fill(t['id'], filelist, path=())
+    return ftree
 
 import os
 class TorrentFileTree(base.TorrentFileTreeBase):
     def __init__(self, torrent_id, filelist, path):
         log.debug('Creating new TorrentFileTree for torrent %r', torrent_id)
         super().__init__(path)
+        utils.run_generator(self._fill(torrent_id, filelist, path))
 
+    def _fill(self, torrent_id, filelist, path):
+        # Generator that yields after each file
         items = {}
         subdirs = {}
 
@@ -223,9 +240,12 @@ class TorrentFileTree(base.TorrentFileTreeBase):
                 subdirs[subdir].append(entry)
             else:
                 raise RuntimeError(parts)
+            yield
 
         for subdir,filelist in subdirs.items():
-            items[subdir] = TorrentFileTree(torrent_id, filelist, path=path+(subdir,))
+            subtree = TorrentFileTree(torrent_id, (), path=path+(subdir,))
+            yield from subtree._fill(torrent_id, filelist, path=path+(subdir,))
+            items[subdir] = subtree
         self._items = items
 
     def update(self, raw_torrent):
@@ -409,6 +429,7 @@ DEPENDENCIES = {
 
     'error'                        : ('errorString', 'error', 'trackerStats'),
     'trackers'                     : ('trackerStats', 'name', 'id'),
+    'tracker-domains'              : ('trackers',),
     'peers'                        : ('peers', 'totalSize', 'name'),
     'files'                        : ('files', 'fileStats',),
 }
@@ -444,10 +465,19 @@ _MODIFY = {
 
     'error'                        : _find_error,
     'trackers'                     : TrackerList,
+    'tracker-domains'              : _tracker_domains,
     'peers'                        : PeerList,
     'files'                        : _create_TorrentFileTree,
 }
 
+# Map RPC fields to the keys that depend on them
+_DEPENDENT_KEYS = {}
+for _key,_fields in DEPENDENCIES.items():
+    for _field in _fields:
+        _DEPENDENT_KEYS.setdefault(_field, []).append(_key)
+del _key, _fields, _field
+
+
 class Torrent(base.TorrentBase):
     """Information about a torrent as a mapping
 
@@ -458,6 +488,16 @@ class Torrent(base.TorrentBase):
         self._raw = raw_torrent
         self._cache = {}
 
+    def cache_files(self):
+        """
+        Create the file tree if it is available but wasn't created yet
+
+        This is a generator that yields after each file.
+        """
+        if 'files' not in self._cache and 'files' in self:
+            ftree = yield from _iter_create_TorrentFileTree(self._raw)
+            self._cache['files'] = ttypes.TYPES['files'](ftree)
+
     def update(self, raw_torrent):
         cache = self._cache
         raw_old = self._raw
@@ -482,8 +522,39 @@ class Torrent(base.TorrentBase):
                         del cache[k]
                     break
 
-        # Now we can forget the old values
-        raw_old.update(raw_torrent)
+        # Now we can forget the old values.  The old raw torrent is replaced
+        # instead of changed because snapshots may still use it.
+        raw_new = dict(raw_old)
+        raw_new.update(raw_torrent)
+        self._raw = raw_new
+
+    def replace(self, raw_torrent, fields, files=None):
+        """
+        Replace raw torrent with `raw_torrent`
+
+        This is `update` for raw torrents that were merged in another thread.
+
+        fields: RPC fields that differ between the current raw torrent and
+                `raw_torrent`
+        files: TorrentFileTree that was created from `raw_torrent` or None
+        """
+        cache = self._cache
+        for field in fields:
+            for k in _DEPENDENT_KEYS.get(field, ()):
+                cache.pop(k, None)
+        if files is not None:
+            cache['files'] = files
+        self._raw = raw_torrent
+
+    def snapshot(self):
+        """
+        Return new Torrent with the same values
+
+        Raw torrents are never changed, so they are shared.  Values are
+        computed again by the snapshot, which makes it safe to use in another
+        thread.
+        """
+        return type(self)(self._raw)
 
     def __getitem__(self, key):
         cache = self._cache
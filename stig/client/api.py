@@ -14,7 +14,7 @@ log = make_logger(__name__)
 
 import asyncio
 
-from .utils import SleepUneasy
+from .utils import (SleepUneasy, Worker)
 
 from .aiotransmission.rpc import TransmissionRPC
 from .aiotransmission.api_status import StatusAPI
@@ -50,6 +50,7 @@ class API():
                                     password=password, loop=self.loop, path=path)
         self._pollers = []
         self._manage_pollers_interval = SleepUneasy(loop=self.loop)
+        self._worker = Worker(loop=self.loop)
         self.interval = interval
 
     @property
@@ -57,6 +58,16 @@ class API():
         """TransmissionRPC singleton"""
         return self._rpc
 
+    @property
+    def worker(self):
+        """
+        Worker singleton that processes torrent lists
+
+        Set its `threaded` attribute to True to merge, filter and sort torrents
+        in a separate thread.
+        """
+        return self._worker
+
     @property
     def interval(self):
         """Delay between polls of all pollers"""
@@ -77,7 +88,7 @@ class API():
     def torrent(self):
         """TorrentAPI singleton"""
         log.debug('Creating TorrentAPI singleton')
-        return TorrentAPI(self.rpc)
+        return TorrentAPI(self.rpc, worker=self.worker)
 
     @lazy_property(after_creation=lambda self: setattr(self, 'status_created', True))
     def status(self):
@@ -16,7 +16,7 @@ log = make_logger(__name__)
 
 import operator
 import re
-from collections import abc
+from collections import (abc, OrderedDict)
 from itertools import zip_longest
 
 
@@ -232,6 +232,26 @@ class Filter():
             val = str(self._value)
             return name + op + val
 
+    def narrows(self, other):
+        """Whether every object matched by this filter is also matched by `other`
+
+        This is only guaranteed to be detected for equal filters and for
+        comparisons of strings with the '~' operator ('name~foob' narrows
+        'name~foo', '!name~foo' narrows '!name~foob').  False negatives are
+        possible, false positives are not.
+        """
+        if self == other:
+            return True
+        elif self._name != other._name or self._invert != other._invert or \
+             not isinstance(self._value, str) or not isinstance(other._value, str):
+            return False
+        elif other._op == '~':
+            if self._invert:
+                return self._op == '~' and self._value in other._value
+            else:
+                return self._op in ('~', '=') and other._value in self._value
+        return False
+
     @property
     def needed_keys(self):
         return self._needed_keys
@@ -336,6 +356,19 @@ class FilterChain():
             return any(all(f.match(obj) for f in AND_chain)
                        for AND_chain in self._filterchains)
 
+    def narrows(self, other):
+        """Whether every object matched by this chain is also matched by `other`
+
+        See `Filter.narrows`.
+        """
+        if not other._filterchains:
+            return True
+        elif not self._filterchains:
+            return False
+        return all(any(_and_chain_narrows(AND_chain, other_AND_chain)
+                       for other_AND_chain in other._filterchains)
+                   for AND_chain in self._filterchains)
+
     @property
     def needed_keys(self):
         """The object keys needed for filtering"""
@@ -356,6 +389,9 @@ class FilterChain():
             other_fc_sets = set(frozenset(x) for x in other._filterchains)
             return self_fc_sets == other_fc_sets
 
+    def __hash__(self):
+        return hash(frozenset(frozenset(x) for x in self._filterchains))
+
     def __str__(self):
         if len(self._filterchains) < 1:
             return 'all'
@@ -369,30 +405,82 @@ class FilterChain():
         return '<{} {}>'.format(type(self).__name__, str(self))
 
     def __add__(self, other):
-        cls = type(self)
-        nofilter = cls()
-        if not isinstance(other, cls):
+        if not isinstance(other, type(self)):
             return NotImplemented
-        elif other == nofilter or self == nofilter:
-            return nofilter
         else:
-            # Start with our own stuff
-            new_fc = list(self._filterchains)
+            return self.union(self, other)
 
-            # Because foo&bar is the same as bar&foo, comparing sets makes
-            # everything much easier
-            self_fc_sets = tuple(set(x) for x in self._filterchains)
-
-            # Copy each AND_chain from other unless we already have it
-            for AND_chain in other._filterchains:
-                AND_chain_set = set(AND_chain)
-                if AND_chain_set not in self_fc_sets:
-                    new_fc.append(AND_chain)
+    @classmethod
+    def union(cls, *filterchains):
+        """Combine `filterchains` with OR
 
-            # Make string from new_fc
-            OR_chains = []
-            for AND_chain in new_fc:
-                OR_chains.append('&'.join(str(f) for f in AND_chain))
-            new_fc_str = '|'.join(OR_chains)
+        Equal AND chains are only used once and AND chains that are narrowed by
+        another AND chain are removed (e.g. 'downloading|downloading&private'
+        is the same as 'downloading').
+        """
+        combined = []
+        for filterchain in filterchains:
+            if not filterchain._filterchains:
+                # Any filter combined with 'all' is 'all'
+                return cls()
+            for AND_chain in filterchain._filterchains:
+                if any(_and_chain_narrows(AND_chain, c) for c in combined):
+                    continue
+                combined = [c for c in combined if not _and_chain_narrows(c, AND_chain)]
+                combined.append(AND_chain)
+
+        new = cls()
+        new._filterchains = tuple(combined)
+        return new
+
+
+def _and_chain_narrows(AND_chain, other_AND_chain):
+    # Each filter in `other_AND_chain` must be narrowed by any filter in
+    # `AND_chain` (e.g. 'foo&bar' narrows 'foo').
+    return all(any(f.narrows(other_f) for f in AND_chain)
+               for other_f in other_AND_chain)
+
+
+class IncrementalFilter():
+    """Apply different filter chains to the same objects repeatedly
+
+    Results are remembered for the most recently used `maxsize` filter
+    chains.  If a new filter chain narrows a remembered one (e.g. 'name~foob'
+    after 'name~foo'), only the smallest remembered result is filtered instead
+    of all objects.
+
+    objects: Sequence of objects to filter
+    maxsize: Maximum number of remembered results
+    """
+
+    def __init__(self, objects=(), maxsize=32):
+        self._objects = tuple(objects)
+        self._maxsize = maxsize
+        self._results = OrderedDict()
+
+    def apply(self, filterchain):
+        """Return tuple of objects that match `filterchain`"""
+        results = self._results
+        if filterchain in results:
+            results.move_to_end(filterchain)
+            return results[filterchain]
+
+        candidates = self._objects
+        for prev_filterchain,prev_result in results.items():
+            if len(prev_result) < len(candidates) and filterchain.narrows(prev_filterchain):
+                candidates = prev_result
+
+        result = results[filterchain] = tuple(filterchain.apply(candidates))
+        while len(results) > self._maxsize:
+            results.popitem(last=False)
+        return result
 
-            return cls(new_fc_str)
+    @property
+    def objects(self):
+        """All objects that are filtered"""
+        return self._objects
+
+    @objects.setter
+    def objects(self, objects):
+        self._objects = tuple(objects)
+        self._results.clear()
@@ -27,6 +27,28 @@ def _desc(text):
     return text
 
 
+class _DomainFilterSpec(CmpFilterSpec):
+    """Match any of the domains returned by `func`
+
+    Many torrents share the same few tracker domains, so the result of each
+    comparison is remembered per domain for the lifetime of the filter.
+    """
+
+    def make_filter_func(self, operator, value):
+        get_domains = self.filter_function
+        matches = {}
+        def func(obj):
+            for domain in get_domains(obj):
+                try:
+                    match = matches[domain]
+                except KeyError:
+                    match = matches[domain] = operator(domain, value)
+                if match:
+                    return True
+            return False
+        return func
+
+
 from ..ttypes import Status
 _STATUS_VERIFY    = Status.VERIFY
 _STATUS_DOWNLOAD  = Status.DOWNLOAD
@@ -135,12 +157,11 @@ class SingleTorrentFilter(Filter):
         'size':        _make_cmp_filter('size-final', _desc('... combined size of all wanted files')),
         'uploaded':    _make_cmp_filter('size-uploaded', _desc('... number of uploaded bytes'), aliases=('up',)),
 
-        'tracker': CmpFilterSpec(
-            lambda t, op, v: any(op(tracker['url-announce'].domain, v)
-                                 for tracker in t['trackers']),
+        'tracker': _DomainFilterSpec(
+            lambda t: t['tracker-domains'],
             aliases=('trk',),
             description=_desc('... domain of the announce URL of trackers'),
-            needed_keys=('trackers',),
+            needed_keys=('tracker-domains',),
             value_type=str,
         ),
 
@@ -225,6 +225,11 @@ class RequestPoller():
                   self._debug_info['error_cbs'][-1], self._debug_info['request'])
         self._on_error.connect(callback, weak=autoremove)
 
+    def remove_callback(self, callback):
+        """Stop sending responses and errors to `callback`"""
+        self._on_response.disconnect(callback)
+        self._on_error.disconnect(callback)
+
     @property
     def has_callbacks(self):
         """Whether anyone is interested in response to callback"""
@@ -12,8 +12,6 @@
 from ...logging import make_logger
 log = make_logger(__name__)
 
-from functools import partial
-
 
 class SortSpecBase():
     def __init__(self, *keyfuncs, description, aliases=()):
@@ -21,22 +19,52 @@ class SortSpecBase():
         self.description = description
         self.aliases = aliases
 
+    @property
+    def keyfuncs(self):
+        """Key functions from most to least significant"""
+        return tuple(reversed(self._keyfuncs))
+
     def __call__(self, items, reverse=False, inplace=False, item_getter=lambda item: item):
         if not items:
             return items
 
-        for keyfunc in self._keyfuncs:
-            def key_getter(item):
-                return keyfunc(item_getter(item))
-
-            if inplace:
-                items[:] = sorted(items, key=key_getter, reverse=reverse)
-            else:
-                items = sorted(items, key=key_getter, reverse=reverse)
+        keyfuncs = self.keyfuncs
+        def key_getter(item):
+            obj = item_getter(item)
+            return tuple(keyfunc(obj) for keyfunc in keyfuncs)
 
+        if inplace:
+            items[:] = sorted(items, key=key_getter, reverse=reverse)
+        else:
+            items = sorted(items, key=key_getter, reverse=reverse)
         return items
 
 
+class _Reversed():
+    """Wrapper that inverts comparisons of sort keys"""
+
+    __slots__ = ('value',)
+
+    def __init__(self, value):
+        self.value = value
+
+    def __lt__(self, other):
+        return other.value < self.value
+
+    def __eq__(self, other):
+        return self.value == other.value
+
+
+_NUMBER_LT = (int.__lt__, float.__lt__)
+
+def _reversed_keys(keys):
+    # Negating plain numbers is much cheaper than wrapping them
+    if all(type(key).__lt__ in _NUMBER_LT for key in keys):
+        return [-key for key in keys]
+    else:
+        return [_Reversed(key) for key in keys]
+
+
 class SorterBase():
     INVERT_CHARS = ('!', '.')
     SORTSPECS = NotImplemented
@@ -53,7 +81,7 @@ class SorterBase():
 
     def __init__(self, sortstrings=()):
         sortspecs = []
-        sortfuncs = []
+        reverses = []
         strings = []   # String representations of sortspecs
 
         # Go through items in reverse because to want to deduplicate sort orders
@@ -73,9 +101,8 @@ class SorterBase():
             else:
                 sortspec = self.SORTSPECS[sortspecname]
                 if sortspec not in sortspecs:
-                    sortfunc = partial(sortspec, reverse=reverse)
                     sortspecs.insert(0, sortspec)
-                    sortfuncs.insert(0, sortfunc)
+                    reverses.insert(0, reverse)
                     strings.insert(0, (self.INVERT_CHARS[0] if reverse else '') + sortspecname)
         self._strings = tuple(strings)
 
@@ -83,11 +110,24 @@ class SorterBase():
         if self.DEFAULT_SORT is not None:
             default_sortspec = self.SORTSPECS[self.DEFAULT_SORT]
             if default_sortspec not in sortspecs:
-                sortfuncs.insert(0, default_sortspec)
                 sortspecs.insert(0, default_sortspec)
+                reverses.insert(0, False)
 
         self._sortspecs = sortspecs
-        self._sortfuncs = sortfuncs
+
+        # The last sort order is the most significant one.  Combine the key
+        # functions of all sort orders so we can sort only once.
+        self._keyfuncs = tuple((keyfunc, reverse)
+                               for sortspec,reverse in reversed(tuple(zip(sortspecs, reverses)))
+                               for keyfunc in sortspec.keyfuncs)
+
+    def get_key(self, obj):
+        """Return sort key for `obj`
+
+        Objects are sorted by `apply` in the same order as by their keys.
+        """
+        return tuple(_Reversed(keyfunc(obj)) if reverse else keyfunc(obj)
+                     for keyfunc,reverse in self._keyfuncs)
 
     def apply(self, items, inplace=False, item_getter=lambda item: item):
         """Sort sequence `items`
@@ -102,8 +142,24 @@ class SorterBase():
         import time
         start_time = time.monotonic()
 
-        for sorter in self._sortfuncs:
-            items = sorter(items, inplace=inplace, item_getter=item_getter)
+        # Get each sort key only once per item and sort by one tuple of keys
+        items_list = list(items)
+        objs = [item_getter(item) for item in items_list]
+        columns = []
+        for keyfunc,reverse in self._keyfuncs:
+            keys = [keyfunc(obj) for obj in objs]
+            columns.append(_reversed_keys(keys) if reverse else keys)
+        if columns:
+            compound_keys = list(zip(*columns))
+            order = sorted(range(len(items_list)), key=compound_keys.__getitem__)
+            sorted_items = [items_list[i] for i in order]
+        else:
+            sorted_items = items_list
+
+        if inplace:
+            items[:] = sorted_items
+        else:
+            items = sorted_items
 
         log.debug('-> Sorted %d items by %s in %.3fms',
                   len(items), self, (time.monotonic()-start_time)*1e3)
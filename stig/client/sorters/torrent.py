@@ -88,9 +88,9 @@ class TorrentSorter(SorterBase):
                                        aliases=('%',),
                                        needed_keys=('%downloaded', '%metadata', '%verified'),
                                        description='downloading or verifying progress'),
-        'tracker':           _SortSpec(lambda t: t['trackers'][0]['url-announce'].domain if t['trackers'] else '',
+        'tracker':           _SortSpec(lambda t: t['tracker-domains'][0] if t['tracker-domains'] else '',
                                        aliases=('trk',),
-                                       needed_keys=('trackers',),
+                                       needed_keys=('tracker-domains',),
                                        description='domain of first tracker'),
         'eta':               _SortSpec(lambda t: t['timespan-eta'],
                                        needed_keys=('timespan-eta',),
@@ -17,6 +17,7 @@ import operator
 from functools import reduce
 
 from .poll import RequestPoller
+from .utils import Response
 
 
 class TorrentRequestPool(RequestPoller):
@@ -30,10 +31,13 @@ class TorrentRequestPool(RequestPoller):
     """
     def __init__(self, srvapi, interval=1):
         self._api = srvapi.torrent
+        self._worker = srvapi.worker
         self._tfilters = {}
         self._keys = {}
+        self._last_tlist = None
         super().__init__(request=None, interval=interval, loop=srvapi.loop)
         self.on_response(self._handle_torrent_list)
+        self._api.on_cache_update(self._handle_cache_update)
 
     def register(self, sid, callback, keys=(), tfilter=None):
         """Add new request to request pool
@@ -74,7 +78,7 @@ class TorrentRequestPool(RequestPoller):
                 # No subscribers or at least one subscriber wants all torrents
                 kwargs['torrents'] = None
             else:
-                kwargs['torrents'] = reduce(operator.__add__, all_filters)
+                kwargs['torrents'] = type(all_filters[0]).union(*all_filters)
 
             kwargs['keys'] = reduce(operator.__add__, self._keys.values())
             # Filters also need certain keys
@@ -85,11 +89,65 @@ class TorrentRequestPool(RequestPoller):
             kwargs['keys'] = tuple(set(kwargs['keys']))
             log.debug('Combined filters: %s', kwargs['torrents'])
             log.debug('Combined keys: %s', kwargs['keys'])
-            self.set_request(self._api.torrents, **kwargs)
+            self.set_request(self._request_torrents, **kwargs)
+
+    async def _request_torrents(self, **kwargs):
+        response = await self._api.torrents(**kwargs)
+        if response is not None:
+            if len(self._tfilters) == 1:
+                # The API already applied the combined filter, which is the
+                # filter of the only subscriber
+                event = next(iter(self._tfilters))
+                response.tlists = {event: response.torrents}
+            else:
+                # Split up the torrents for the subscribers before the
+                # callback runs so the worker can do it without blocking the
+                # event loop
+                tfilters = tuple(self._tfilters.items())
+                if self._worker.threaded:
+                    response.tlists = await self._worker.run_threaded(
+                        self._split_torrent_list, response.torrents, tfilters, snapshots=True)
+                else:
+                    response.tlists = await self._worker.run(
+                        self._split_torrent_list, response.torrents, tfilters)
+        return response
+
+    @staticmethod
+    def _split_torrent_list(tlist, tfilters, snapshots=False):
+        # Generator that yields after each torrent and returns a dictionary
+        # that maps subscriber events to tuples of torrents.  If `snapshots`
+        # is True, filters are applied to snapshots of the torrents so this
+        # can run in the worker thread.
+        tlists = {}
+        for event,filter in tfilters:
+            if filter is None:
+                tlists[event] = tlist
+            else:
+                this_tlist = []
+                for t in tlist:
+                    if filter.match(t.snapshot() if snapshots else t):
+                        this_tlist.append(t)
+                    yield
+                tlists[event] = tuple(this_tlist)
+        return tlists
+
+    def _handle_cache_update(self, api, removed_ids=()):
+        # Torrents were changed locally; give subscribers the torrents from the
+        # previous response again without waiting for the next one
+        if self._last_tlist is None:
+            return
+        tlist = tuple(t for t in self._last_tlist if t['id'] not in removed_ids)
+        # The combined request may have filtered out torrents for a single
+        # subscriber, but its filter may not match the changed torrents anymore
+        tlists = {event:tlist if filter is None else tuple(filter.apply(tlist))
+                  for event,filter in self._tfilters.items()}
+        self._handle_torrent_list(Response(success=True, torrents=tlist, tlists=tlists))
 
     def _handle_torrent_list(self, response):
         # If the request failed, response is None and tlist is empty.
         tlist = response.torrents if response is not None else ()
+        tlists = getattr(response, 'tlists', {})
+        self._last_tlist = tlist if response is not None else None
 
         dead_subscribers = []
         def has_subscribers(event):
@@ -101,26 +159,20 @@ class TorrentRequestPool(RequestPoller):
 
         log.debug('Processing %d torrents for %d subscribers',
                   len(tlist), len(self._tfilters))
-        if len(self._tfilters) == 1:
-            # If there's only one subscriber, there's no need to filter the
-            # torrents again.
-            event = next(iter(self._tfilters))
+        for event,filter in tuple(self._tfilters.items()):
             if has_subscribers(event):
                 log.debug('Running callback: %r', event.name)
-                event.send(tlist)
-        else:
-            # More than 1 subscriber means we have to filter the torrents
-            # again for each one.
-            for event,filter in self._tfilters.items():
-                if has_subscribers(event):
-                    log.debug('Running callback: %r', event.name)
-                    if filter is None:
-                        # Subscriber wants all torrents
-                        this_tlist = tlist
-                    else:
-                        # Subscriber wants filtered torrents
-                        this_tlist = filter.apply(tlist)
-                    event.send(this_tlist)
+                if event in tlists:
+                    # Torrents were already split up by _request_torrents()
+                    this_tlist = tlists[event]
+                elif filter is None:
+                    # Subscriber wants all torrents
+                    this_tlist = tlist
+                else:
+                    # Torrents weren't split up, e.g. because the subscriber
+                    # registered after the request was made
+                    this_tlist = tuple(filter.apply(tlist))
+                event.send(this_tlist)
 
         # Remove dead subscribers
         for eventname in dead_subscribers:
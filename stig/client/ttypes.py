@@ -447,15 +447,22 @@ class TorrentFile(abc.Mapping):
                 self._cache[key] = val
         return self._cache[key]
 
+    # Cached values that must be converted again when a raw value changes
+    _DEPENDENCIES = {
+        'size-total'      : ('size-total', 'progress'),
+        'size-downloaded' : ('size-downloaded', 'progress'),
+        'is-wanted'       : ('is-wanted', 'priority'),
+    }
+
     def update(self, raw):
-        self._raw.update(raw)
-        try:
-            for k in raw:
-                del self._cache[k]
-            if 'size-downloaded' in raw:
-                del self._cache['progress']
-        except KeyError:
-            pass
+        # Keep converted values of unchanged raw values so that polling
+        # unchanged files is cheap
+        cache = self._cache
+        for k,v in raw.items():
+            if self._raw.get(k) != v:
+                self._raw[k] = v
+                for key in self._DEPENDENCIES.get(k, (k,)):
+                    cache.pop(key, None)
 
     def __repr__(self): return '<{} {!r}>'.format(type(self).__name__, self['name'])
     def __iter__(self): return iter(self.TYPES)
@@ -690,6 +697,7 @@ TYPES = {
 
     'error'                        : str,
     'trackers'                     : tuple,
+    'tracker-domains'              : tuple,
     'peers'                        : tuple,
     'files'                        : _ensure_TorrentFileTree,
 }
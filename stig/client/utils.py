@@ -105,6 +105,108 @@ class SleepUneasy():
         self._interrupt.set()
 
 
+import inspect
+import time
+import concurrent.futures
+import functools
+class Worker():
+    """Run CPU-bound functions without blocking the event loop
+
+    Functions can be generator functions that yield after each small piece of
+    work.  Their return value is the value of the generator's `return`
+    statement.
+
+    `run` always calls functions in the event loop's thread because the
+    objects they work on (e.g. cached Torrents) are shared with the user
+    interface.  Control is given back to the event loop each time a generator
+    yields after working for `timeslice` seconds.
+
+    `run_threaded` calls functions in a separate thread if `threaded` is True
+    so the event loop can process other events (e.g. user input) in the
+    meantime.  These functions must only work on objects that no other code
+    uses, e.g. Torrent snapshots (see Torrent.snapshot).
+
+    Calls are serialized, i.e. only one function runs at any time, so
+    functions that are called via the same Worker don't need to worry about
+    each other.
+    """
+
+    def __init__(self, loop, threaded=False, timeslice=0.005):
+        self.loop = loop
+        self.timeslice = timeslice
+        self._lock = asyncio.Lock(loop=loop)
+        self._executor = None
+        self.threaded = threaded
+
+    @property
+    def threaded(self):
+        """Whether `run_threaded` calls functions in a separate thread"""
+        return self._executor is not None
+
+    @threaded.setter
+    def threaded(self, threaded):
+        if threaded and self._executor is None:
+            self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+        elif not threaded and self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    async def run(self, func, *args, **kwargs):
+        """Return `func(*args, **kwargs)`"""
+        async with self._lock:
+            return await self._run_here(func, *args, **kwargs)
+
+    async def run_threaded(self, func, *args, **kwargs):
+        """
+        Return `func(*args, **kwargs)`
+
+        `func` is called in a separate thread if `threaded` is True, otherwise
+        this is the same as `run`.
+        """
+        async with self._lock:
+            executor = self._executor
+            if executor is None:
+                return await self._run_here(func, *args, **kwargs)
+            else:
+                return await self.loop.run_in_executor(
+                    executor, functools.partial(_call, func, *args, **kwargs))
+
+    async def _run_here(self, func, *args, **kwargs):
+        result = func(*args, **kwargs)
+        if inspect.isgenerator(result):
+            result = await self._cooperate(result)
+        return result
+
+    async def _cooperate(self, gen):
+        timeslice = self.timeslice
+        start = time.monotonic()
+        try:
+            while True:
+                next(gen)
+                if time.monotonic() - start >= timeslice:
+                    await asyncio.sleep(0, loop=self.loop)
+                    start = time.monotonic()
+        except StopIteration as e:
+            return e.value
+
+
+def _call(func, *args, **kwargs):
+    # Call `func` and exhaust the generator it may return
+    result = func(*args, **kwargs)
+    if inspect.isgenerator(result):
+        result = run_generator(result)
+    return result
+
+
+def run_generator(gen):
+    """Exhaust generator `gen` and return its return value"""
+    try:
+        while True:
+            next(gen)
+    except StopIteration as e:
+        return e.value
+
+
 from types import SimpleNamespace
 class Response(SimpleNamespace):
     """Response to an API call
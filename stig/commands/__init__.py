@@ -85,6 +85,7 @@ log = make_logger(__name__)
 import asyncio
 import argparse
 import shlex
+import functools
 from inspect import getmembers
 from importlib import import_module
 from collections import abc
@@ -214,18 +215,14 @@ class _CommandBase():
         self._exc_fetched = False
 
         try:
-            args_parsed = self._argparser.parse_args(args)
+            kwargs = _parse_cmdargs(type(self), tuple(args))
         except CmdArgError as e:
             self._finish(success=False,
                          exception=CmdArgError('{}: {}'.format(self.name, e)))
         else:
-            # Create keyword args for run() method
-            kwargs = {}
-            for argspec in self.argspecs:
-                # First name is the kwarg for run()
-                key = argspec['names'][0].lstrip('-').replace('-', '_')
-                value = getattr(args_parsed, key)
-                kwargs[key.replace(' ', '_')] = value
+            # Cached arguments must not be changed by run()
+            kwargs = {k:(list(v) if isinstance(v, list) else v)
+                      for k,v in kwargs.items()}
             self._args = kwargs
 
             if asyncio.iscoroutinefunction(self.run):
@@ -351,6 +348,54 @@ class _CommandBase():
         return string + '>'
 
 
+@functools.lru_cache(maxsize=256)
+def _parse_cmdargs(cmdcls, args):
+    # Return keyword arguments for cmdcls.run() from tuple of strings `args`
+    args_parsed = cmdcls._argparser.parse_args(args)
+    kwargs = {}
+    for argspec in cmdcls.argspecs:
+        # First name is the kwarg for run()
+        key = argspec['names'][0].lstrip('-').replace('-', '_')
+        value = getattr(args_parsed, key)
+        kwargs[key.replace(' ', '_')] = value
+    return kwargs
+
+
+@functools.lru_cache(maxsize=256)
+def _split_cmdstring(commands):
+    # Return tuple of command tuples and operators from command string
+    try:
+        args = shlex.split(commands)
+    except ValueError as e:
+        raise CmdError(str(e))
+
+    cmdchain = []
+    cmd = []
+    for arg in args:
+        if arg in OPS_SEQ:
+            if cmd:
+                cmdchain.append(tuple(cmd))
+            cmdchain.append(OPS_SEQ[0])
+            cmd = []
+        elif arg in OPS_OR:
+            if cmd:
+                cmdchain.append(tuple(cmd))
+            cmdchain.append(OPS_OR[0])
+            cmd = []
+        elif arg in OPS_AND:
+            if cmd:
+                cmdchain.append(tuple(cmd))
+            cmdchain.append(OPS_AND[0])
+            cmd = []
+        else:
+            cmd.append(arg)
+    if cmd:
+        cmdchain.append(tuple(cmd))
+    while cmdchain and is_op(cmdchain[-1]):
+        cmdchain.pop(-1)
+    return tuple(cmdchain)
+
+
 def _dummy_process(**kwargs):
     # We can't create a _CommandBase instance for non-existing commands, and
     # raising/returning an exception instead of a _CommandBase instance
@@ -374,6 +419,7 @@ class CommandManager():
         self.pre_run_hook = pre_run_hook
         self._cmds = {}
         self._active_interface = None
+        self._cmdcls_cache = {}
         self._resources = CallbackDict(callback=self._update_resources)
         self._resources.update(cmdmgr=self)
 
@@ -411,6 +457,7 @@ class CommandManager():
             log.debug('Registered %s command %s (%s)',
                       interface, cmdcls.name, type(cmdcls).__name__)
             self._cmds[interface][cmdcls.name] = cmdcls
+        self._cmdcls_cache.clear()
 
     @property
     def resources(self):
@@ -433,6 +480,7 @@ class CommandManager():
     def active_interface(self, interface):
         if interface in self._cmds:
             self._active_interface = interface
+            self._cmdcls_cache.clear()
         else:
             raise ValueError('No commands for interface {!r} registered'.format(interface))
 
@@ -469,6 +517,16 @@ class CommandManager():
 
         Returns None if not matching command class is registered.
         """
+        # Results are cached until commands are registered or the active
+        # interface changes
+        cache_key = (cmdname, interface, exclusive)
+        try:
+            return self._cmdcls_cache[cache_key]
+        except KeyError:
+            pass
+        except TypeError:
+            cache_key = None  # Unhashable arguments
+
         if interface == 'ACTIVE':
             cmdpool = self.active_commands
         elif interface == 'ANY':
@@ -481,12 +539,18 @@ class CommandManager():
         else:
             raise RuntimeError('Interface type must be hashable: {!r}'.format(interface))
 
+        cmdcls = None
         for cmd in cmdpool:
             if cmdname in cmd.names:
                 if not exclusive:
-                    return cmd
+                    cmdcls = cmd
+                    break
                 elif cmd.provides == (interface,):
-                    return cmd
+                    cmdcls = cmd
+                    break
+        if cache_key is not None:
+            self._cmdcls_cache[cache_key] = cmdcls
+        return cmdcls
 
     def __getitem__(self, cmdname):
         cmd = self.get_cmdcls(cmdname, interface='ANY')
@@ -637,7 +701,7 @@ class CommandManager():
             else:
                 exc = CmdNotFoundError('Unknown command: {}'.format(cmdname))
                 process = _dummy_process(exception=exc)
-        elif cmdcls not in self.active_commands:
+        elif self._active_interface is not None and self._active_interface not in cmdcls.provides:
             exc = CmdError('{}: No support for {} interface'
                            .format(cmdname, self._active_interface))
             process = _dummy_process(exception=exc)
@@ -664,36 +728,10 @@ class CommandManager():
         [ ['do', 'that'], '&', ['act', 'like this'] ]
         """
         if isinstance(commands, str):
-            try:
-                args = shlex.split(commands)
-            except ValueError as e:
-                raise CmdError(str(e))
-
-            cmdchain = []
-            cmd = []
-            while args:
-                arg = args.pop(0)
-                if arg in OPS_SEQ:
-                    if cmd:
-                        cmdchain.append(cmd)
-                    cmdchain.append(OPS_SEQ[0])
-                    cmd = []
-                elif arg in OPS_OR:
-                    if cmd:
-                        cmdchain.append(cmd)
-                    cmdchain.append(OPS_OR[0])
-                    cmd = []
-                elif arg in OPS_AND:
-                    if cmd:
-                        cmdchain.append(cmd)
-                    cmdchain.append(OPS_AND[0])
-                    cmd = []
-                else:
-                    cmd.append(arg)
-            if cmd:
-                cmdchain.append(cmd)
-            while cmdchain and is_op(cmdchain[-1]):
-                cmdchain.pop(-1)
+            # Split command strings are cached, but every caller gets its own
+            # lists
+            cmdchain = [item if is_op(item) else list(item)
+                        for item in _split_cmdstring(commands)]
         elif not isinstance(commands, abc.Iterable):
             raise RuntimeError('Must be string or sequence, not {!r}: {!r}'.format(
                 type(commands).__name__, commands))
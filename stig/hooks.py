@@ -89,3 +89,8 @@ def _set_geoip_dir(settings, name, value):
     import os
     geoip.filepath = os.path.join(value, os.path.basename(geoip.filepath))
 localcfg.on_change(_set_geoip_dir, name='geoip.dir')
+
+
+def _set_worker(settings, name, value):
+    srvapi.worker.threaded = bool(value)
+localcfg.on_change(_set_worker, name='worker')
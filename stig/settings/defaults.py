@@ -116,6 +116,12 @@ def init_defaults(localcfg):
                  default=DEFAULT_GEOIP_DIR,
                  description='Where to cache the downloaded geolocation database')
 
+    localcfg.add('worker',
+                 Bool.partial(),
+                 default='off',
+                 description=('Whether to merge, filter and sort torrents in a separate thread '
+                              'to keep the user interface responsive while polling many torrents'))
+
     localcfg.add('remove.max-hits',
                  Int.partial(min=0),
                  default=10,
@@ -142,11 +148,26 @@ def init_defaults(localcfg):
                  Int.partial(min=1),
                  default=10,
                  description='Maximum height of the log section')
+    localcfg.add('tui.log.max-entries',
+                 Int.partial(min=1),
+                 default=1000,
+                 description='Maximum number of messages the log section keeps')
     localcfg.add('tui.log.autohide',
                  Float.partial(min=0),
                  default=10,
                  description=('If the log is hidden, show it for this many seconds '
                               'for new log entries before hiding it again'))
+    localcfg.add('tui.tabs.hibernate',
+                 Float.partial(min=0),
+                 default=0,
+                 description=('Release the list items of tabs that have not been focused '
+                              'for this many seconds and request them again when the tab '
+                              'is focused (0 to never release them)'))
+    localcfg.add('tui.flat-rows',
+                 Bool.partial(),
+                 default='on',
+                 description=('Whether torrent, peer and tracker lists draw each row as a '
+                              'single text widget instead of one widget per column'))
     localcfg.add('tui.cli.history-file',
                  Path.partial(),
                  default=DEFAULT_HISTORY_FILE,
@@ -159,6 +180,11 @@ def init_defaults(localcfg):
                  Float.partial(min=0.1),
                  default=5,
                  description='Interval in seconds between TUI updates')
+    localcfg.add('tui.fps',
+                 Float.partial(min=1),
+                 default=10,
+                 description=('Maximum number of screen redraws per second '
+                              '(user input is always drawn immediately)'))
 
     localcfg.add('unit.bandwidth',
                  Option.partial(options=('bit', 'byte')),
@@ -17,6 +17,8 @@ from functools import partial
 from ..main import (localcfg, srvapi, aioloop)
 from . import main as tui
 
+from .views import hooks as _views_hooks
+from .views import ListWidgetBase
 from .views.torrent_list import TorrentListWidget
 from .views.file_list import FileListWidget
 from .views.peer_list import PeerListWidget
@@ -59,6 +61,11 @@ def _set_poll_interval(settings, name, value):
 localcfg.on_change(_set_poll_interval, name='tui.poll')
 
 
+def _set_fps(settings, name, value):
+    tui.urwidloop.fps = value
+localcfg.on_change(_set_fps, name='tui.fps')
+
+
 def _set_cli_history_file(settings, name, value):
     tui.cli.original_widget.history_file = value
 localcfg.on_change(_set_cli_history_file, name='tui.cli.history-file')
@@ -79,6 +86,25 @@ def _set_log_height(settings, name, value):
 localcfg.on_change(_set_log_height, name='tui.log.height')
 
 
+def _set_log_max_entries(settings, name, value):
+    tui.logwidget.max_entries = value
+localcfg.on_change(_set_log_max_entries, name='tui.log.max-entries')
+
+
+def _set_tabs_hibernate(settings, name, value):
+    tui.tabs.hibernate_after = value
+localcfg.on_change(_set_tabs_hibernate, name='tui.tabs.hibernate')
+
+
+def _set_flat_rows(settings, name, value):
+    ListWidgetBase.use_flat_rows = bool(value)
+    for widget in tui.tabs:
+        if isinstance(widget, ListWidgetBase):
+            widget.flat_rows = value
+localcfg.on_change(_set_flat_rows, name='tui.flat-rows')
+_set_flat_rows(localcfg, name='tui.flat-rows', value=localcfg['tui.flat-rows'])
+
+
 def _set_theme(settings, name, value):
     try:
         tui.load_theme(value)
@@ -44,7 +44,8 @@ class Key(str):
               'F13', 'F14', 'F15', 'F16', 'F17', 'F18', 'F19', 'F20')
     _KEYNAMES = ('escape', 'space', 'home', 'end', 'tab', 'delete', 'backspace', 'insert',
                  'enter', 'pgup', 'pgdn', 'left', 'right', 'up', 'down') + _FKEYS
-    _cache = {}
+    _cache = {}     # Map unnormalized strings to Key instances
+    _interned = {}  # Map normalized strings to Key instances
 
     def __new__(cls, key):
         if isinstance(key, Key):
@@ -99,12 +100,17 @@ class Key(str):
         if len(key) < 1:
             raise ValueError('No key specified')
 
-        obj = super().__new__(cls, keystr)
+        # Equal keys are the same object
+        obj = cls._interned.get(keystr)
+        if obj is None:
+            obj = cls._interned[keystr] = super().__new__(cls, keystr)
         cls._cache[orig_key] = obj
         return obj
 
     def __eq__(self, other):
-        if not isinstance(other, Key):
+        if self is other:
+            return True
+        elif not isinstance(other, Key):
             try:
                 other = Key(other)
             except (ValueError, TypeError):
@@ -193,7 +199,7 @@ class Keymapped():
 
         # Offer our own key format to original keypress() in case there are any
         # Key instances in urwid.command_map
-        if str(key_orig) != str(key_eval):
+        if key_orig != str.__str__(key_eval):
             key_ = try_parent_class(key_eval)
             if key_ is None:
                 return None
@@ -219,6 +225,43 @@ class Keymapped():
         return True
 
 
+class _KeyChainTree():
+    """Key chains of one context as a tree of keys"""
+
+    __slots__ = ('children', 'keychain', 'action')
+
+    def __init__(self):
+        self.children = {}    # Map Key instances to _KeyChainTree instances
+        self.keychain = None  # KeyChain that ends here or None
+        self.action = None
+
+    def add(self, keychain, action):
+        node = self
+        for key in keychain:
+            child = node.children.get(key)
+            if child is None:
+                child = node.children[key] = _KeyChainTree()
+            node = child
+        node.keychain = keychain
+        node.action = action
+
+    def find(self, keys):
+        """Return node that is reached via `keys` or None"""
+        node = self
+        for key in keys:
+            node = node.children.get(key)
+            if node is None:
+                return None
+        return node
+
+    def keychains(self):
+        """Yield (keychain, action) tuples of this node and all its descendants"""
+        if self.keychain is not None:
+            yield (self.keychain, self.action)
+        for child in self.children.values():
+            yield from child.keychains()
+
+
 NO_CONTEXT      = object()
 ALL_CONTEXTS    = object()
 DEFAULT_CONTEXT = 'default'
@@ -245,6 +288,8 @@ class KeyMap():
     def __init__(self, callback=None):
         self._default_callback = callback
         self._actions = {DEFAULT_CONTEXT: {}}
+        # Map contexts to (single key actions, _KeyChainTree) tuples
+        self._compiled = {}
 
         self._bindunbind_callbacks = blinker.Signal()
         self._keychain_callbacks = blinker.Signal()
@@ -257,6 +302,7 @@ class KeyMap():
         for context in contexts:
             log.debug('%s: Removing all keybindings', context)
             contexts[context] = {}
+        self._compiled.clear()
         self._bindunbind_callbacks.send(self)
 
     def _unbind_from_urwid_command_map(self, key):
@@ -290,6 +336,7 @@ class KeyMap():
             self._actions[context] = {}
         self._actions[context][key] = action
         log.debug('%s: Mapped %r -> %r', context, key, action)
+        self._compiled.clear()
         self._bindunbind_callbacks.send(self)
 
     def unbind(self, key, context=DEFAULT_CONTEXT):
@@ -316,6 +363,7 @@ class KeyMap():
                     key_removed = True
             if not key_removed:
                 raise ValueError('Key not mapped in context %r: %s' % (context, key))
+        self._compiled.clear()
         self._bindunbind_callbacks.send(self)
 
     def evaluate(self, key, context=DEFAULT_CONTEXT, callback=None, widget=None):
@@ -395,33 +443,51 @@ class KeyMap():
         else:
             raise RuntimeError('No callback given - unable to handle {!r}'.format(action))
 
-    def _get_single_key_action(self, key, context=DEFAULT_CONTEXT):
-        actions = self._actions[context]
-        if key in actions:
-            return actions[key]
+    def _compile(self, context):
+        # Return single key actions and key chains of `context`; single keys
+        # from the default context are included so that only one lookup is
+        # needed per key
+        try:
+            return self._compiled[context]
+        except KeyError:
+            pass
+
+        single_keys = {}
+        keychains = _KeyChainTree()
+        if context != DEFAULT_CONTEXT:
+            for key,action in self._actions[DEFAULT_CONTEXT].items():
+                if not isinstance(key, KeyChain):
+                    single_keys[key] = action
+        for key,action in self._actions[context].items():
+            if isinstance(key, KeyChain):
+                keychains.add(key, action)
+            else:
+                single_keys[key] = action
+
+        compiled = self._compiled[context] = (single_keys, keychains)
+        return compiled
 
-        if context is not DEFAULT_CONTEXT:
-            actions = self._actions[DEFAULT_CONTEXT]
-            if key in actions:
-                return actions[key]
+    def _get_single_key_action(self, key, context=DEFAULT_CONTEXT):
+        return self._compile(context)[0].get(key)
 
     def _get_keychain_action(self, key, context):
         partial = self._keychain_partial
-        candidate = tuple(partial) + (key,)
         log.debug('%s: Getting keychain action for %s + %s:',
                   context, '+'.join(partial) or "<>", key)
-        action = KeyChain.ABORT if partial else KeyChain.REJECT
-        for kc,act in self._started_keychains(context):
-            if kc == candidate:
-                log.debug('%s:   Resolved keychain %r to action %r', context, kc, act)
-                return act
-            elif kc.startswith(candidate):
-                log.debug('%s:   Advancing keychain %r: %r', context, kc, '+'.join(candidate))
-                action = KeyChain.ADVANCE
+        node = self._compile(context)[1].find(partial)
+        if node is not None:
+            child = node.children.get(key)
+            if child is not None:
+                if child.keychain is not None:
+                    log.debug('%s:   Resolved keychain %r to action %r', context, child.keychain, child.action)
+                    return child.action
+                else:
+                    log.debug('%s:   Advancing keychain: %r', context, '+'.join(partial + [key]))
+                    return KeyChain.ADVANCE
             elif key == 'backspace' and len(partial) > 0:
-                log.debug('%s:   Reducing keychain %r: %r', context, kc, candidate[:-2])
-                action = KeyChain.REDUCE
-        return action
+                log.debug('%s:   Reducing keychain: %r', context, '+'.join(partial[:-1]))
+                return KeyChain.REDUCE
+        return KeyChain.ABORT if partial else KeyChain.REJECT
 
     def _keychains(self, context=ALL_CONTEXTS):
         def keychains_from(cntxt):
@@ -437,9 +503,14 @@ class KeyMap():
 
     def _started_keychains(self, context=ALL_CONTEXTS):
         keychain_partial = self._keychain_partial
-        for kc,action in self._keychains(context):
-            if kc.startswith(keychain_partial):
-                yield (kc, action)
+        if context is ALL_CONTEXTS:
+            for kc,action in self._keychains(context):
+                if kc.startswith(keychain_partial):
+                    yield (kc, action)
+        else:
+            node = self._compile(context)[1].find(keychain_partial)
+            if node is not None:
+                yield from node.keychains()
 
     def _reset_keychains(self, context=ALL_CONTEXTS):
         log.debug('%s: Resetting keychains', context)
@@ -32,10 +32,15 @@ class UILogRecordHandler(logging.Handler):
 
 
 class LogWidget(urwid.WidgetWrap):
-    """Present LogRecords from logging module in a ListBox Widget"""
+    """Present LogRecords from logging module in a ListBox Widget
 
-    def __init__(self, height=10, autohide_delay=0, loop=None):
+    At most `max_entries` messages are kept.  When there are more, the oldest
+    messages are removed in batches of 10% of `max_entries`.
+    """
+
+    def __init__(self, height=10, max_entries=1000, autohide_delay=0, loop=None):
         self._height = height
+        self._max_entries = max_entries
         self._autohide_delay = autohide_delay
         self._autohide_handle = None
         self._loop = loop if loop is not None else asyncio.get_event_loop()
@@ -98,22 +103,30 @@ class LogWidget(urwid.WidgetWrap):
         msg += record.getMessage()
 
         # Indicate identical messages instead of spamming the log
-        entries = tuple(widget for widget,options in self._pile.contents)
-        if len(entries) > 0 and entries[-1].text == msg:
-            entries[-1].dupes += 1
+        contents = self._pile.contents
+        if len(contents) > 0 and contents[-1][0].text == msg:
+            contents[-1][0].dupes += 1
         else:
             # Keep scrolling down if we are currently at the bottom; otherwise
             # the user has scrolled up manually.
             curpos = self._scrollable.get_scrollpos()
             maxpos = self._scrollable.rows_max()
             scroll_to_bottom = curpos+self._height >= maxpos
-            new_content = (LogEntry(msg, style), self._pile_options)
-            self._pile.contents.append(new_content)
+            contents.append((LogEntry(msg, style), self._pile_options))
+            self._remove_old_entries()
             if scroll_to_bottom:
                 self.scroll_to('bottom')
         self._invalidate_rows()
         self._maybe_show_temporarily()
 
+    def _remove_old_entries(self):
+        # Removing from the front of the Pile's contents moves all other
+        # entries, so we make room for 10% more entries at once
+        contents = self._pile.contents
+        excess = len(contents) - self._max_entries
+        if excess > 0:
+            del contents[:excess + self._max_entries // 10]
+
     # TODO: The autohide functionality shouldn't be in this widget.
     def _maybe_show_temporarily(self):
         """Show log widget if hidden and hide it again after delay"""
@@ -180,6 +193,20 @@ class LogWidget(urwid.WidgetWrap):
     def autohide_delay(self, seconds):
         self._autohide_delay = seconds
 
+    @property
+    def max_entries(self):
+        """Maximum number of log messages; older messages are removed"""
+        return self._max_entries
+
+    @max_entries.setter
+    def max_entries(self, max_entries):
+        max_entries = int(max_entries)
+        if max_entries < 1:
+            raise ValueError('max_entries must be at least 1: %r' % max_entries)
+        self._max_entries = max_entries
+        self._remove_old_entries()
+        self._invalidate_rows()
+
     @property
     def height(self):
         return self._height
@@ -194,30 +221,79 @@ class LogWidget(urwid.WidgetWrap):
         return False
 
 
-class LogEntry(urwid.WidgetWrap):
+class LogEntry(urwid.Widget):
+    """Single log message
+
+    The widgets that display timestamp and dupe count are only created when the
+    entry is rendered.  Entries that are never visible only need the message
+    text to calculate their height.
+    """
+
+    _sizing = frozenset(['flow'])
+
     @staticmethod
     def _make_timestamp():
         return time.strftime('%H:%M:%S')
 
     def __init__(self, message, style):
         self._dupes = 0
-        self._widgets = {
-            'timestamp':    urwid.Text(self._make_timestamp()),
-            'dupes':        urwid.Text(''),
-            'dupes_spacer': urwid.Text(''),
-            'message':      urwid.Text(str(message)),
-        }
-        super().__init__(urwid.Columns([
-            ('pack', urwid.AttrMap(self._widgets['timestamp'],    'log.timestamp')),
-            ('pack', urwid.AttrMap(urwid.Text(' '),               'log')),
-            ('pack', urwid.AttrMap(self._widgets['dupes'],        'log.dupecount')),
-            ('pack', urwid.AttrMap(self._widgets['dupes_spacer'], 'log')),
-            urwid.AttrMap(self._widgets['message'], 'log.'+style),
-        ], dividechars=0))
+        self._style = style
+        self._timestamp = self._make_timestamp()
+        self._message = urwid.Text(str(message))
+        self._widgets = None
+        self._columns = None
+
+    def _get_columns(self):
+        if self._columns is None:
+            self._widgets = {
+                'timestamp':    urwid.Text(''),
+                'dupes':        urwid.Text(''),
+                'dupes_spacer': urwid.Text(''),
+                'message':      self._message,
+            }
+            self._columns = urwid.Columns([
+                ('pack', urwid.AttrMap(self._widgets['timestamp'],    'log.timestamp')),
+                ('pack', urwid.AttrMap(urwid.Text(' '),               'log')),
+                ('pack', urwid.AttrMap(self._widgets['dupes'],        'log.dupecount')),
+                ('pack', urwid.AttrMap(self._widgets['dupes_spacer'], 'log')),
+                urwid.AttrMap(self._message, 'log.'+self._style),
+            ], dividechars=0)
+            self._update_widgets()
+        return self._columns
+
+    def _update_widgets(self):
+        self._widgets['timestamp'].set_text(self._timestamp)
+        if self._dupes > 0:
+            self._widgets['dupes'].set_text(self._dupes_text)
+            self._widgets['dupes_spacer'].set_text(' ')
+        else:
+            self._widgets['dupes'].set_text('')
+            self._widgets['dupes_spacer'].set_text('')
+
+    @property
+    def _dupes_text(self):
+        return 'x' + str(self._dupes+1)
+
+    def rows(self, size, focus=False):
+        if self._columns is not None:
+            return self._columns.rows(size, focus)
+
+        # Width of timestamp, space and dupe count in front of the message
+        prefix_width = len(self._timestamp) + 1
+        if self._dupes > 0:
+            prefix_width += len(self._dupes_text) + 1
+        msg_width = size[0] - prefix_width
+        if msg_width > 0:
+            return self._message.rows((msg_width,), focus)
+        else:
+            return self._get_columns().rows(size, focus)
+
+    def render(self, size, focus=False):
+        return self._get_columns().render(size, focus)
 
     @property
     def text(self):
-        return self._widgets['message'].text
+        return self._message.text
 
     @property
     def dupes(self):
@@ -226,13 +302,10 @@ class LogEntry(urwid.WidgetWrap):
     @dupes.setter
     def dupes(self, dupes):
         self._dupes = dupes
-        self._widgets['timestamp'].set_text(self._make_timestamp())
-        if dupes > 0:
-            self._widgets['dupes'].set_text('x' + str(dupes+1))
-            self._widgets['dupes_spacer'].set_text(' ')
-        else:
-            self._widgets['dupes'].set_text('')
-            self._widgets['dupes_spacer'].set_text('')
+        self._timestamp = self._make_timestamp()
+        if self._columns is not None:
+            self._update_widgets()
+        self._invalidate()
 
     def __repr__(self):
-        return '<{} {!r}>'.format(type(self).__name__, self._widgets['message'].text)
+        return '<{} {!r}>'.format(type(self).__name__, self._message.text)
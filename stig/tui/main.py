@@ -64,18 +64,51 @@ def load_theme(themeobj):
     theme.load(themeobj, urwidscreen)
 
 
+# Command lines starting with this string set a live filter in the focused
+# list instead of running a command
+LIVEFILTER_PREFIX = '/'
+
 def _create_cli_widget():
+    livefilter_handle = None
+
+    def set_livefilter(filter_str):
+        nonlocal livefilter_handle
+        livefilter_handle = None
+        tab = tabs.focus
+        if hasattr(tab, 'livefilter'):
+            try:
+                tab.livefilter = filter_str or None
+            except ValueError:
+                pass  # Incomplete filter expression while typing
+
+    def schedule_livefilter(filter_str):
+        # Don't filter while handling the keypress; if more keys are pending,
+        # only the most recent filter is applied.
+        nonlocal livefilter_handle
+        if livefilter_handle is not None:
+            livefilter_handle.cancel()
+        livefilter_handle = aioloop.call_soon(set_livefilter, filter_str)
+
+    def on_change(widget):
+        cmd = widget.get_edit_text()
+        if cmd.startswith(LIVEFILTER_PREFIX):
+            schedule_livefilter(cmd[len(LIVEFILTER_PREFIX):])
+
     def on_cancel(widget):
+        if widget.get_edit_text().startswith(LIVEFILTER_PREFIX):
+            schedule_livefilter(None)
         widget.set_edit_text('')
         widgets.hide('cli')
 
     def on_accept(widget):
         cmd = widget.get_edit_text()
-        on_cancel(widget)
-        cmdmgr.run_task(cmd, on_error=log.error)
+        widget.set_edit_text('')
+        widgets.hide('cli')
+        if not cmd.startswith(LIVEFILTER_PREFIX):
+            cmdmgr.run_task(cmd, on_error=log.error)
 
     return CLIEditWidget(':',
-                         on_accept=on_accept, on_cancel=on_cancel,
+                         on_change=on_change, on_accept=on_accept, on_cancel=on_cancel,
                          history_file=localcfg['tui.cli.history-file'])
 
 
@@ -89,7 +122,9 @@ topbar.add(name='spacer', widget=urwid.AttrMap(_greedy_spacer(), 'topbar'))
 topbar.add(name='help',   widget=QuickHelpWidget(), options='pack')
 
 tabs = keymap.wrap(Tabs, context='tabs')(
-    tabbar=urwid.AttrMap(TabBar(), 'tabs.unfocused')
+    tabbar=urwid.AttrMap(TabBar(), 'tabs.unfocused'),
+    hibernate_after=localcfg['tui.tabs.hibernate'],
+    loop=aioloop,
 )
 
 bottombar = Group(cls=urwid.Columns)
@@ -100,6 +135,7 @@ bottombar.add(name='bandwidth', widget=BandwidthStatusWidget(), options='pack')
 cli = urwid.AttrMap(_create_cli_widget(), 'cli')
 
 logwidget = LogWidget(height=int(localcfg['tui.log.height']),
+                      max_entries=int(localcfg['tui.log.max-entries']),
                       autohide_delay=localcfg['tui.log.autohide'])
 
 keychains = KeyChainsWidget()
@@ -119,12 +155,14 @@ def unhandled_input(key):
     if key is not None:
         log.debug('Unhandled key: %s', key)
 
+from .mainloop import MainLoop
 urwidscreen = urwid.raw_display.Screen()
-urwidloop = urwid.MainLoop(widgets,
-                           screen=urwidscreen,
-                           event_loop=urwid.AsyncioEventLoop(loop=aioloop),
-                           unhandled_input=unhandled_input,
-                           handle_mouse=False)
+urwidloop = MainLoop(widgets,
+                     screen=urwidscreen,
+                     event_loop=urwid.AsyncioEventLoop(loop=aioloop),
+                     unhandled_input=unhandled_input,
+                     handle_mouse=False,
+                     fps=localcfg['tui.fps'])
 
 
 def run(command_runner):
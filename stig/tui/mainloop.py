@@ -0,0 +1,84 @@
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details
+# http://www.gnu.org/licenses/gpl-3.0.txt
+
+from ..logging import make_logger
+log = make_logger(__name__)
+
+import urwid
+import time
+
+
+class MainLoop(urwid.MainLoop):
+    """MainLoop that limits the number of screen redraws
+
+    The screen is only redrawn if any widget was invalidated since the last
+    redraw.  All invalidations that happen between two idle callbacks (see
+    `urwid.AsyncioEventLoop._idle_emulation_delay`) result in one redraw, and
+    there are no more than `fps` redraws per second.
+
+    User input is processed and drawn immediately.
+    """
+
+    def __init__(self, *args, fps=10, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.fps = fps
+        self._last_draw = 0
+        self._draw_handle = None
+
+    @property
+    def fps(self):
+        """Maximum number of redraws per second that are not caused by user input"""
+        return self._fps
+
+    @fps.setter
+    def fps(self, fps):
+        fps = float(fps)
+        if fps <= 0:
+            raise ValueError('fps must be larger than 0: %r' % fps)
+        self._fps = fps
+        self._min_interval = 1 / fps
+
+    def entering_idle(self):
+        if self._draw_handle is None and self.screen.started and self._needs_redraw():
+            delay = self._last_draw + self._min_interval - time.monotonic()
+            if delay <= 0:
+                self.draw_screen()
+            else:
+                self._draw_handle = self.event_loop.alarm(delay, self._draw_delayed)
+
+    def _needs_redraw(self):
+        if not self.screen_size:
+            return True
+        # Any widget's invalidation also removes the cached canvases of all
+        # its parents, including the topmost widget.  Canvases are cached per
+        # class that implements render().
+        widget = self._topmost_widget
+        wcls = next(cls for cls in type(widget).__mro__ if 'render' in cls.__dict__)
+        focus = not getattr(wcls, 'ignore_focus', False)
+        canvas = urwid.CanvasCache.fetch(widget, wcls, self.screen_size, focus)
+        return canvas is None
+
+    def _draw_delayed(self):
+        self._draw_handle = None
+        if self.screen.started:
+            self.draw_screen()
+
+    def _update(self, keys, raw):
+        super()._update(keys, raw)
+        if keys and self.screen.started:
+            if self._draw_handle is not None:
+                self.event_loop.remove_alarm(self._draw_handle)
+                self._draw_handle = None
+            self.draw_screen()
+
+    def draw_screen(self):
+        self._last_draw = time.monotonic()
+        super().draw_screen()
@@ -10,7 +10,7 @@
 # http://www.gnu.org/licenses/gpl-3.0.txt
 
 import urwid
-from urwid.widget import (BOX, FLOW, FIXED)
+from urwid.widget import (BOX, FLOW, FIXED, GIVEN)
 
 # Scroll actions
 SCROLL_LINE_UP        = 'line up'
@@ -51,12 +51,20 @@ class Scrollable(urwid.WidgetDecoration):
         self._rows_max_cached = 0
         self.__super.__init__(widget)
 
+    # Number of rows to render above and below the visible part of partially
+    # rendered widgets
+    render_margin = 5
+
     def render(self, size, focus=False):
         maxcol, maxrow = size
-
-        # Render complete original widget
         ow = self._original_widget
         ow_size = self._get_original_widget_size(size)
+
+        item_rows = self._get_item_rows(ow_size, focus)
+        if item_rows is not None and sum(item_rows) > maxrow:
+            return self._render_visible_items(size, item_rows, focus)
+
+        # Render complete original widget
         canv = urwid.CompositeCanvas(ow.render(ow_size, focus))
         canv_cols, canv_rows = canv.cols(), canv.rows()
 
@@ -76,7 +84,7 @@ class Scrollable(urwid.WidgetDecoration):
             # Canvas is small enough to fit without trimming
             return canv
 
-        self._adjust_trim_top(canv, size)
+        self._adjust_trim_top(canv_rows, canv.cursor, size)
 
         # Trim canvas if necessary
         trim_top = self._trim_top
@@ -100,6 +108,54 @@ class Scrollable(urwid.WidgetDecoration):
 
         return canv
 
+    def _get_item_rows(self, ow_size, focus):
+        """Return rows of each item of the original widget or None
+
+        None is returned if the original widget can't be rendered partially.
+        """
+        ow = self._original_widget
+        if isinstance(ow, urwid.Pile) and len(ow_size) == 1 and not ow.selectable():
+            return ow.get_item_rows(ow_size, focus)
+
+    def _render_visible_items(self, size, item_rows, focus):
+        """Render only the visible items of the original Pile
+
+        This must produce the same canvas as rendering the complete Pile and
+        trimming it.
+        """
+        maxcol, maxrow = size
+        self._adjust_trim_top(sum(item_rows), None, size)
+        trim_top = self._trim_top
+        first_row = max(0, trim_top - self.render_margin)
+        last_row = trim_top + maxrow + self.render_margin
+
+        ow = self._original_widget
+        combinelist = []
+        canv_top = None  # Row of the original widget where the first rendered item starts
+        row = 0
+        for i,((w, (f, height)), rows) in enumerate(zip(ow.contents, item_rows)):
+            if row >= last_row:
+                break
+            if row + rows > first_row:
+                if canv_top is None:
+                    canv_top = row
+                item_focus = ow.focus_item == w
+                w_size = (maxcol, height) if f == GIVEN else (maxcol,)
+                combinelist.append((w.render(w_size, focus=focus and item_focus), i, item_focus))
+            row += rows
+
+        canv = urwid.CompositeCanvas(urwid.CanvasCombine(combinelist))
+        trim_top -= canv_top
+        trim_end = canv.rows() - maxrow - trim_top
+        if trim_top > 0:
+            canv.trim(trim_top)
+        if trim_end > 0:
+            canv.trim_end(trim_end)
+
+        # Unselectable widgets don't have a cursor
+        self._forward_keypress = False
+        return canv
+
     def keypress(self, size, key):
         # Maybe offer key to original widget
         if self._forward_keypress:
@@ -145,14 +201,17 @@ class Scrollable(urwid.WidgetDecoration):
         else:
             return False
 
-    def _adjust_trim_top(self, canv, size):
-        """Adjust self._trim_top according to self._scroll_action"""
+    def _adjust_trim_top(self, canv_rows, cursor, size):
+        """Adjust self._trim_top according to self._scroll_action
+
+        `canv_rows` is the number of rows of the complete original widget and
+        `cursor` is its cursor position or None.
+        """
         action = self._scroll_action
         self._scroll_action = None
 
         maxcol, maxrow = size
         trim_top = self._trim_top
-        canv_rows = canv.rows()
 
         if trim_top < 0:
             # Negative trim_top values use bottom of canvas as reference
@@ -186,13 +245,14 @@ class Scrollable(urwid.WidgetDecoration):
         # If the cursor was moved by the most recent keypress, adjust trim_top
         # so that the new cursor position is within the displayed canvas part.
         # But don't do this if the cursor is at the top/bottom edge so we can still scroll out
-        if self._old_cursor_coords is not None and self._old_cursor_coords != canv.cursor:
+        if self._old_cursor_coords is not None and self._old_cursor_coords != cursor:
             self._old_cursor_coords = None
-            curscol, cursrow = canv.cursor
-            if cursrow < self._trim_top:
-                self._trim_top = cursrow
-            elif cursrow >= self._trim_top + maxrow:
-                self._trim_top = max(0, cursrow - maxrow + 1)
+            if cursor is not None:
+                curscol, cursrow = cursor
+                if cursrow < self._trim_top:
+                    self._trim_top = cursrow
+                elif cursrow >= self._trim_top + maxrow:
+                    self._trim_top = max(0, cursrow - maxrow + 1)
 
     def _get_original_widget_size(self, size):
         ow = self._original_widget
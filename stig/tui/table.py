@@ -10,6 +10,7 @@
 # http://www.gnu.org/licenses/gpl-3.0.txt
 
 import urwid
+from urwid.util import (calc_width, calc_text_pos)
 
 from .group import Group
 
@@ -28,34 +29,60 @@ class Table():
         - 'width' is passed on to the 'options' argument of Group.add()
 
     By setting the `columns` property to column IDs, columns are displayed or
-    hidden in each existing or newly added row.
+    hidden in each existing or newly added row.  Existing rows add and remove
+    cells only when their `update_columns` method is called, e.g. before they
+    are rendered, so changing columns doesn't take longer for more rows.
+
+    If `flat_rows` is True, rows are FlatRow instances instead of
+    TableRow (i.e. Group(cls=Columns)) objects.  All column classes must
+    support that.
     """
-    def __init__(self, **columns):
+    def __init__(self, flat_rows=False, **columns):
         self._colspecs = columns
-        self._enabled_columns = []
+        self._enabled_columns = ()
         self._headers = Group(cls=urwid.Columns, dividechars=1)
         self._members = {}
+        self._flat_rows = bool(flat_rows)
+        self._column_widths = {}
         self.columns = columns
 
     def register(self, member_id):
         """Add a new row
 
-        Create a new Group(cls=Columns) object and fill it with enabled column
-        cells which can then be retrieved with `get_row(member_id)`.
+        Create a new TableRow or FlatRow object and fill it with enabled
+        column cells which can then be retrieved with `get_row(member_id)`.
         """
-        member = Group(cls=urwid.Columns, dividechars=1)
-        for colname in self._enabled_columns:
-            cellcls = self._colspecs[colname]
-            cellwidget = cellcls()
-            if member.exists(colname):
-                member.remove(colname)
-            member.add(colname, cellwidget, options=cellcls.width, removable=True)
+        if self._flat_rows:
+            member = FlatRow(self)
+        else:
+            member = TableRow(self)
+        member.update_columns()
         self._members[member_id] = member
 
     def get_row(self, member_id):
-        """Return a row, i.e. a Group(cls=Columns) object created by register()"""
+        """Return a row, i.e. a TableRow or FlatRow object created by register()"""
         return self._members[member_id]
 
+    def column_widths(self, maxcol):
+        """Return widths of the displayed columns if all columns fill `maxcol`"""
+        try:
+            return self._column_widths[maxcol]
+        except KeyError:
+            widths = self._column_widths[maxcol] = self._headers._main.column_widths((maxcol,))
+            return widths
+
+    @property
+    def flat_rows(self):
+        """Whether rows are FlatRow instances
+
+        Changing this only affects rows that are registered afterwards.
+        """
+        return self._flat_rows
+
+    @flat_rows.setter
+    def flat_rows(self, flat_rows):
+        self._flat_rows = bool(flat_rows)
+
     @property
     def headers(self):
         """Header row (a Group(cls=Columns) object)"""
@@ -64,7 +91,7 @@ class Table():
     @property
     def columns(self):
         """Currently enabled/displayed column IDs"""
-        return tuple(self._enabled_columns)
+        return self._enabled_columns
 
     @columns.setter
     def columns(self, columns):
@@ -72,31 +99,187 @@ class Table():
             if col not in self._colspecs:
                 raise ValueError('Unknown column name: {!r}'.format(col))
 
-        # Remove all columns
+        self._column_widths.clear()
         self._headers.clear()
-        for member in self._members.values():
-            member.clear()
-        self._enabled_columns = []
-
-        # Add wanted columns
         for colname in columns:
-            # Add header
             cellcls = self._colspecs[colname]
             if self._headers.exists(colname):
                 self._headers.remove(colname)
             self._headers.add(colname, cellcls.header, options=cellcls.width, removable=True)
-            self._enabled_columns.append(colname)
 
-            # Add new column to all members
-            for member in self._members.values():
-                cellwidget = cellcls()
-                member.add(colname, cellwidget, options=cellcls.width, removable=True)
+        # Rows compare this object to the one they were filled for
+        self._enabled_columns = tuple(columns)
 
     def clear(self):
         """Remove all registered rows"""
         self._members = {}
 
 
+class _TableRowMixin():
+    def update_columns(self):
+        """Add and remove cells to match the table's columns
+
+        Cells of columns that are still displayed are kept.
+
+        Return True if cells were changed, False otherwise.
+        """
+        table = self._table
+        columns = table._enabled_columns
+        if columns is self._columns:
+            return False
+        old_cells = dict(zip(self.names, self.widgets))
+        self.clear()
+        for colname in columns:
+            cellcls = table._colspecs[colname]
+            cellwidget = old_cells.get(colname)
+            if cellwidget is None:
+                cellwidget = cellcls()
+            self.add(colname, cellwidget, options=cellcls.width, removable=True)
+        self._columns = columns
+        return True
+
+
+class TableRow(_TableRowMixin, Group):
+    """Group(cls=Columns) that contains one cell per column of `table`"""
+
+    def __init__(self, table):
+        super().__init__(cls=urwid.Columns, dividechars=1)
+        self._table = table
+        self._columns = ()
+
+
+def fit_text(text, width, align='left', wide_chars=False):
+    """Pad or crop `text` to `width` screen columns like a clipping urwid.Text
+
+    wide_chars: Whether `text` may contain characters that don't occupy
+                exactly one screen column
+    """
+    length = len(text)
+    textwidth = calc_width(text, 0, length) if wide_chars else length
+    if textwidth > width:
+        if align == 'right':
+            crop = textwidth - width
+        elif align == 'center':
+            crop = (textwidth - width) // 2
+        else:
+            crop = 0
+        if wide_chars:
+            # Half of a wide character is replaced with a space like urwid does
+            start, startcol = calc_text_pos(text, 0, length, crop)
+            if startcol < crop:
+                startcol += calc_width(text, start, start+1)
+                start += 1
+            lpad = startcol - crop
+            end, textwidth = calc_text_pos(text, start, length, width - lpad)
+            textwidth += lpad
+            return ' '*lpad + text[start:end] + ' '*(width - textwidth)
+        else:
+            text = text[crop:crop+width]
+            textwidth = width
+
+    padding = width - textwidth
+    if padding <= 0:
+        return text
+    elif align == 'right':
+        return ' '*padding + text
+    elif align == 'center':
+        left = padding - padding // 2
+        return ' '*left + text + ' '*(padding-left)
+    else:
+        return text + ' '*padding
+
+
+class FlatRow(_TableRowMixin, urwid.Widget):
+    """Single-line row that renders all its cells as one text widget
+
+    This is much cheaper than a Group(cls=Columns) of cell widgets, but cells
+    are never rendered.  Instead, each cell must have a `markup(width)` method
+    that returns a list of (attribute, text) tuples that fill exactly `width`
+    screen columns.  Column widths are provided by `table`.
+
+    Cells are accessible as attributes, like in Group.
+    """
+
+    _sizing = frozenset(['flow'])
+
+    def __init__(self, table):
+        self._table = table
+        self._columns = ()
+        self._cells = {}
+        self._text = urwid.Text('', wrap='clip')
+        self._markup = None
+
+    def __getattr__(self, name):
+        cells = self.__dict__.get('_cells', {})
+        if name in cells:
+            return cells[name]
+        raise AttributeError(name)
+
+    def add(self, name, widget, options=None, removable=False):
+        """Append cell `widget` (`options` and `removable` are ignored)"""
+        if name in self._cells:
+            raise ValueError('Already added: {!r}'.format(name))
+        self._cells[name] = widget
+        self._invalidate()
+
+    def remove(self, name):
+        """Remove cell"""
+        if name not in self._cells:
+            raise ValueError('Unknown item name: {}'.format(name))
+        del self._cells[name]
+        self._invalidate()
+
+    def clear(self):
+        """Remove all cells"""
+        self._cells.clear()
+        self._invalidate()
+
+    def exists(self, name):
+        """Whether cell `name` exists"""
+        return name in self._cells
+
+    @property
+    def names(self):
+        """List of all cell names"""
+        return list(self._cells)
+
+    @property
+    def widgets(self):
+        """Tuple of all cells"""
+        return tuple(self._cells.values())
+
+    def update(self, data):
+        """Call `update(data)` on all cells
+
+        Return whether any cell changed.
+        """
+        changed = False
+        for cell in self._cells.values():
+            if cell.update(data):
+                changed = True
+        if changed:
+            self._invalidate()
+        return changed
+
+    def rows(self, size, focus=False):
+        return 1
+
+    def render(self, size, focus=False):
+        (maxcol,) = size
+        markup = []
+        for cell,width in zip(self._cells.values(), self._table.column_widths(maxcol)):
+            if markup:
+                markup.append(' ')
+            # urwid.Text ignores everything after an empty segment
+            markup.extend(segment for segment in cell.markup(width) if segment[1])
+
+        # Text invalidates its canvas when its text is set, even if nothing changed
+        if markup != self._markup:
+            self._markup = markup
+            self._text.set_text(markup or '')
+        return self._text.render(size)
+
+
 class ColumnHeaderWidget(urwid.WidgetWrap):
     """Column widget with left and right text"""
 
@@ -14,6 +14,7 @@ log = make_logger(__name__)
 
 import urwid
 import collections
+import asyncio
 
 from ..utils.string import strwidth
 
@@ -70,11 +71,16 @@ class TabBar(urwid.GridFlow):
 
 
 class Tabs(urwid.Widget):
-    """Organize multiple widgets in tabs"""
+    """Organize multiple widgets in tabs
+
+    Content widgets with `hibernate` and `wake_up` methods are told to
+    hibernate when their tab wasn't focused for `hibernate_after` seconds and
+    to wake up when their tab is focused again.
+    """
 
     _sizing = frozenset([urwid.FLOW, urwid.BOX])
 
-    def __init__(self, *contents, tabbar=None):
+    def __init__(self, *contents, tabbar=None, hibernate_after=0, loop=None):
         """Create new Tabs widget
 
         contents: Iterable of dictionaries or iterables that match the arguments
@@ -82,6 +88,9 @@ class Tabs(urwid.Widget):
         tabbar: TabBar instance that is used to display tab titles or any object
                 with a 'base_widget' attribute (e.g. AttrMap) that returns a
                 TabBar object
+        hibernate_after: Seconds an unfocused tab's content waits before it
+                         hibernates or 0 to never hibernate
+        loop: asyncio loop that is used to hibernate contents
         """
         if tabbar is None:
             self._tabbar = TabBar()
@@ -91,6 +100,11 @@ class Tabs(urwid.Widget):
         else:
             self._tabbar = tabbar
 
+        self._loop = loop if loop is not None else asyncio.get_event_loop()
+        self._hibernate_after = float(hibernate_after)
+        self._hibernate_handles = {}
+        self._prev_focus_id = None
+
         self._ids = []
         self._contents = urwid.MonitoredFocusList()
         for content in contents:
@@ -237,6 +251,8 @@ class Tabs(urwid.Widget):
         self._contents.insert(newpos, widget)
         if focus:
             self.focus_position = newpos
+        else:
+            self._schedule_hibernation(this_id)
         return this_id
 
     def remove(self, position=None):
@@ -247,9 +263,11 @@ class Tabs(urwid.Widget):
         Raises IndexError if tab can't be found.
         """
         i = self.get_index(position)
+        self._cancel_hibernation(self._ids[i])
         del self._ids[i]
         del self._contents[i]
         del self._tabbar.base_widget[i]
+        self._focus_changed()
 
     def clear(self):
         """Remove all tabs"""
@@ -297,6 +315,8 @@ class Tabs(urwid.Widget):
         """
         i = self.get_index(position)
         self._contents[i] = widget
+        if i != self.focus_position:
+            self._schedule_hibernation(self._ids[i])
 
     @property
     def focus(self):
@@ -316,6 +336,7 @@ class Tabs(urwid.Widget):
         if 0 <= position < len(self._contents):
             self._tabbar.base_widget.focus = position
             self._contents.focus = position
+            self._focus_changed()
         else:
             raise IndexError('No tab at position: {!r}'.format(position))
 
@@ -332,9 +353,58 @@ class Tabs(urwid.Widget):
         if 0 <= i < len(self._contents):
             self._tabbar.base_widget.focus = i
             self._contents.focus = i
+            self._focus_changed()
         else:
             raise IndexError('No tab with ID: {}'.format(tabid))
 
+    @property
+    def hibernate_after(self):
+        """Seconds before the content of an unfocused tab hibernates or 0 to never hibernate"""
+        return self._hibernate_after
+
+    @hibernate_after.setter
+    def hibernate_after(self, seconds):
+        seconds = float(seconds)
+        if seconds < 0:
+            raise ValueError('hibernate_after must not be negative: %r' % seconds)
+        self._hibernate_after = seconds
+        focus_id = self.focus_id
+        for tabid in self._ids:
+            if tabid != focus_id:
+                self._schedule_hibernation(tabid)
+
+    def _focus_changed(self):
+        focus_id = self.focus_id
+        prev_id = self._prev_focus_id
+        if focus_id != prev_id:
+            self._prev_focus_id = focus_id
+            if prev_id in self._ids:
+                self._schedule_hibernation(prev_id)
+            if focus_id is not None:
+                self._cancel_hibernation(focus_id)
+                widget = self.focus
+                if hasattr(widget, 'wake_up'):
+                    widget.wake_up()
+
+    def _schedule_hibernation(self, tabid):
+        self._cancel_hibernation(tabid)
+        if self._hibernate_after > 0:
+            self._hibernate_handles[tabid] = self._loop.call_later(
+                self._hibernate_after, self._hibernate, tabid)
+
+    def _cancel_hibernation(self, tabid):
+        handle = self._hibernate_handles.pop(tabid, None)
+        if handle is not None:
+            handle.cancel()
+
+    def _hibernate(self, tabid):
+        self._hibernate_handles.pop(tabid, None)
+        if tabid in self._ids and tabid != self.focus_id:
+            widget = self._contents[self._ids.index(tabid)]
+            if hasattr(widget, 'hibernate'):
+                log.debug('Hibernating tab %r: %r', tabid, widget)
+                widget.hibernate()
+
     @property
     def contents(self):
         """Yields all content widgets"""
@@ -12,6 +12,7 @@
 """Monkey patches that should be removed when they are resolved upstream"""
 
 import urwid
+import itertools
 
 # Add more actions for key bindings
 urwid.CURSOR_WORD_LEFT         = 'cursor word left'
@@ -173,13 +174,49 @@ class ListBox_patched(urwid.ListBox):
 
 
     # Add support for ScrollBar class (see stig.tui.scroll)
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self._rows_max = None
-
-    def _invalidate(self):
-        super()._invalidate()
-        self._rows_max = None
+    def _set_body(self, body):
+        old_body = getattr(self, '_body', None)
+        if old_body is not None:
+            try:
+                urwid.disconnect_signal(old_body, 'modified', self._reset_row_index)
+            except NameError:
+                pass
+        super()._set_body(body)
+        self._row_index = None
+        # Walkers with a 'version' attribute increase it when their items
+        # change, others also emit 'modified' when the focus changes
+        if not hasattr(self._body, 'version'):
+            try:
+                urwid.connect_signal(self._body, 'modified', self._reset_row_index)
+            except NameError:
+                pass
+
+    body = property(urwid.ListBox._get_body, _set_body)
+
+    def _reset_row_index(self):
+        self._row_index = None
+
+    def _get_row_index(self, maxcol):
+        """Return mapping of positions to indexes and list of rows above each item"""
+        body = self.body
+        key = (maxcol, getattr(body, 'version', None))
+        row_index = self._row_index
+        if row_index is None or row_index[0] != key:
+            flow_size = (maxcol,)
+            if hasattr(body, 'positions'):
+                # For body[pos], pos can be anything, not just an int.  In that
+                # case, the positions() method returns an interable of valid
+                # positions.
+                positions = tuple(body.positions())
+            else:
+                # Treat body like a normal list
+                positions = range(len(body))
+            indexes = {pos:i for i,pos in enumerate(positions)}
+            rows_above = [0]
+            rows_above.extend(itertools.accumulate(body[pos].rows(flow_size)
+                                                   for pos in positions))
+            row_index = self._row_index = (key, indexes, rows_above)
+        return row_index[1:]
 
     def get_scrollpos(self, size, focus=False):
         """Current scrolling position
@@ -191,33 +228,20 @@ class ListBox_patched(urwid.ListBox):
             return 0
         else:
             offset_rows, _, focus_pos, _, _ = middle
-            maxcol, maxrow = size
-            flow_size = (maxcol,)
-
             body = self.body
-            if hasattr(body, 'positions'):
-                # For body[pos], pos can be anything, not just an int.  In that
-                # case, the positions() method returns an interable of valid
-                # positions.
-                positions = tuple(self.body.positions())
-                focus_index = positions.index(focus_pos)
-                widgets_above_focus = (body[pos] for pos in positions[:focus_index])
+            if getattr(body, 'item_rows', None) is not None:
+                # All items have the same height (see VirtualListWalker)
+                return focus_pos * body.item_rows - offset_rows
             else:
-                # Treat body like a normal list
-                widgets_above_focus = (w for w in body[:focus_pos])
-
-            rows_above_focus = sum(w.rows(flow_size) for w in widgets_above_focus)
-            rows_above_top = rows_above_focus - offset_rows
-            return rows_above_top
+                indexes, rows_above = self._get_row_index(size[0])
+                return rows_above[indexes[focus_pos]] - offset_rows
 
     def rows_max(self, size, focus=False):
-        if self._rows_max is None:
-            flow_size = (size[0],)
-            body = self.body
-            if hasattr(body, 'positions'):
-                self._rows_max = sum(body[pos].rows(flow_size) for pos in body.positions())
-            else:
-                self._rows_max = sum(w.rows(flow_size) for w in self.body)
-        return self._rows_max
+        body = self.body
+        if getattr(body, 'item_rows', None) is not None:
+            return len(body) * body.item_rows
+        else:
+            indexes, rows_above = self._get_row_index(size[0])
+            return rows_above[-1]
 
 urwid.ListBox = ListBox_patched
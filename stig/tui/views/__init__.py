@@ -11,8 +11,13 @@
 
 import urwid
 import collections
+import itertools
+from bisect import bisect_right
+import heapq
+import time
+import asyncio
 
-from ..table import ColumnHeaderWidget
+from ..table import (ColumnHeaderWidget, FlatRow, fit_text)
 
 
 class Style():
@@ -39,6 +44,16 @@ class Style():
             self._attribs[mode+'.focused'] = self.dotify(prefix, mode, 'focused')
             self._attribs[mode+'.unfocused'] = self.dotify(prefix, mode, 'unfocused')
 
+        # attrs() is called for every cell update, so we don't want to build
+        # the same strings over and over again
+        self._attrs_cache = {}
+        for mode in (None,) + tuple(extras) + tuple(modes):
+            for focused in (False, True):
+                try:
+                    self._attrs_cache[(mode, focused)] = self._get_attrs(mode, focused)
+                except KeyError:
+                    pass
+
     def attrs(self, mode=None, focused=False):
         """Get attributes as specified in the urwid palette
 
@@ -46,6 +61,12 @@ class Style():
         focused: If True the '...focused' attributes are returned,
                  '...unfocused otherwise
         """
+        try:
+            return self._attrs_cache[(mode or None, bool(focused))]
+        except KeyError:
+            return self._get_attrs(mode, focused)
+
+    def _get_attrs(self, mode, focused):
         mode = '' if not mode else mode
         name = self.dotify(mode, 'focused' if focused else 'unfocused')
         if name in self._attribs:
@@ -81,17 +102,25 @@ class CellWidgetBase(urwid.WidgetWrap):
     def __init__(self):
         self.value = None
         self.text = urwid.Text('', wrap=self.wrap, align=self.align)
-        self.attrmap = urwid.AttrMap(self.text, self.style.attrs('unfocused'))
+        self.attr = self.style.attrs('unfocused')
+        self.attrmap = urwid.AttrMap(self.text, self.attr)
         return super().__init__(self.attrmap)
 
     def update(self, data):
+        """Display new data and return whether the displayed value changed"""
         self.data = data
         new_value = self.get_value()
         if self.value != new_value:
             self.value = new_value
             self.text.set_text(str(new_value))
+            # Changing the attribute map invalidates the cell's canvas, even
+            # if the attribute stays the same
             attr = self.style.attrs(self.get_mode(), focused=False)
-            self.attrmap.set_attr_map({None: attr})
+            if attr != self.attr:
+                self.attr = attr
+                self.attrmap.set_attr_map({None: attr})
+            return True
+        return False
 
     def get_value(self):
         raise NotImplementedError()
@@ -99,6 +128,14 @@ class CellWidgetBase(urwid.WidgetWrap):
     def get_mode(self):
         return None
 
+    def markup(self, width):
+        """Return text markup that fills exactly `width` screen columns
+
+        This is used instead of rendering the cell if it is in a FlatRow.
+        """
+        return [(self.attr, fit_text(self.text.text, width, self.align,
+                                     self.may_have_wide_chars))]
+
     @classmethod
     def set_header(cls, left=None, right=None):
         if left is not None:
@@ -118,8 +155,8 @@ class ItemWidgetBase(urwid.WidgetWrap):
     palette_focused   = NotImplemented
 
     def __init__(self, data, cells):
-        self._data = data    # Info of torrent/tracker/file/peer/... as mapping
-        self._cells = cells  # Group instance that combines widgets horizontally
+        self._data = data         # Info of torrent/tracker/file/peer/... as mapping
+        self._cells_group = cells  # Table row that combines cell widgets horizontally
 
         # Create focusable or unfocusable item widget
         if self.columns_focus_map is not NotImplemented:
@@ -132,13 +169,48 @@ class ItemWidgetBase(urwid.WidgetWrap):
         urwid.WidgetWrap.__init__(self, item_widget)
 
         # Initialize cell widgets
-        self.update(data)
+        self._update_cells()
 
     def update(self, data):
-        for widget in self._cells.widgets:
-            if hasattr(widget, 'update'):
-                widget.update(data)
+        """Display new data
+
+        The row is only invalidated if any cell changed its displayed value.
+        Otherwise, its cached canvas is reused.
+        """
         self._data = data
+        if self._update_cells():
+            self._invalidate()
+
+    def _update_cells(self):
+        # Columns may have changed since we were rendered the last time
+        cells = self._cells_group
+        cells.update_columns()
+        data = self._data
+        if isinstance(cells, FlatRow):
+            return cells.update(data)
+        else:
+            changed = False
+            for widget in cells.widgets:
+                if hasattr(widget, 'update') and widget.update(data):
+                    changed = True
+            return changed
+
+    def _check_cells(self):
+        if self._cells_group.update_columns():
+            self._update_cells()
+
+    @property
+    def _cells(self):
+        self._check_cells()
+        return self._cells_group
+
+    def rows(self, size, focus=False):
+        self._check_cells()
+        return super().rows(size, focus)
+
+    def render(self, size, focus=False):
+        self._check_cells()
+        return super().render(size, focus)
 
     @property
     def id(self):
@@ -150,6 +222,11 @@ class ItemWidgetBase(urwid.WidgetWrap):
         """Displayed data in dictionary form"""
         return self._data
 
+    @property
+    def is_markable(self):
+        """Whether this item has a "marked" column"""
+        return self._cells.exists('marked')
+
     @property
     def is_marked(self):
         """Whether this item has been marked by the user"""
@@ -158,7 +235,204 @@ class ItemWidgetBase(urwid.WidgetWrap):
     @is_marked.setter
     def is_marked(self, is_marked):
         self._cells.marked.is_marked = bool(is_marked)
+        # FlatRow doesn't notice when a cell changes
+        self._cells_group._invalidate()
+
+
+
+class VirtualListWalker(urwid.ListWalker):
+    """List walker that only creates widgets for items that are displayed
+
+    Items are stored as IDs (in display order) and data.  Widgets are created
+    when the ListBox asks for them by calling `make_widget` with the item's
+    data and a widget that isn't needed anymore or `None`.  `make_widget` must
+    return a widget that displays the given data, either the passed widget or
+    a new one.
+
+    No more than `max_widgets` widgets are kept around.  When more are
+    needed, the least recently displayed widgets are reused.  Widgets must
+    provide an `update(data)` method and an `id` property.
+
+    item_rows: Number of rows each item widget needs or `None` if it varies
+
+    `version` is increased whenever items or their data change, but not when
+    only the focus changes.
+    """
+
+    def __init__(self, make_widget, max_widgets=200, item_rows=None):
+        self._make_widget = make_widget
+        self._max_widgets = max_widgets
+        self._ids = []
+        self._positions = {}  # Map IDs to indexes in self._ids
+        self._data = {}
+        self._widgets = collections.OrderedDict()  # Least recently used first
+        self._unused = []
+        self._focus = 0
+        self.item_rows = item_rows
+        self.version = 0
+
+    def set_data(self, data_dict):
+        """Replace data of all items
+
+        Items that exist in `data_dict` keep their position, new items are
+        appended and items that don't exist anymore are removed.  `data_dict`
+        is used directly and must not be changed afterwards.
+
+        Return IDs of removed items.
+        """
+        old_data = self._data
+        if old_data.keys() == data_dict.keys():
+            removed_ids = ()
+        else:
+            removed_ids = old_data.keys() - data_dict.keys()
+            added_ids = data_dict.keys() - old_data.keys()
+            focus_id = self.focus_id
+            if removed_ids:
+                self._ids = [id for id in self._ids if id not in removed_ids]
+            if added_ids:
+                self._ids.extend(id for id in data_dict if id in added_ids)
+            self._positions = None
+            self._refocus(focus_id, data_dict)
+        self._data = data_dict
+
+        widgets = self._widgets
+        for id in removed_ids:
+            if id in widgets:
+                self._unused.append(widgets.pop(id))
+        for id,widget in widgets.items():
+            widget.update(data_dict[id])
+
+        self.version += 1
+        self._modified()
+        return removed_ids
+
+    def set_order(self, ids):
+        """Change the order of items to the sequence `ids` of existing IDs"""
+        focus_id = self.focus_id
+        self._ids = list(ids)
+        self._positions = None
+        self._refocus(focus_id, self._data)
+        self.version += 1
+        self._modified()
+
+    def clear(self):
+        """Remove all items and forget all widgets"""
+        self._ids = []
+        self._positions = {}
+        self._data = {}
+        self._widgets.clear()
+        self._unused.clear()
+        self._focus = 0
+        self.version += 1
+        self._modified()
+
+    def _refocus(self, focus_id, data):
+        if focus_id is not None and focus_id in data:
+            self._focus = self.position_of(focus_id)
+        else:
+            self._focus = max(0, min(self._focus, len(self._ids)-1))
+
+    def position_of(self, id):
+        """Return index of item with ID `id`"""
+        if self._positions is None:
+            self._positions = {id:i for i,id in enumerate(self._ids)}
+        return self._positions[id]
+
+    @property
+    def ids(self):
+        """List of item IDs in display order"""
+        return self._ids
+
+    def values(self):
+        """Item data in display order"""
+        data = self._data
+        return [data[id] for id in self._ids]
+
+    def get_data(self, id):
+        """Return data of item with ID `id`"""
+        return self._data[id]
+
+    def __contains__(self, id):
+        return id in self._data
+
+    def widgets(self):
+        """Currently existing widgets"""
+        return tuple(self._widgets.values())
 
+    def get_widget(self, id):
+        """Return widget for item with ID `id`, creating it if necessary
+
+        The returned widget may be reused for another item later.
+        """
+        widgets = self._widgets
+        if id in widgets:
+            widgets.move_to_end(id)
+            return widgets[id]
+
+        if self._unused:
+            unused = self._unused.pop()
+        elif len(widgets) >= self._max_widgets:
+            # Reuse least recently displayed widget unless it is focused
+            focus_id = self.focus_id
+            unused_id = next(wid for wid in widgets if wid != focus_id)
+            unused = widgets.pop(unused_id)
+        else:
+            unused = None
+        widget = widgets[id] = self._make_widget(self._data[id], unused)
+        return widget
+
+    @property
+    def focus_id(self):
+        """ID of focused item or `None`"""
+        if self._ids:
+            return self._ids[self._focus]
+
+    # ListWalker interface
+
+    def __len__(self):
+        return len(self._ids)
+
+    def __getitem__(self, position):
+        if not 0 <= position < len(self._ids):
+            raise IndexError(position)
+        return self.get_widget(self._ids[position])
+
+    def positions(self, reverse=False):
+        if reverse:
+            return range(len(self._ids)-1, -1, -1)
+        return range(len(self._ids))
+
+    def get_focus(self):
+        if not self._ids:
+            return None, None
+        return self[self._focus], self._focus
+
+    def set_focus(self, position):
+        if not 0 <= position < len(self._ids):
+            raise IndexError(position)
+        self._focus = position
+        self._modified()
+
+    def get_next(self, position):
+        if 0 <= position+1 < len(self._ids):
+            return self[position+1], position+1
+        return None, None
+
+    def get_prev(self, position):
+        if 0 <= position-1 < len(self._ids):
+            return self[position-1], position-1
+        return None, None
+
+
+def _get_sort_keys(sort, ids, items):
+    # Generator for Worker.run_threaded that yields after each item and
+    # returns a map of `ids` to sort keys of snapshots of `items`
+    get_key = sort.get_key
+    keys = {}
+    for id,item in zip(ids, items):
+        keys[id] = get_key(item.snapshot())
+        yield
+    return keys
 
 
 from ..table import Table
@@ -172,6 +446,11 @@ class ListWidgetBase(urwid.WidgetWrap):
     keymap_context  = NotImplemented
     palette_name    = NotImplemented
     focusable_items = False
+    item_rows       = 1  # None if items can have different heights
+    flat_rows_supported = False  # True if all cells support FlatRow
+
+    # Whether new lists use FlatRow if supported; changed by 'tui.flat-rows'
+    use_flat_rows = True
 
     def __init__(self, srvapi, keymap, columns=None, sort=None, title=None):
         self._srvapi = srvapi
@@ -182,22 +461,27 @@ class ListWidgetBase(urwid.WidgetWrap):
         else:
             self._ListItemClass = self.ListItemClass
 
-        self._data_dict = ()
+        self._data_dict = None
         self._marked = set()
 
         self._sort = sort
         self._sort_orig = sort
+        self._sort_keys = {}
+        self._sort_pending = None
+        self._sort_task = None
 
         self._title_name = title
         self.title_updater = None
 
-        self._table = Table(**self.tuicolumns)
+        self._hibernating = False
+        self._focus_to_restore = None
+
+        self._table = Table(flat_rows=self.flat_rows_supported and self.use_flat_rows,
+                            **self.tuicolumns)
         self._table.columns = columns or ()
+        self._row_ids = itertools.count()
 
-        if self.focusable_items:
-            walker = urwid.SimpleFocusListWalker([])
-        else:
-            walker = urwid.SimpleListWalker([])
+        walker = VirtualListWalker(self._make_item_widget, item_rows=self.item_rows)
         self._listbox = keymap.wrap(urwid.ListBox, context=self.keymap_context + 'list')(walker)
 
         listbox_sb = urwid.AttrMap(
@@ -224,68 +508,208 @@ class ListWidgetBase(urwid.WidgetWrap):
         if self._data_dict is not None:
             self._update_listitems()
             self._data_dict = None
+            if self._focus_to_restore is not None:
+                self._restore_focus()
+        elif self._sort_pending is not None:
+            self._sort_listitems()
         # focus=True because we always want to highlight the focused item, for
         # example when the CLI is open
         return super().render(size, focus=True)
 
     def _update_listitems(self):
-        # Remember focused item widget in case items get added or removed
-        focusedw = self.focused_widget
-
-        walker = self._listbox.body
-        data_dict = self._data_dict
-        dead_items = []
-        for w in walker:  # w = *ItemWidget instance
-            id = w.id
-            try:
-                # Update existing *ItemWidget instances with new data
-                w.update(data_dict[id])
-                del data_dict[id]
-            except KeyError:
-                # Item no longer exists in data_dict anymore
-                dead_items.append(w)
-
-        # Remove dead *ItemWidget instances
+        removed_ids = self._listbox.body.set_data(self._data_dict)
         marked = self._marked
-        for w in dead_items:
-            walker.remove(w)
-            marked.discard(w)  # self._marked may have a reference too
-
-        # Any items that haven't been used to update an existing *ItemWidget instance are new
-        if data_dict:
-            table = self._table
-            cls = self._ListItemClass
-            for data_id in data_dict:
-                table.register(data_id)
-                item_widget = table.get_row(data_id)
-                walker.append(cls(data_dict[data_id], item_widget))
+        for id in removed_ids:
+            marked.discard(id)
 
         # Sort items in walker
         if self._sort is not None:
-            self._sort.apply(walker,
-                            item_getter=lambda w: w.data,
-                            inplace=True)
-
-        # Items could be added/removed - re-focus previously focused item if necessary
-        if focusedw is not None and self.focused_widget is not None and \
-           focusedw.id != self.focused_widget.id:
-            focused_id = focusedw.id
-            for i,w in enumerate(walker):
-                if w.id == focused_id:
-                    self._listbox.focus_position = i
-                    break
+            self._sort_pending = None
+            self._sort_listitems()
+
+    def _make_item_widget(self, data, unused_widget=None):
+        if unused_widget is None:
+            # Table rows are not removed when their item is removed, so we
+            # can't use item IDs for them
+            row_id = next(self._row_ids)
+            self._table.register(row_id)
+            widget = self._ListItemClass(data, self._table.get_row(row_id))
+        else:
+            widget = unused_widget
+            widget.update(data)
+        if widget.is_markable:
+            widget.is_marked = widget.id in self._marked
+        return widget
+
+    # Items that changed their sort key are moved individually if there are no
+    # more than this many of them
+    _MAX_MOVED_ITEMS = 32
+
+    # Maximum number of seconds spent on computing sort keys per render; if
+    # there are more items, the remaining keys are computed in the following
+    # renders so the event loop isn't blocked
+    _SORT_TIMESLICE = 0.02
+
+    def _sort_listitems(self):
+        walker = self._listbox.body
+        if self._sort_pending is None:
+            ids = list(walker.ids)
+            values = tuple(walker.values())
+            if self._srvapi.worker.threaded and values and hasattr(values[0], 'snapshot'):
+                # Compute sort keys of snapshots in the worker thread
+                self._sort_pending = (ids, {}, None)
+                self._get_sort_keys_threaded(values)
+                return
+            self._sort_pending = (ids, {}, iter(zip(ids, values)))
+        ids, new_keys, items = self._sort_pending
+        if items is None:
+            # Sort keys are not computed yet
+            return
+
+        get_key = self._sort.get_key
+        deadline = time.monotonic() + self._SORT_TIMESLICE
+        for i,(id,data) in enumerate(items, start=1):
+            new_keys[id] = get_key(data)
+            if i % 64 == 0 and time.monotonic() >= deadline:
+                # Continue after the event loop had a chance to run
+                self._srvapi.loop.call_soon(self._invalidate)
+                return
+        self._sort_pending = None
+
+        old_keys = self._sort_keys
+        self._sort_keys = new_keys
+
+        # Items that didn't change their sort key are still sorted
+        moved = [id for id in ids if old_keys.get(id) != new_keys[id]]
+        if not moved:
+            return
+        elif len(moved) <= self._MAX_MOVED_ITEMS:
+            # Remove moved items and insert them where they belong
+            moved_ids = set(moved)
+            ids = [id for id in ids if id not in moved_ids]
+            keys = [new_keys[id] for id in ids]
+            for id in moved:
+                key = new_keys[id]
+                i = bisect_right(keys, key)
+                keys.insert(i, key)
+                ids.insert(i, id)
+        else:
+            # Sort moved items and merge them with the unmoved items
+            moved_ids = set(moved)
+            unmoved = (id for id in ids if id not in moved_ids)
+            key = new_keys.__getitem__
+            ids = list(heapq.merge(unmoved, sorted(moved, key=key), key=key))
+        walker.set_order(ids)
+
+    def _get_sort_keys_threaded(self, values):
+        if self._sort_task is not None:
+            # Don't wait for outdated sort keys
+            self._sort_task.cancel()
+
+        pending = self._sort_pending
+        ids, new_keys, _ = pending
+        args = (self._sort, tuple(ids), values)
+
+        async def get_sort_keys():
+            keys = await self._srvapi.worker.run_threaded(_get_sort_keys, *args)
+            if self._sort_pending is pending:
+                new_keys.update(keys)
+                self._sort_pending = (ids, new_keys, iter(()))
+                self._invalidate()
+
+        self._sort_task = asyncio.ensure_future(get_sort_keys(), loop=self._srvapi.loop)
 
     def clear(self):
         """Remove all list items"""
         self._table.clear()
-        self._listbox.body[:] = ()
+        self._listbox.body.clear()
         self._listbox._invalidate()
         self._marked.clear()
+        self._sort_keys = {}
+        self._sort_pending = None
 
     def refresh(self):
         """Update list items"""
         raise NotImplementedError
 
+    def hibernate(self):
+        """Stop requesting list items and remove them
+
+        Columns, sort order, filters and the focus position are kept so that
+        `wake_up` can restore the list.
+        """
+        if not self._hibernating:
+            try:
+                self._focus_to_restore = (self.focused_id, self.focus_position)
+            except IndexError:
+                self._focus_to_restore = None
+            self._unsubscribe()
+            self.clear()
+            self._data_dict = None
+            self._hibernating = True
+
+    def wake_up(self):
+        """Request list items again after `hibernate` was called"""
+        if self._hibernating:
+            self._hibernating = False
+            self._subscribe()
+
+    @property
+    def hibernating(self):
+        """Whether `hibernate` was called without calling `wake_up` since"""
+        return self._hibernating
+
+    def _subscribe(self):
+        """Start requesting list items (called by `wake_up`)"""
+        pass
+
+    def _unsubscribe(self):
+        """Stop requesting list items (called by `hibernate`)"""
+        pass
+
+    def _restore_focus(self):
+        if self.count > 0:
+            # Items may have been added, removed or moved since the focus was stored
+            focus_id, focus_position = self._focus_to_restore
+            position = self._position_of_id(focus_id)
+            self.focus_position = focus_position if position is None else position
+            self._focus_to_restore = None
+
+    def _position_of_id(self, id):
+        """Return position of the item with ID `id` or `None` if it doesn't exist"""
+        walker = self._listbox.body
+        if id is not None and id in walker:
+            return walker.position_of(id)
+
+    @property
+    def flat_rows(self):
+        """Whether list items are FlatRows instead of Columns
+
+        Setting this to True has no effect if any cell doesn't support
+        FlatRow.
+        """
+        return self._table.flat_rows
+
+    @flat_rows.setter
+    def flat_rows(self, flat_rows):
+        flat_rows = bool(flat_rows) and self.flat_rows_supported
+        if flat_rows != self._table.flat_rows:
+            # Item widgets must be created again with the other kind of row
+            walker = self._listbox.body
+            data_dict = self._data_dict
+            if data_dict is None:
+                data_dict = {id:walker.get_data(id) for id in walker.ids}
+            marked = set(self._marked)
+            try:
+                focus = (self.focused_id, self.focus_position)
+            except IndexError:
+                focus = None
+            self.clear()
+            self._table.flat_rows = flat_rows
+            self._marked.update(marked)
+            self._data_dict = data_dict
+            self._focus_to_restore = focus
+            self._invalidate()
 
     @property
     def columns(self):
@@ -294,6 +718,15 @@ class ListWidgetBase(urwid.WidgetWrap):
     @columns.setter
     def columns(self, columns):
         self._table.columns = columns
+        # Rows add and remove cells when they are rendered
+        for widget in self._item_widgets():
+            widget._invalidate()
+        self._listbox._invalidate()
+        self._invalidate()
+
+    def _item_widgets(self):
+        """Existing list item widgets"""
+        return self._listbox.body.widgets()
 
     @property
     def sort(self):
@@ -306,6 +739,8 @@ class ListWidgetBase(urwid.WidgetWrap):
             self._sort = self._sort_orig
         else:
             self._sort = sort
+        self._sort_keys = {}
+        self._sort_pending = None
 
     @property
     def count(self):
@@ -351,35 +786,45 @@ class ListWidgetBase(urwid.WidgetWrap):
         """Unmark the currently focused item or all items"""
         self._set_mark(False, toggle=toggle, all=all)
 
+    @property
+    def marked_ids(self):
+        """Tuple of IDs of marked items"""
+        walker = self._listbox.body
+        return tuple(id for id in self._marked if id in walker)
+
     @property
     def marked(self):
-        """Generator that yields ItemWidgetBase descendants"""
-        yield from self._marked
+        """Generator that yields data of marked items"""
+        walker = self._listbox.body
+        for id in self.marked_ids:
+            yield walker.get_data(id)
 
     def _set_mark(self, mark, toggle=False, all=False):
         if toggle and self.focused_widget is not None:
             mark = not self.focused_widget.is_marked
 
-        for widget in self._select_items_for_marking(all):
-            widget.is_marked = mark
-            if mark:
-                self._marked.add(widget)
-            else:
-                self._marked.discard(widget)
+        ids = set(self._select_items_for_marking(all))
+        if mark:
+            self._marked.update(ids)
+        else:
+            self._marked.difference_update(ids)
+        for widget in self._listbox.body.widgets():
+            if widget.id in ids:
+                widget.is_marked = mark
 
     def _select_items_for_marking(self, all):
         if self.focused_widget is not None:
             if all:
-                yield from self._listbox.body
+                yield from self._listbox.body.ids
             else:
-                yield self.focused_widget
+                yield self.focused_widget.id
 
     def refresh_marks(self):
         """Redraw the "marked" column in all items widgets
 
         This shouldn't be needed unless the marked character was changed.
         """
-        for widget in self._listbox.body:
+        for widget in self._listbox.body.widgets():
             widget.is_marked = widget.is_marked
 
 
@@ -411,5 +856,3 @@ def stringify_torrent_filter(tfilter, torrents):
     else:
         return str(tfilter)
 
-
-from . import hooks
@@ -47,7 +47,7 @@ class MarkedBase(_COLUMNS['marked'], CellWidgetBase):
         self._is_marked = is_marked
 
     def update(self, data):
-        pass  # Ignore update data
+        return False  # Ignore update data
 
     def __repr__(self):
         return '<{} {}>'.format(type(self).__name__, 'on' if self._is_marked else 'off')
@@ -36,6 +36,23 @@ class Filename(_COLUMNS['name'], CellWidgetBase):
     header = urwid.AttrMap(ColumnHeaderWidget(**_COLUMNS['name'].header),
                            style.attrs('header'))
 
+    # Directory names start with one of these
+    expanded_prefix = '▾ '
+    collapsed_prefix = '▸ '
+
+    def __init__(self):
+        self.is_expanded = False
+        super().__init__()
+
+    def get_value(self):
+        name = super().get_value()
+        if self.data.nodetype == 'leaf':
+            return name
+        elif self.is_expanded:
+            return self.expanded_prefix + name
+        else:
+            return self.collapsed_prefix + name
+
     def get_mode(self):
         if self.data.nodetype == 'leaf':
             return 'file'
@@ -16,24 +16,131 @@ import urwid
 import urwidtrees
 from collections import abc
 import builtins
+import os
 
 from .file import TUICOLUMNS
 from . import (ItemWidgetBase, ListWidgetBase, stringify_torrent_filter)
 
 
-from ...views.file import (create_directory_data, create_directory_name)
+from ...views.file import DirectorySummary
 from urwidtrees.decoration import ArrowTree
+
+
+class _FileNode():
+    """Node of a _LazyFileTree
+
+    `content` is a TorrentFile or the data of a directory.  `create_children`
+    is a callable that returns a list of child nodes or `None` for files.  It
+    is called only once, when the children are requested for the first time.
+    """
+
+    __slots__ = ('content', '_children', '_create_children')
+
+    def __init__(self, content, create_children=None):
+        self.content = content
+        self._children = None
+        self._create_children = create_children
+
+    @property
+    def is_parent(self):
+        return self.content.nodetype == 'parent'
+
+    @property
+    def children(self):
+        if self._create_children is not None:
+            self._children = self._create_children()
+            self._create_children = None
+        return self._children
+
+
+class _LazyFileTree(urwidtrees.Tree):
+    """Tree of _FileNodes with the same positions as urwidtrees.SimpleTree
+
+    Children of a directory are only visible if `is_expanded` returns True for
+    its content.  They are created when they are visible for the first time.
+    """
+
+    def __init__(self, nodes, is_expanded):
+        self._nodes = nodes
+        self._is_expanded = is_expanded
+        self.root = (0,) if nodes else None
+
+    def _get_node(self, pos):
+        nodes = self._nodes
+        for i in pos[:-1]:
+            nodes = nodes[i].children
+        return nodes[pos[-1]]
+
+    def _get_siblings(self, pos):
+        if len(pos) == 1:
+            return self._nodes
+        else:
+            return self._get_node(pos[:-1]).children
+
+    def _get_visible_children(self, pos):
+        node = self._get_node(pos)
+        if node.is_parent and self._is_expanded(node.content):
+            return node.children
+        return None
+
+    def __getitem__(self, pos):
+        return self._get_node(pos).content
+
+    def child_positions(self, pos):
+        """Yield positions of all child nodes, even if they are not visible"""
+        node = self._get_node(pos)
+        if node.is_parent:
+            for i in range(len(node.children or ())):
+                yield pos + (i,)
+
+    @staticmethod
+    def parent_position(pos):
+        return pos[:-1] if len(pos) > 1 else None
+
+    def first_child_position(self, pos):
+        return pos + (0,) if self._get_visible_children(pos) else None
+
+    def last_child_position(self, pos):
+        children = self._get_visible_children(pos)
+        return pos + (len(children)-1,) if children else None
+
+    def next_sibling_position(self, pos):
+        i = pos[-1] + 1
+        return pos[:-1] + (i,) if i < len(self._get_siblings(pos)) else None
+
+    @staticmethod
+    def prev_sibling_position(pos):
+        return pos[:-1] + (pos[-1]-1,) if pos[-1] > 0 else None
+
+    @staticmethod
+    def depth(pos):
+        return len(pos) - 1
+
+
 class FileTreeDecorator(ArrowTree):
-    """urwidtrees decorator for TorrentFiles and TorrentFileTrees"""
+    """urwidtrees decorator for TorrentFiles and TorrentFileTrees
 
-    def __init__(self, torrents, keymap, table, ffilter):
+    Directories are collapsed unless their (torrent ID, path) is in
+    `expanded`.  Their children are created and decorated only when they are
+    expanded.
+    """
+
+    def __init__(self, torrents, keymap, table, ffilter, expanded):
         self._filewidgetcls = keymap.wrap(FileItemWidget, context='file')
         self._table = table
         self._ffilter = ffilter
+        self._expanded = expanded
+        self._torrents = torrents
+        self._filecount = None
         self._widgets = {}
-        self._filtered_counts = {}
-        forest = self._create_file_forest(torrents)
-        super().__init__(forest, indent=2)
+        self._namecells = {}    # (torrent ID, path) -> Filename cell of directory
+        self._summaries = {}    # (torrent ID, path) -> DirectorySummary
+        self._file_values = {}  # File ID -> values in summaries
+        self._positions = None  # Visible positions in display order
+        self._indexes = None    # Visible position -> index in _positions
+        filetree = _LazyFileTree(self._create_file_forest(torrents),
+                                 is_expanded=self._is_expanded)
+        super().__init__(filetree, indent=2)
 
     def _file_is_filtered(self, tfile):
         if self._ffilter is None:
@@ -46,51 +153,111 @@ class FileTreeDecorator(ArrowTree):
             return not self._ffilter.match(tfile)
 
     def _create_file_forest(self, torrents):
-        # Create a list of nested trees in SimpleTree format.  But the leaves
-        # are mappings instead of widgets.  Each mapping contains the
-        # information that the `decorate` method needs to create a widget.
-
-        def create_tree(node, content):
-            if content.nodetype == 'leaf':
-                # Torrent has a single file and no directories
-                if not self._file_is_filtered(content):
-                    return (content, None)
-                else:
-                    return None
-
-            elif content.nodetype == 'parent':
-                # Torrent has at least one directory
-                tree = []
-                filtered_count = 0
-                for k,v in sorted(content.items(), key=lambda pair: pair[0].lower()):
-                    if v.nodetype == 'leaf':
-                        if not self._file_is_filtered(v):
-                            tree.append((v, None))
-                            nonlocal fcount
-                            fcount += 1
-                        else:
-                            filtered_count += 1
-                    elif v.nodetype == 'parent':
-                        dirnode = create_directory_data(name=k, tree=v)
-                        tree.append(create_tree(dirnode, v))
-
-                self._filtered_counts[node['id']] = filtered_count
-                node['name'] = create_directory_name(node['name'], filtered_count)
-                return (node, tree or None)
-
-        fcount = 0
+        # Create a list of top-level _FileNodes, one for each torrent.  Their
+        # contents are created when they are expanded.
         forest = []  # Multiple trees as siblings
         for t in sorted(torrents, key=lambda t: t['name'].lower()):
             filetree = t['files']
             # This works because t['files'] always has 1 item: the torrent's name
             rootnodename = next(iter(filetree.keys()))
-            rootnode = create_directory_data(rootnodename, tree=filetree)
-            tree = create_tree(rootnode, filetree[rootnodename])
-            if tree is not None:
-                forest.append(tree)
-        self.filecount = fcount
+            node = self._create_node(rootnodename, filetree[rootnodename], datatree=filetree)
+            if node is not None:
+                forest.append(node)
         return forest
 
+    def _create_node(self, name, content, datatree=None):
+        if content.nodetype == 'leaf':
+            if not self._file_is_filtered(content):
+                return _FileNode(content)
+            else:
+                return None
+
+        elif content.nodetype == 'parent':
+            # The number of filtered files is displayed in the directory name
+            filtered_count = sum(1 for v in content.values()
+                                 if v.nodetype == 'leaf' and self._file_is_filtered(v))
+            data = self._create_directory_data(name, datatree or content, filtered_count)
+            return _FileNode(data, lambda: self._create_children(content))
+
+    def _create_directory_data(self, name, tree, filtered_count):
+        # Files are added with the values that the other summaries have seen
+        # so that all summaries are consistent when they are updated
+        file_values = self._file_values
+        summary = DirectorySummary(name, tree.path, filtered_count)
+        for f in tree.files:
+            values = file_values.get(f['id'])
+            if values is None:
+                values = file_values[f['id']] = summary.file_values(f)
+            summary.add(f, values)
+        self._summaries[(summary.tid, summary.path)] = summary
+        return summary.data
+
+    def _create_children(self, content):
+        children = []
+        for k,v in sorted(content.items(), key=lambda pair: pair[0].lower()):
+            node = self._create_node(k, v)
+            if node is not None:
+                children.append(node)
+        return children
+
+    def _is_expanded(self, data):
+        return (data['tid'], data['path']) in self._expanded
+
+    def toggle_expanded(self, pos):
+        """Expand or collapse directory at `pos`
+
+        Return True if `pos` is a directory, False otherwise.
+        """
+        data = self._tree[pos]
+        if data.nodetype != 'parent':
+            return False
+        key = (data['tid'], data['path'])
+        if key in self._expanded:
+            self._expanded.remove(key)
+        else:
+            self._expanded.add(key)
+        self._positions = self._indexes = None
+
+        namecell = self._namecells.get(key)
+        if namecell is not None:
+            namecell.is_expanded = key in self._expanded
+            namecell.update(namecell.data)
+        return True
+
+    def _get_positions(self):
+        # Visible positions only change when directories are expanded or
+        # collapsed, so we can keep them around until then
+        if self._positions is None:
+            self._positions = tuple(self.positions())
+            self._indexes = {pos:i for i,pos in enumerate(self._positions)}
+        return self._positions
+
+    def get_index(self, pos):
+        """Return index of visible position `pos` in display order"""
+        self._get_positions()
+        return self._indexes[pos]
+
+    def get_position(self, index):
+        """Return visible position at `index` in display order"""
+        return self._get_positions()[index]
+
+    @property
+    def visible_count(self):
+        """Number of visible files and directories"""
+        return len(self._get_positions())
+
+    def child_positions(self, pos):
+        """Yield positions of all children of `pos`, expanded or not"""
+        yield from self._tree.child_positions(pos)
+
+    @property
+    def filecount(self):
+        """Number of files that are not filtered"""
+        if self._filecount is None:
+            self._filecount = sum(1 for t in self._torrents for f in t['files'].files
+                                  if not self._file_is_filtered(f))
+        return self._filecount
+
     def decorate(self, pos, data, is_first=True):
         # We can use the tree position as table ID
         self._table.register(pos)
@@ -99,20 +266,41 @@ class FileTreeDecorator(ArrowTree):
         # We use parent's decorate() method to give the name column a tree
         # structure.  But we also need the original update() method so we can
         # apply new data to the widget.  This is dirty but it works.
+        key = self._get_widget_key(data)
         if row.exists('name'):
-            update_method = row.name.update
-            decowidget = super().decorate(pos, row.name, is_first=is_first)
+            namecell = row.name
+            if data.nodetype == 'parent':
+                # Name cell shows whether directory is expanded
+                namecell.is_expanded = self._is_expanded(data)
+                self._namecells[key] = namecell
+            update_method = namecell.update
+            decowidget = super().decorate(pos, namecell, is_first=is_first)
             decowidget.update = update_method
             row.replace('name', decowidget)
 
+        # Directory data in the tree may be older than its summary
+        if key in self._summaries:
+            data = self._summaries[key].data
+
         # Wrap the whole row in a FileItemWidget with keymapping.  This also
         # applies all the other values besides the name (size, progress, etc).
         file_widget = self._filewidgetcls(data, row)
-        self._widgets[data['id']] = file_widget
+        self._widgets[key] = file_widget
         return file_widget
 
+    @staticmethod
+    def _get_widget_key(data):
+        # Directory IDs are tuples of all file IDs, which are expensive to hash
+        if data.nodetype == 'leaf':
+            return data['id']
+        else:
+            return (data['tid'], data['path'])
+
     def update(self, torrents):
         widgets = self._widgets
+        summaries = self._summaries
+        file_values = self._file_values
+        changed_dirs = set()
         for t in torrents:
             tid = t['id']
 
@@ -123,14 +311,30 @@ class FileTreeDecorator(ArrowTree):
                 if node_id in widgets:
                     widgets[node_id].update(f)
 
-            # Update directory nodes
-            for name,content in t['files'].directories:
-                node_id = content.id
-                if node_id in widgets:
-                    filtered_count = self._filtered_counts[node_id]
-                    data = create_directory_data(name, tree=content,
-                                                 filtered_count=filtered_count)
-                    widgets[node_id].update(data)
+                # Apply changes to the summaries of all ancestor directories
+                old_values = file_values.get(node_id)
+                if old_values is not None:
+                    new_values = DirectorySummary.file_values(f)
+                    if new_values != old_values:
+                        file_values[node_id] = new_values
+                        for key in self._get_ancestor_keys(tid, f['path']):
+                            summary = summaries.get(key)
+                            if summary is not None:
+                                summary.change(old_values, new_values)
+                                changed_dirs.add(key)
+
+        # Update directory nodes
+        for key in changed_dirs:
+            if key in widgets:
+                widgets[key].update(summaries[key].data)
+
+    @staticmethod
+    def _get_ancestor_keys(tid, path):
+        # Top-level directories have the path of the whole file tree ('')
+        yield (tid, '')
+        parts = path.split(os.sep)
+        for i in range(1, len(parts)+1):
+            yield (tid, os.sep.join(parts[:i]))
 
     @property
     def widgets(self):
@@ -173,11 +377,11 @@ class FileListWidget(ListWidgetBase):
         self._ffilter = ffilter
         self._initialized = False
         self._torrents = None
+        self._filetree = None
+        self._expanded = set()  # (torrent ID, path) of expanded directories
 
-        self._poller = self._srvapi.create_poller(
-            self._srvapi.torrent.torrents, tfilter, keys=('files', 'name')
-        )
-        self._poller.on_response(self._handle_files)
+        self._poller = None
+        self._subscribe()
 
     def _handle_files(self, response):
         if response is None or not response.torrents:
@@ -193,11 +397,14 @@ class FileListWidget(ListWidgetBase):
         self.clear()
         if torrents:
             self._filetree = FileTreeDecorator(torrents, self._keymap,
-                                               self._table, self._ffilter)
+                                               self._table, self._ffilter,
+                                               expanded=self._expanded)
             self._listbox.body = urwidtrees.widgets.TreeListWalker(self._filetree)
             self._listbox._invalidate()
             self._initialized = True
             self._torrents = torrents
+            if self._focus_to_restore is not None:
+                self._restore_focus()
 
     def _update_listitems(self, torrents=()):
         if torrents:
@@ -225,30 +432,65 @@ class FileListWidget(ListWidgetBase):
         self._listbox.body = urwid.SimpleListWalker([])
         self._listbox._invalidate()
         self._initialized = False
+        self._filetree = None
         self._table.clear()
         self._marked.clear()
 
+    def _item_widgets(self):
+        if self._filetree is not None:
+            return tuple(self._filetree.widgets)
+        return ()
+
+    def keypress(self, size, key):
+        key = super().keypress(size, key)
+        if key is not None and self._command_map[key] == urwid.ACTIVATE:
+            if self._filetree is not None and self.focused_widget is not None:
+                if self._filetree.toggle_expanded(self._listbox.focus_position):
+                    self._listbox.body._modified()
+                    self._invalidate()
+                    return None
+        return key
+
     def refresh(self):
-        self._poller.poll()
+        if self._poller is not None:
+            self._poller.poll()
+
+    def _subscribe(self):
+        self._poller = self._srvapi.create_poller(
+            self._srvapi.torrent.torrents, self._tfilter, keys=('files', 'name')
+        )
+        self._poller.on_response(self._handle_files)
+
+    def _unsubscribe(self):
+        self._poller.remove_callback(self._handle_files)
+        self._poller = None
+        self._srvapi.manage_pollers_now()
 
     @property
     def count(self):
-        return self._filetree.filecount if hasattr(self, '_filetree') else 0
+        return self._filetree.filecount if self._filetree is not None else 0
 
     @property
     def focus_position(self):
-        positions = tuple(self._filetree.positions())
-        return positions.index(self._listbox.focus_position)
+        if self._filetree is None:
+            raise IndexError('No focus_position, file list is empty')
+        return self._filetree.get_index(self._listbox.focus_position)
 
     @focus_position.setter
     def focus_position(self, focus_position):
-        positions = tuple(self._filetree.positions())
-        i = min(focus_position, len(positions)-1)
+        if self._filetree is None:
+            return
+        i = min(focus_position, self._filetree.visible_count-1)
         try:
-            self._listbox.focus_position = positions[i]
+            self._listbox.focus_position = self._filetree.get_position(i)
         except KeyError:
             pass
 
+    def _position_of_id(self, id):
+        # Files don't move around in their tree, so the focus is restored by
+        # position
+        return None
+
     @property
     def focused_file_ids(self):
         """File IDs of the focused files in a tuple"""
@@ -263,6 +505,22 @@ class FileListWidget(ListWidgetBase):
             else:
                 return focused.id
 
+    @property
+    def marked_ids(self):
+        """Tuple of IDs of marked files"""
+        return tuple(widget.id for widget in self._marked)
+
+    @property
+    def marked(self):
+        """Generator that yields data of marked files"""
+        for widget in tuple(self._marked):
+            yield widget.data
+
+    @property
+    def marked_torrent_ids(self):
+        """Tuple of torrent IDs of marked files"""
+        return tuple(set(widget.torrent_id for widget in self._marked))
+
     @property
     def focused_torrent_id(self):
         """Torrent ID of the currently focused file or `None`"""
@@ -272,12 +530,15 @@ class FileListWidget(ListWidgetBase):
 
 
     def all_children(self, pos):
-        """Yield (position, widget) tuples of all sub-nodes (leaves and parents)"""
+        """
+        Yield (position, widget) tuples of all sub-nodes (leaves and parents),
+        including those in collapsed directories
+        """
         ft = self._filetree
         lb = self._listbox
         def recurse(subpos):
             widget = lb.body[subpos]
-            if ft.is_leaf(subpos):
+            if widget.nodetype == 'leaf':
                 yield (subpos, widget)
             else:
                 # Yield sub-parent nodes, but not the starting node that was
@@ -285,10 +546,8 @@ class FileListWidget(ListWidgetBase):
                 if subpos != pos:
                     yield (subpos, widget)
 
-                new_subpos = ft.first_child_position(subpos)
-                while new_subpos is not None:
+                for new_subpos in ft.child_positions(subpos):
                     yield from recurse(new_subpos)
-                    new_subpos = ft.next_sibling_position(new_subpos)
 
         yield from recurse(pos)
 
@@ -318,9 +577,10 @@ class FileListWidget(ListWidgetBase):
 
         if all:
             # Top ancestor node positions are (0,), (1,), (3,) etc
-            for pos in self._filetree.positions():
-                if len(pos) == 1:
-                    mark_leaves(pos, mark)
+            pos = self._filetree.root
+            while pos is not None:
+                mark_leaves(pos, mark)
+                pos = self._filetree.next_sibling_position(pos)
         else:
             mark_leaves(self._listbox.focus_position, mark)
         assert builtins.all(m.nodetype == 'leaf' for m in self._marked)
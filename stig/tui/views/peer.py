@@ -36,6 +36,7 @@ class Client(_COLUMNS['client'], CellWidgetBase):
                   extras=('header',))
     header = urwid.AttrMap(ColumnHeaderWidget(**_COLUMNS['client'].header),
                            style.attrs('header'))
+    may_have_wide_chars = True
 
 TUICOLUMNS['client'] = Client
 
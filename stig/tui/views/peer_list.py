@@ -31,6 +31,7 @@ class PeerListWidget(ListWidgetBase):
     keymap_context  = 'peer'
     palette_name    = 'peerlist'
     focusable_items = False
+    flat_rows_supported = True
 
     def __init__(self, srvapi, keymap, tfilter=None, pfilter=None, columns=None, sort=None, title=None):
         super().__init__(srvapi, keymap, columns=columns, sort=sort, title=title)
@@ -46,10 +47,8 @@ class PeerListWidget(ListWidgetBase):
                 yield from peers
         self._maybe_filter_peers = filter_peers
 
-        self._poller = self._srvapi.create_poller(
-            self._srvapi.torrent.torrents, tfilter, keys=('peers', 'name', 'id')
-        )
-        self._poller.on_response(self._handle_peers)
+        self._poller = None
+        self._subscribe()
 
     def _handle_peers(self, response):
         if response is None or not response.torrents:
@@ -69,7 +68,19 @@ class PeerListWidget(ListWidgetBase):
         self._invalidate()
 
     def refresh(self):
-        self._poller.poll()
+        if self._poller is not None:
+            self._poller.poll()
+
+    def _subscribe(self):
+        self._poller = self._srvapi.create_poller(
+            self._srvapi.torrent.torrents, self._tfilter, keys=('peers', 'name', 'id')
+        )
+        self._poller.on_response(self._handle_peers)
+
+    def _unsubscribe(self):
+        self._poller.remove_callback(self._handle_peers)
+        self._poller = None
+        self._srvapi.manage_pollers_now()
 
     @property
     def sort(self):
@@ -78,4 +89,4 @@ class PeerListWidget(ListWidgetBase):
     @sort.setter
     def sort(self, sort):
         ListWidgetBase.sort.fset(self, sort)
-        self._poller.poll()
+        self.refresh()
@@ -163,6 +163,7 @@ class SettingListWidget(ListWidgetBase):
     keymap_context  = 'setting'
     palette_name    = 'settinglist'
     focusable_items = True
+    item_rows       = None
 
     def __init__(self, srvapi, keymap, sort=None, columns=('name', 'value', 'description')):
         super().__init__(srvapi, keymap, title='Settings', columns=columns)
@@ -185,6 +186,10 @@ class SettingListWidget(ListWidgetBase):
     def refresh(self):
         remotecfg.poll()
 
+    def _subscribe(self):
+        # Settings are always monitored, but we must get them again
+        self._handle_update()
+
     @property
     def sort(self):
         return self._sort
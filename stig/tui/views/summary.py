@@ -43,7 +43,12 @@ def mksection(title, width, items):
 
         def update(self, torrent):
             for item,value_w in self._value_widgets.items():
-                value_w.set_text(item.human_readable(torrent))
+                # Values of keys that weren't requested yet are missing
+                if all(key in torrent for key in item.needed_keys):
+                    text = item.human_readable(torrent)
+                    # set_text() invalidates even if the text didn't change
+                    if text != value_w.text:
+                        value_w.set_text(text)
 
     return Section
 
@@ -55,10 +60,23 @@ for section in SECTIONS:
     _sections.append(sectionw)
 
 
+# Keys that are expensive to request are only requested every HEAVY_INTERVAL
+# polls
+HEAVY_KEYS = frozenset(('files',))
+HEAVY_INTERVAL = 10
+
 class TorrentSummaryWidget(urwid.WidgetWrap):
+    """
+    Sections that are scrolled out of view don't request their values and
+    aren't updated
+    """
+
     def __init__(self, srvapi, tid, title=None):
         self._title = title
+        self.title_updater = None
         self._torrent = {}
+        self._srvapi = srvapi
+        self._tid = tid
 
         sections = []
         self._sections = {}
@@ -73,26 +91,50 @@ class TorrentSummaryWidget(urwid.WidgetWrap):
             return urwid.Pile([('pack', header), section])
 
         grid = urwid.GridFlow([], cell_width=1, h_sep=3, v_sep=1, align='left')
+        self._wrapped_sections = {}
         for section in sections:
             opts = grid.options('given', section.width)
             section_wrapped = add_title(section.title, section)
+            self._wrapped_sections[section_wrapped] = section
             grid.contents.append((section_wrapped, opts))
+        self._grid = grid
+        self._scrollable = Scrollable(grid)
+        self._scrollbar = ScrollBar(urwid.AttrMap(self._scrollable, 'torrentsummary'))
+        super().__init__(urwid.AttrMap(self._scrollbar, 'scrollbar'))
 
-        grid_sb = urwid.AttrMap(
-            ScrollBar(urwid.AttrMap(Scrollable(grid), 'torrentsummary')),
-            'scrollbar'
-        )
-        super().__init__(grid_sb)
+        # All sections are visible until we know better
+        self._all_sections = self._visible_sections = tuple(sections)
+        self._polls = 0
+        self._visibility_handle = None
+        self._newly_visible = False
 
         # Register new request in request pool
-        keys = set(('name',)).union(key for w in sections for key in w.needed_keys)
-        self._poller = srvapi.create_poller(srvapi.torrent.torrents, (tid,), keys=keys)
+        self._keys = self._get_needed_keys()
+        self._poller = srvapi.create_poller(srvapi.torrent.torrents, (tid,), keys=self._keys)
         self._poller.on_response(self._handle_response)
 
+    def _get_needed_keys(self):
+        keys = set(('name',)).union(key for w in self._visible_sections
+                                    for key in w.needed_keys)
+        # Request heavy keys only if we don't have them yet or at every
+        # HEAVY_INTERVAL-th poll
+        for key in keys.intersection(HEAVY_KEYS):
+            if key in self._torrent and self._polls % HEAVY_INTERVAL != 0:
+                keys.remove(key)
+        return tuple(sorted(keys))
+
+    def _update_request(self):
+        keys = self._get_needed_keys()
+        if keys != self._keys:
+            self._keys = keys
+            self._poller.set_request(self._srvapi.torrent.torrents, (self._tid,), keys=keys)
+            return True
+        return False
+
     def _handle_response(self, response):
         if response is not None and response.success:
             self._torrent = response.torrents[0]
-            for w in self._sections.values():
+            for w in self._visible_sections:
                 w.update(self._torrent)
 
             # Set new tab title if necessary
@@ -100,6 +142,70 @@ class TorrentSummaryWidget(urwid.WidgetWrap):
                 self.title_updater(self.title)
         else:
             self._torrent = {}
+        self._polls += 1
+        self._update_request()
+
+    def render(self, size, focus=False):
+        canv = super().render(size, focus)
+        visible_sections = self._get_visible_sections(size)
+        if visible_sections != self._visible_sections:
+            newly_visible = set(visible_sections).difference(self._visible_sections)
+            self._visible_sections = visible_sections
+            # Show what we know until fresh values arrive
+            for w in newly_visible:
+                w.update(self._torrent)
+            if newly_visible:
+                canv = super().render(size, focus)
+            # Change the request outside of rendering
+            if self._visibility_handle is None:
+                self._visibility_handle = self._srvapi.loop.call_soon(self._handle_visibility_change)
+            self._newly_visible = self._newly_visible or bool(newly_visible)
+        return canv
+
+    def _handle_visibility_change(self):
+        self._visibility_handle = None
+        self._update_request()
+        # Values of newly visible sections are missing or outdated
+        if self._newly_visible:
+            self._newly_visible = False
+            self._poller.poll()
+
+    def _get_visible_sections(self, size):
+        maxcol, maxrow = size
+        # The scrollbar takes some columns if not everything fits
+        if self._scrollable.rows_max((maxcol, maxrow)) > maxrow:
+            maxcol -= self._scrollbar.scrollbar_width
+        top = self._scrollable.get_scrollpos()
+        bottom = top + maxrow
+
+        # GridFlow displays its cells as a Pile of Padding(Columns) and
+        # Dividers.  This is not public API, so we treat all sections as
+        # visible if we don't find any of them.
+        display_widget = self._grid.get_display_widget((maxcol,))
+        if not isinstance(display_widget, urwid.Pile):
+            log.debug('Unexpected GridFlow display widget: %r', display_widget)
+            return self._all_sections
+        visible_sections = []
+        found_sections = False
+        row = 0
+        for w,_ in display_widget.contents:
+            rows = w.rows((maxcol,))
+            if isinstance(w, urwid.Padding):
+                cells = w.original_widget
+                if isinstance(cells, urwid.Columns):
+                    cells = [cell for cell,_ in cells.contents]
+                else:
+                    cells = [cells]
+                sections = [self._wrapped_sections[cell] for cell in cells
+                            if cell in self._wrapped_sections]
+                found_sections = found_sections or bool(sections)
+                if row < bottom and row + rows > top:
+                    visible_sections.extend(sections)
+            row += rows
+        if not found_sections:
+            log.debug('No sections found in GridFlow display widget: %r', display_widget)
+            return self._all_sections
+        return tuple(visible_sections)
 
     @property
     def title(self):
@@ -10,8 +10,9 @@
 # http://www.gnu.org/licenses/gpl-3.0.txt
 
 import urwid
+from urwid.util import calc_text_pos
 
-from ..table import ColumnHeaderWidget
+from ..table import (ColumnHeaderWidget, fit_text)
 from . import (Style, CellWidgetBase)
 from ...views.torrent import COLUMNS as _COLUMNS
 from ...client import ttypes
@@ -263,6 +264,7 @@ class Tracker(_COLUMNS['tracker'], CellWidgetBase):
                   extras=('header',))
     header = urwid.AttrMap(ColumnHeaderWidget(**_COLUMNS['tracker'].header),
                            style.attrs('header'))
+    may_have_wide_chars = True
 
 TUICOLUMNS['tracker'] = Tracker
 
@@ -272,6 +274,7 @@ class Error(_COLUMNS['error'], CellWidgetBase):
                   extras=('header',))
     header = urwid.AttrMap(ColumnHeaderWidget(**_COLUMNS['error'].header),
                            style.attrs('header'))
+    may_have_wide_chars = True
 
 TUICOLUMNS['error'] = Error
 
@@ -351,23 +354,32 @@ class TorrentName(_COLUMNS['name'], CellWidgetBase):
         if new_status != self.status:
             self.status = new_status
             self._invalidate()
+            return True
+        return False
 
     def render(self, size, focus=False):
         (maxcol,) = size
+        self.text.set_text(self._make_markup(maxcol, focus))
+        return super().render(size, focus)
+
+    def markup(self, width):
+        return self._make_markup(width, focus=False)
+
+    def _make_markup(self, maxcol, focus):
         name, mode, progress = self.status
-        name = name[:maxcol].ljust(maxcol, ' ')  # Expand/Shrink name to full width
+        name = fit_text(name, maxcol, 'left', wide_chars=True)  # Expand/Shrink name to full width
         if progress == 100:
             attrs = self.style.attrs(mode+'.complete', focused=focus)
-            self.text.set_text((attrs, name))
+            return [(attrs, name)]
         else:
             completed_col = int(maxcol * progress / 100)  # Width of first part of progress bar
-            name1 = name[:completed_col]
-            name2 = name[completed_col:]
+            split, _ = calc_text_pos(name, 0, len(name), completed_col)
+            name1 = name[:split]
+            name2 = name[split:]
             attrs1 = self.style.attrs(mode+'.progress1', focused=focus)
             attrs2 = self.style.attrs(mode+'.progress2', focused=focus)
-            self.text.set_text([(attrs1, name1),
-                                (attrs2, name2)])
-        return super().render(size, focus)
+            return [(attrs1, name1),
+                    (attrs2, name2)]
 
     def get_mode(self):
         return self.status[1]
@@ -14,6 +14,8 @@ log = make_logger(__name__)
 
 from .torrent import TUICOLUMNS
 from . import (ItemWidgetBase, ListWidgetBase, stringify_torrent_filter)
+from ...client import TorrentFilter
+from ...client.filters import IncrementalFilter
 
 
 class TorrentItemWidget(ItemWidgetBase):
@@ -38,10 +40,13 @@ class TorrentListWidget(ListWidgetBase):
     keymap_context  = 'torrent'
     palette_name    = 'torrentlist'
     focusable_items = True
+    flat_rows_supported = True
 
     def __init__(self, srvapi, keymap, tfilter=None, sort=None, columns=None, title=None):
         super().__init__(srvapi, keymap, columns=columns, sort=sort, title=title)
         self._tfilter = tfilter
+        self._livefilter = None
+        self._livefilter_results = IncrementalFilter()
         self._register_request()
 
     @property
@@ -56,8 +61,11 @@ class TorrentListWidget(ListWidgetBase):
             keys.extend(self._sort.needed_keys)
         if hasattr(self._tfilter, 'needed_keys'):
             keys.extend(self._tfilter.needed_keys)
+        if self._livefilter is not None:
+            keys.extend(self._livefilter.needed_keys)
         for colname in self.columns:
             keys.extend(self.tuicolumns[colname].needed_keys)
+        self._registered_keys = set(keys)
 
         # Register new request in request pool
         log.debug('Registering keys for %r: %s', self, keys)
@@ -78,17 +86,68 @@ class TorrentListWidget(ListWidgetBase):
         # Auto-generate title from our filters if not set
         if self._title_name is None:
             self._title_name = stringify_torrent_filter(self._tfilter, torrents)
+        self._livefilter_results.objects = torrents
+        self._update_data_dict()
+
+    def _update_data_dict(self):
+        if self._livefilter is None:
+            torrents = self._livefilter_results.objects
+        else:
+            torrents = self._livefilter_results.apply(self._livefilter)
         self._data_dict = {t['id']:t for t in torrents}
         self._invalidate()
 
+    @property
+    def livefilter(self):
+        """TorrentFilter that is applied locally to the listed torrents or `None`
+
+        This is meant to be changed frequently, e.g. while the user is typing.
+        Narrowing the previous live filter only filters the previous result.
+
+        Raises ValueError if set to an invalid filter string.
+        """
+        return self._livefilter
+
+    @livefilter.setter
+    def livefilter(self, livefilter):
+        if livefilter is not None and not isinstance(livefilter, TorrentFilter):
+            livefilter = TorrentFilter(livefilter)
+        if livefilter == self._livefilter:
+            return
+        self._livefilter = livefilter
+
+        if livefilter is not None and not self._registered_keys.issuperset(livefilter.needed_keys):
+            # Our torrents don't provide all needed values yet; _handle_torrents
+            # applies the new filter when they arrive.
+            self._srvapi.treqpool.remove(self.id)
+            self._register_request()
+            self._invalidate()  # Update title
+        else:
+            self._update_data_dict()
+
+    @property
+    def title(self):
+        title = super().title
+        if self._livefilter is not None:
+            title += ' /%s' % self._livefilter
+        return title
+
     def clear(self):
-        for w in self._listbox.body:
-            w.data.clearcache()
+        for torrent in self._listbox.body.values():
+            torrent.clearcache()
         super().clear()
 
     def refresh(self):
         self._srvapi.treqpool.poll()
 
+    def _subscribe(self):
+        self._register_request()
+
+    def _unsubscribe(self):
+        self._srvapi.treqpool.remove(self.id)
+        # Don't keep torrents for the live filter while hibernating
+        self._livefilter_results.objects = ()
+
     @property
     def sort(self):
         return self._sort
@@ -99,6 +158,11 @@ class TorrentListWidget(ListWidgetBase):
         ListWidgetBase.sort.fset(self, sort)
         self._register_request()
 
+    @property
+    def marked_torrent_ids(self):
+        """Tuple of torrent IDs of marked torrents"""
+        return self.marked_ids
+
     @property
     def focused_torrent_id(self):
         """Torrent ID of the currently focused torrent or `None`"""
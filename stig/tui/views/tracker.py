@@ -45,6 +45,7 @@ class Domain(_COLUMNS['domain'], CellWidgetBase):
                   extras=('header',))
     header = urwid.AttrMap(ColumnHeaderWidget(**_COLUMNS['domain'].header),
                            style.attrs('header'))
+    may_have_wide_chars = True
 
 TUICOLUMNS['domain'] = Domain
 
@@ -55,6 +56,7 @@ class AnnounceURL(_COLUMNS['url-announce'], CellWidgetBase):
                   extras=('header',))
     header = urwid.AttrMap(ColumnHeaderWidget(**_COLUMNS['url-announce'].header),
                            style.attrs('header'))
+    may_have_wide_chars = True
 
 TUICOLUMNS['url-announce'] = AnnounceURL
 
@@ -65,6 +67,7 @@ class ScrapeURL(_COLUMNS['url-scrape'], CellWidgetBase):
                   extras=('header',))
     header = urwid.AttrMap(ColumnHeaderWidget(**_COLUMNS['url-scrape'].header),
                            style.attrs('header'))
+    may_have_wide_chars = True
 
 TUICOLUMNS['url-scrape'] = ScrapeURL
 
@@ -84,6 +87,7 @@ class Error(_COLUMNS['error'], CellWidgetBase):
                   extras=('header',))
     header = urwid.AttrMap(ColumnHeaderWidget(**_COLUMNS['error'].header),
                            style.attrs('header'))
+    may_have_wide_chars = True
 
 TUICOLUMNS['error'] = Error
 
@@ -94,6 +98,7 @@ class ErrorAnnounce(_COLUMNS['error-announce'], CellWidgetBase):
                   extras=('header',))
     header = urwid.AttrMap(ColumnHeaderWidget(**_COLUMNS['error-announce'].header),
                            style.attrs('header'))
+    may_have_wide_chars = True
 
 TUICOLUMNS['error-announce'] = ErrorAnnounce
 
@@ -104,6 +109,7 @@ class ErrorScrape(_COLUMNS['error-scrape'], CellWidgetBase):
                   extras=('header',))
     header = urwid.AttrMap(ColumnHeaderWidget(**_COLUMNS['error-scrape'].header),
                            style.attrs('header'))
+    may_have_wide_chars = True
 
 TUICOLUMNS['error-scrape'] = ErrorScrape
 
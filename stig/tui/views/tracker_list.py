@@ -35,6 +35,7 @@ class TrackerListWidget(ListWidgetBase):
     keymap_context  = 'tracker'
     palette_name    = 'trackerlist'
     focusable_items = True
+    flat_rows_supported = True
 
     def __init__(self, srvapi, keymap, torfilter, trkfilter, columns=None, sort=None, title=None):
         super().__init__(srvapi, keymap, columns=columns, sort=sort, title=title)
@@ -50,10 +51,8 @@ class TrackerListWidget(ListWidgetBase):
                 yield from trackers
         self._maybe_filter_trackers = filter_trackers
 
-        self._poller = self._srvapi.create_poller(
-            self._srvapi.torrent.torrents, torfilter, keys=('trackers', 'name', 'id')
-        )
-        self._poller.on_response(self._handle_trackers)
+        self._poller = None
+        self._subscribe()
 
     def _handle_trackers(self, response):
         if response is None or not response.torrents:
@@ -73,7 +72,19 @@ class TrackerListWidget(ListWidgetBase):
         self._invalidate()
 
     def refresh(self):
-        self._poller.poll()
+        if self._poller is not None:
+            self._poller.poll()
+
+    def _subscribe(self):
+        self._poller = self._srvapi.create_poller(
+            self._srvapi.torrent.torrents, self._torfilter, keys=('trackers', 'name', 'id')
+        )
+        self._poller.on_response(self._handle_trackers)
+
+    def _unsubscribe(self):
+        self._poller.remove_callback(self._handle_trackers)
+        self._poller = None
+        self._srvapi.manage_pollers_now()
 
     @property
     def sort(self):
@@ -82,7 +93,7 @@ class TrackerListWidget(ListWidgetBase):
     @sort.setter
     def sort(self, sort):
         ListWidgetBase.sort.fset(self, sort)
-        self._poller.poll()
+        self.refresh()
 
     @property
     def focused_torrent_id(self):
@@ -16,6 +16,8 @@ log = make_logger(__name__)
 
 from . import (ColumnBase, _ensure_hide_unit)
 
+from collections import Counter
+
 
 COLUMNS = {}
 ALIASES = { 'dn'   : 'downloaded',
@@ -111,42 +113,108 @@ class TorrentFileDirectory(dict):
     def __repr__(self):
         return '<{} {!r}>'.format(type(self).__name__, self['path'])
 
+class DirectorySummary():
+    """Running totals of the TorrentFiles in a directory
+
+    Files are added with `add` and changes of their values are applied with
+    `change`, so the totals don't have to be computed from all files again.
+    The `values` of a file are returned by `file_values`.
+    """
+
+    def __init__(self, name, path, filtered_count=0):
+        self._name = create_directory_name(name, filtered_count)
+        self._path = path
+        self._tid = None
+        self._ids = []
+        self._id = None
+        self._size_downloaded = 0
+        self._size_total = 0
+        self._priorities = Counter()
+        self._size_args = None
+        self._progress_cls = None
+        self._data = None
+
+    @staticmethod
+    def file_values(tfile):
+        """Return the values of `tfile` that are summarized as a tuple"""
+        return (float(tfile['size-downloaded']), float(tfile['size-total']),
+                tfile['priority'])
+
+    def add(self, tfile, values=None):
+        """Add TorrentFile `tfile` with `values` or its current values"""
+        if values is None:
+            values = self.file_values(tfile)
+        if not self._ids:
+            # Preserve the original types (Float, Percent)
+            size = tfile['size-total']
+            self._size_args = (type(size), size.unit, size.prefix)
+            self._progress_cls = type(tfile['progress'])
+            self._tid = tfile['tid']
+        self._ids.append(tfile['id'])
+        self._id = None
+        self._apply(values, 1)
+
+    def change(self, old_values, new_values):
+        """Replace a file's `old_values` with its `new_values`"""
+        self._apply(old_values, -1)
+        self._apply(new_values, 1)
+
+    def _apply(self, values, sign):
+        size_downloaded, size_total, priority = values
+        self._size_downloaded += sign * size_downloaded
+        self._size_total += sign * size_total
+        priorities = self._priorities
+        priorities[priority] += sign
+        if priorities[priority] <= 0:
+            del priorities[priority]
+        self._data = None
+
+    @property
+    def tid(self):
+        return self._tid
+
+    @property
+    def path(self):
+        return self._path
+
+    @property
+    def data(self):
+        """
+        TorrentFileDirectory with the same keys as a TorrentFile instance
+
+        Each value summarizes the values of all added files.
+        """
+        if self._data is None:
+            size_cls, unit, prefix = self._size_args
+            data = {'size-downloaded': size_cls(self._size_downloaded, unit=unit, prefix=prefix),
+                    'size-total': size_cls(self._size_total, unit=unit, prefix=prefix),
+                    'is-wanted': True}
+
+            priorities = self._priorities
+            data['priority'] = next(iter(priorities)) if len(priorities) == 1 else ''
+            data['name'] = self._name
+
+            try:
+                data['progress'] = self._progress_cls(self._size_downloaded / self._size_total * 100)
+            except ZeroDivisionError:
+                data['progress'] = self._progress_cls(0)
+            if self._id is None:
+                self._id = tuple(self._ids)
+            data['tid'] = self._tid
+            data['id'] = self._id
+            data['path'] = self._path
+            self._data = TorrentFileDirectory(data)
+        return self._data
+
+
 def create_directory_data(name, tree, filtered_count=0):
     # Create a mapping that has the same keys as a TorrentFile instance.
     # Each value recursively summarizes the values of all the TorrentFiles
     # in `tree`.
-
-    tfiles = tuple(tree.files)
-
-    def sum_size(tfiles, key):
-        sizes = tuple(tfile[key] for tfile in tfiles)
-        # Preserve the original type (Float)
-        first_size = sizes[0]
-        start_value = type(first_size)(0, unit=first_size.unit, prefix=first_size.prefix)
-        return sum(sizes, start_value)
-
-    def sum_priority(tfiles):
-        if len(set(tfile['priority'] for tfile in tfiles)) == 1:
-            return tfiles[0]['priority']
-        else:
-            return ''
-
-    data = {'size-downloaded': sum_size(tfiles, 'size-downloaded'),
-            'size-total': sum_size(tfiles, 'size-total'),
-            'priority': sum_priority(tfiles),
-            'is-wanted': True}
-
-    data['name'] = create_directory_name(name, filtered_count)
-
-    progress_cls = type(tfiles[0]['progress'])
-    try:
-        data['progress'] = progress_cls(data['size-downloaded'] / data['size-total'] * 100)
-    except ZeroDivisionError:
-        data['progress'] = progress_cls(0)
-    data['tid'] = tfiles[0]['tid']
-    data['id'] = tuple(tf['id'] for tf in tfiles)
-    data['path'] = tree.path
-    return TorrentFileDirectory(data)
+    summary = DirectorySummary(name, tree.path, filtered_count)
+    for tfile in tree.files:
+        summary.add(tfile)
+    return summary.data
 
 def create_directory_name(name, filtered_count):
     if filtered_count > 0:
@@ -370,14 +370,12 @@ class Tracker(ColumnBase):
     header = {'left': 'Tracker'}
     width = 10
     min_width = 5
-    needed_keys = ('trackers',)
+    needed_keys = ('tracker-domains',)
     align = 'left'
 
     def get_value(self):
-        if len(self.data['trackers']) > 0:
-            return self.data['trackers'][0]['url-announce'].domain
-        else:
-            return ''
+        domains = self.data['tracker-domains']
+        return domains[0] if domains else ''
 
 COLUMNS['tracker'] = Tracker
 
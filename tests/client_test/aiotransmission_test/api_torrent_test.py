@@ -1,4 +1,4 @@
-from stig.client.aiotransmission.api_torrent import TorrentAPI
+from stig.client.aiotransmission.api_torrent import (TorrentAPI, _merge_raw_torrents)
 from stig.client.aiotransmission.rpc import TransmissionRPC
 from stig.client.aiotransmission.torrent import Torrent
 from stig.client import errors
@@ -6,8 +6,12 @@ from stig.client.filters.torrent import TorrentFilter
 
 import resources_aiotransmission as rsrc
 
+from stig.client.utils import run_generator
+
+from aiohttp import web
 import asynctest
 import os.path
+import time
 assert os.path.exists(rsrc.TORRENTFILE)
 assert not os.path.exists(rsrc.TORRENTFILE_NOEXIST)
 
@@ -128,6 +132,117 @@ class TestGettingTorrents(TorrentAPITestCase):
         self.assertEqual(response.torrents, ())
         self.assertIn('Nope', str(response.msgs[0]))
 
+    async def test_static_fields_are_not_requested_every_time(self):
+        raw_torrents = [
+            {'id': 1, 'trackers': [{'announce': 'http://foo.org/announce'}]},
+            {'id': 2, 'trackers': [{'announce': 'http://bar.org/announce'}]},
+        ]
+        async def respond(request):
+            args = (await request.json())['arguments']
+            fields, ids = args['fields'], args.get('ids')
+            tlist = [{f:rt[f] for f in fields if f in rt} for rt in raw_torrents
+                     if ids is None or rt['id'] in ids]
+            return web.json_response(rsrc.response_torrents(*tlist))
+        self.daemon.response = respond
+
+        def requested_fields():
+            return [(set(rq['arguments']['fields']), rq['arguments'].get('ids'))
+                    for rq in self.daemon.requests if rq.get('method') == 'torrent-get']
+
+        response = await self.api.torrents(keys=('tracker-domains',))
+        self.assert_torrentkeys_equal('tracker-domains', response.torrents, ('foo.org',), ('bar.org',))
+        self.assertEqual(requested_fields()[-1], ({'id', 'trackers'}, None))
+
+        raw_torrents.append({'id': 3, 'trackers': [{'announce': 'http://baz.org/announce'}]})
+        response = await self.api.torrents(keys=('tracker-domains',))
+        self.assert_torrentkeys_equal('tracker-domains', response.torrents,
+                                      ('foo.org',), ('bar.org',), ('baz.org',))
+        self.assertEqual(requested_fields()[-2:], [({'id'}, None), ({'id', 'trackers'}, [3])])
+
+        self.api._static_fields_updated -= self.api.STATIC_FIELDS_MAX_AGE
+        response = await self.api.torrents(keys=('tracker-domains',))
+        self.assertEqual(requested_fields()[-1], ({'id', 'trackers'}, None))
+
+    async def test_file_trees_are_created_when_torrents_are_cached(self):
+        self.daemon.response = rsrc.response_torrents(
+            {'id': 1, 'name': 'Foo',
+             'files': [{'name': 'Foo/bar', 'length': 10, 'bytesCompleted': 0}],
+             'fileStats': [{'bytesCompleted': 0, 'wanted': True, 'priority': 0}]},
+        )
+        response = await self.api.torrents(keys=('files',))
+        self.assertIn('files', response.torrents[0]._cache)
+        self.assertEqual(tuple(f['name'] for f in response.torrents[0]['files'].files), ('bar',))
+
+    async def test_cached_torrents_are_updated(self):
+        self.daemon.response = rsrc.response_torrents(
+            {'id': 1, 'name': 'Foo',
+             'files': [{'name': 'Foo/bar', 'length': 10, 'bytesCompleted': 0}],
+             'fileStats': [{'bytesCompleted': 0, 'wanted': True, 'priority': 0}]},
+        )
+        response = await self.api.torrents(keys=('name', 'files'))
+        t = response.torrents[0]
+        snapshot = t.snapshot()
+        self.assertEqual(t['name'], 'Foo')
+        self.assertEqual(tuple(f['size-downloaded'] for f in t['files'].files), (0,))
+
+        self.daemon.response = rsrc.response_torrents(
+            {'id': 1, 'name': 'Bar',
+             'files': [{'name': 'Foo/bar', 'length': 10, 'bytesCompleted': 5}],
+             'fileStats': [{'bytesCompleted': 5, 'wanted': True, 'priority': 0}]},
+        )
+        response = await self.api.torrents(keys=('name', 'files'))
+        self.assertIs(response.torrents[0], t)
+        self.assertEqual(t['name'], 'Bar')
+        self.assertEqual(tuple(f['size-downloaded'] for f in t['files'].files), (5,))
+
+        # Snapshots are not affected by updates
+        self.assertEqual(snapshot['name'], 'Foo')
+        self.assertEqual(tuple(f['size-downloaded'] for f in snapshot['files'].files), (0,))
+
+    async def test_cached_torrents_are_used_if_young_enough(self):
+        self.daemon.response = rsrc.response_torrents(
+            {'id': 1, 'name': 'Foo', 'status': 0},
+            {'id': 2, 'name': 'Bar', 'status': 0},
+        )
+        def count_requests():
+            return len([rq for rq in self.daemon.requests if rq.get('method') == 'torrent-get'])
+
+        await self.api.torrents(keys=('name', 'status'))
+        self.assertEqual(count_requests(), 1)
+
+        # All needed keys are cached
+        for torrents in (None, (2,), TorrentFilter('name=Foo')):
+            response = await self.api.torrents(torrents, keys=('name',), max_age=10)
+            self.assertEqual(response.success, True)
+            self.assertEqual(count_requests(), 1)
+        self.assert_torrentkeys_equal('name', response.torrents, 'Foo')
+
+        # Missing key
+        await self.api.torrents((2,), keys=('comment',), max_age=10)
+        self.assertEqual(count_requests(), 2)
+
+        # Unknown torrent
+        await self.api.torrents((3,), keys=('name',), max_age=10)
+        self.assertEqual(count_requests(), 3)
+
+        # Outdated cache
+        await self.api.torrents(keys=('name',), max_age=0)
+        self.assertEqual(count_requests(), 4)
+
+        # No maximum age
+        await self.api.torrents(keys=('name',))
+        self.assertEqual(count_requests(), 5)
+
+
+class TestGettingTorrentsInWorkerThread(TestGettingTorrents):
+    async def setUp(self):
+        await super().setUp()
+        self.api.worker.threaded = True
+
+    async def tearDown(self):
+        self.api.worker.threaded = False
+        await super().tearDown()
+
 
 class TestManipulatingTorrents(TorrentAPITestCase):
     async def setUp(self):
@@ -215,6 +330,92 @@ class TestManipulatingTorrents(TorrentAPITestCase):
         ))
 
 
+class TestProvisionalChanges(TorrentAPITestCase):
+    async def setUp(self):
+        await super().setUp()
+        self.raw_torrents = [
+            {'id': 1, 'name': 'Foo', 'status': 4, 'percentDone': 0.5, 'rateDownload': 10,
+             'rateUpload': 20, 'peersConnected': 1, 'metadataPercentComplete': 1,
+             'isPrivate': False, 'trackerStats': []},
+            {'id': 2, 'name': 'Bar', 'status': 0, 'percentDone': 1, 'rateDownload': 0,
+             'rateUpload': 0, 'peersConnected': 0, 'metadataPercentComplete': 1,
+             'isPrivate': False, 'trackerStats': []},
+        ]
+        async def respond(request):
+            rq = await request.json()
+            if rq['method'] != 'torrent-get':
+                return web.json_response(rsrc.response_success({}))
+            args = rq['arguments']
+            fields, ids = args['fields'], args.get('ids')
+            tlist = [{f:rt[f] for f in fields if f in rt} for rt in self.raw_torrents
+                     if ids is None or rt['id'] in ids]
+            return web.json_response(rsrc.response_torrents(*tlist))
+        self.daemon.response = respond
+        self.updates = []
+        self.api.on_cache_update(self.handle_cache_update)
+        self.tlist = (await self.api.torrents(keys=('name', 'status'))).torrents
+
+    def handle_cache_update(self, api, removed_ids):
+        self.updates.append(removed_ids)
+
+    def get_status(self, tid):
+        return str(self.api._tcache.get(tid)[0]['status'][0])
+
+    async def test_stop_and_start(self):
+        await self.api.stop((1,))
+        self.assertEqual(self.get_status(1), 'stopped')
+        self.assertEqual(self.updates, [()])
+        await self.api.start((2,))
+        self.assertEqual(self.get_status(2), 'seeding')
+        self.assertEqual(self.updates, [(), ()])
+
+    async def test_older_values_dont_overwrite_provisional_values(self):
+        timestamp = time.monotonic()
+        await self.api.stop((1,))
+        tcache = self.api._tcache
+        run_generator(tcache.update([dict(self.raw_torrents[0])], ('id', 'status'), timestamp))
+        self.assertEqual(self.get_status(1), 'stopped')
+
+        # Newer values roll back provisional values
+        run_generator(tcache.update([dict(self.raw_torrents[0])], ('id', 'status'), time.monotonic()))
+        self.assertEqual(self.get_status(1), 'downloading')
+
+    async def test_merged_values_dont_overwrite_provisional_values(self):
+        timestamp = time.monotonic()
+        tcache = self.api._tcache
+        raw_tlist = [dict(self.raw_torrents[0])]
+        merged = run_generator(_merge_raw_torrents(raw_tlist, tcache.get_raw((1,))))
+        await self.api.stop((1,))
+        run_generator(tcache.update(raw_tlist, ('id', 'status'), timestamp, merged=merged))
+        self.assertEqual(self.get_status(1), 'stopped')
+
+    async def test_remove(self):
+        timestamp = time.monotonic()
+        await self.api.remove((1,))
+        self.assertEqual(self.updates, [(1,)])
+        tcache = self.api._tcache
+        self.assertEqual(tuple(t['id'] for t in tcache.get()), (2,))
+
+        # Torrent is not added again by an older request
+        run_generator(tcache.update([dict(rt) for rt in self.raw_torrents], ('id',),
+                                    timestamp, complete=True))
+        self.assertEqual(tuple(t['id'] for t in tcache.get()), (2,))
+        self.assertEqual(tcache._provisional, {1: tcache._provisional[1]})
+
+        # Newer request confirms removal
+        del self.raw_torrents[0]
+        await self.api.torrents(keys=('name',))
+        self.assertEqual(tcache._provisional, {})
+
+    async def test_failed_action_does_not_change_cache(self):
+        async def fail(ids, **kwargs):
+            raise errors.ClientError('Nope')
+        response = await self.api._torrent_action(fail, (1,), provisional={'status': 0})
+        self.assertEqual(response.success, False)
+        self.assertEqual(self.get_status(1), 'downloading')
+        self.assertEqual(self.updates, [])
+
+
 class TestTorrentBandwidthLimit(TorrentAPITestCase):
     def assert_request(self, expected_request):
         # Because order doesn't matter, replace lists with sets to make requests comparable
@@ -72,3 +72,21 @@ class TestTorrent(unittest.TestCase):
         t = torrent.Torrent(raw)
         self.assertEqual(set(t), {'id', 'name', 'rate-down', 'hash',
                                   'time-created', '%verified'})
+
+    def test_snapshot(self):
+        t = torrent.Torrent({'id': 123, 'name': 'Foo', 'rateDownload': 10})
+        self.assertEqual(t['rate-down'], 10)
+        snapshot = t.snapshot()
+        self.assertEqual(snapshot, t)
+        self.assertIsNot(snapshot._cache, t._cache)
+        t.update({'name': 'Bar', 'rateDownload': 20})
+        self.assertEqual((t['name'], t['rate-down']), ('Bar', 20))
+        self.assertEqual((snapshot['name'], snapshot['rate-down']), ('Foo', 10))
+
+    def test_replace(self):
+        t = torrent.Torrent({'id': 123, 'name': 'Foo', 'rateDownload': 10})
+        self.assertEqual((t['name'], t['rate-down']), ('Foo', 10))
+        t.replace({'id': 123, 'name': 'Bar', 'rateDownload': 10}, fields=('name',))
+        self.assertNotIn('name', t._cache)
+        self.assertIn('rate-down', t._cache)
+        self.assertEqual((t['name'], t['rate-down']), ('Bar', 10))
@@ -1,6 +1,9 @@
-from stig.client.utils import URL
+from stig.client.utils import (URL, Worker)
 
 import unittest
+import asynctest
+import threading
+import asyncio
 
 
 # See also aiotransmission_test/url_test.py
@@ -101,3 +104,100 @@ class TestURL(unittest.TestCase):
         url.host = 'foo.bar.com'
         self.assertEqual(url.domain, 'bar.com')
         self.assertEqual(str(url), 'http://foo.bar.com:321/foo')
+
+
+class TestWorker(asynctest.TestCase):
+    async def test_functions_run_in_event_loop_thread(self):
+        self.worker = Worker(loop=self.loop)
+        result = await self.worker.run(lambda a, b=0: (a + b, threading.current_thread()), 1, b=2)
+        self.assertEqual(result, (3, threading.current_thread()))
+
+    async def test_exceptions_are_raised(self):
+        self.worker = Worker(loop=self.loop)
+        def fail():
+            raise ValueError('foo')
+            yield
+        with self.assertRaises(ValueError):
+            await self.worker.run(fail)
+
+    async def test_calls_are_serialized(self):
+        self.worker = Worker(loop=self.loop, timeslice=0)
+        running = []
+        def func(i):
+            running.append(i)
+            for _ in range(3):
+                assert len(running) == 1, running
+                yield
+            running.remove(i)
+            return i
+        results = await asyncio.gather(*(self.worker.run(func, i) for i in range(5)), loop=self.loop)
+        self.assertEqual(results, [0, 1, 2, 3, 4])
+
+    async def test_generators_return_value(self):
+        def func(n):
+            for i in range(n):
+                yield
+            return n
+        self.worker = Worker(loop=self.loop)
+        self.assertEqual(await self.worker.run(func, 3), 3)
+
+    async def test_generators_are_interleaved_with_event_loop(self):
+        self.worker = Worker(loop=self.loop, timeslice=0)
+        events = []
+        def func():
+            for i in range(3):
+                events.append('work')
+                yield
+        async def other():
+            events.append('other')
+        self.loop.create_task(other())
+        await self.worker.run(func)
+        self.assertLess(events.index('other'), len(events) - 1)
+
+    async def test_run_threaded_without_thread(self):
+        self.worker = Worker(loop=self.loop)
+        self.assertEqual(self.worker.threaded, False)
+        result = await self.worker.run_threaded(lambda a, b=0: (a + b, threading.current_thread()), 1, b=2)
+        self.assertEqual(result, (3, threading.current_thread()))
+
+    async def test_run_threaded_with_thread(self):
+        self.worker = Worker(loop=self.loop, threaded=True)
+        self.addCleanup(setattr, self.worker, 'threaded', False)
+        self.assertEqual(self.worker.threaded, True)
+        def func(a, b=0):
+            yield
+            return (a + b, threading.current_thread())
+        result = await self.worker.run_threaded(func, 1, b=2)
+        self.assertEqual(result[0], 3)
+        self.assertIsNot(result[1], threading.current_thread())
+
+    async def test_run_ignores_thread(self):
+        self.worker = Worker(loop=self.loop, threaded=True)
+        self.addCleanup(setattr, self.worker, 'threaded', False)
+        result = await self.worker.run(threading.current_thread)
+        self.assertIs(result, threading.current_thread())
+
+    async def test_exceptions_are_raised_from_thread(self):
+        self.worker = Worker(loop=self.loop, threaded=True)
+        self.addCleanup(setattr, self.worker, 'threaded', False)
+        def fail():
+            raise ValueError('foo')
+        with self.assertRaises(ValueError):
+            await self.worker.run_threaded(fail)
+
+    async def test_threaded_calls_are_serialized_with_other_calls(self):
+        self.worker = Worker(loop=self.loop, threaded=True, timeslice=0)
+        self.addCleanup(setattr, self.worker, 'threaded', False)
+        running = []
+        def func(i):
+            running.append(i)
+            for _ in range(3):
+                assert len(running) == 1, running
+                threading.Event().wait(0.001)
+                yield
+            running.remove(i)
+            return i
+        calls = (self.worker.run_threaded(func, i) if i % 2 else self.worker.run(func, i)
+                 for i in range(6))
+        results = await asyncio.gather(*calls, loop=self.loop)
+        self.assertEqual(results, [0, 1, 2, 3, 4, 5])
@@ -1,4 +1,5 @@
 from stig.client.filters.torrent import (SingleTorrentFilter, TorrentFilter)
+from stig.client.filters import IncrementalFilter
 from stig.client.aiotransmission.torrent import Torrent
 
 import unittest
@@ -235,6 +236,20 @@ class TestSingleTorrentFilter(unittest.TestCase):
         tids = SingleTorrentFilter('eta>=1h').apply(tlist, key='id')
         self.assertEqual(set(tids), {2, 3})
 
+    def test_tracker_filter(self):
+        tlist = (
+            Torrent({'id': 1, 'trackers': [{'announce': 'http://tracker.foo.org:123/announce'}]}),
+            Torrent({'id': 2, 'trackers': [{'announce': 'http://bar.net/announce'},
+                                           {'announce': 'udp://tracker.foo.org:456'}]}),
+            Torrent({'id': 3, 'trackers': []}),
+        )
+        tids = SingleTorrentFilter('tracker~foo').apply(tlist, key='id')
+        self.assertEqual(set(tids), {1, 2})
+        tids = SingleTorrentFilter('tracker=bar.net').apply(tlist, key='id')
+        self.assertEqual(set(tids), {2})
+        tids = SingleTorrentFilter('trk!~o').apply(tlist, key='id')
+        self.assertEqual(set(tids), {3})
+
 
 class TestTorrentFilter(unittest.TestCase):
     def test_parser(self):
@@ -345,6 +360,19 @@ class TestTorrentFilter(unittest.TestCase):
         self.assertEqual(str(f1+f2+f3), 'public&active|complete')
         self.assertEqual(str(f3+f2+f1), 'complete|active&public')
 
+    def test_combining_filters_removes_narrower_AND_chains(self):
+        f1 = TorrentFilter('downloading')
+        f2 = TorrentFilter('downloading&private|uploading')
+        self.assertEqual(str(f1+f2), 'downloading|uploading')
+        self.assertEqual(str(f2+f1), 'uploading|downloading')
+
+        f = TorrentFilter.union(TorrentFilter('foobar'), TorrentFilter('foo&private'),
+                                TorrentFilter('fo'), TorrentFilter('bar'))
+        self.assertEqual(str(f), '~fo|~bar')
+
+        f = TorrentFilter('foo|foo&private') + TorrentFilter('private&foo')
+        self.assertEqual(str(f), '~foo')
+
     def test_combining_any_filter_with_all_is_all(self):
         f = TorrentFilter('active') + TorrentFilter('all')
         self.assertEqual(f, TorrentFilter('all'))
@@ -360,3 +388,65 @@ class TestTorrentFilter(unittest.TestCase):
         f3 = TorrentFilter('!private|active')
         self.assertEqual(set((f1+f2+f3).needed_keys),
                          set(['private', '%downloaded', 'peers-connected', 'status']))
+
+    def test_narrows(self):
+        def narrows(a, b):
+            return TorrentFilter(a).narrows(TorrentFilter(b))
+        self.assertTrue(narrows('foob', 'foo'))
+        self.assertTrue(narrows('name=foo', 'fo'))
+        self.assertTrue(narrows('!~foo', '!~foob'))
+        self.assertTrue(narrows('foo&private', 'foo'))
+        self.assertTrue(narrows('foo', 'all'))
+        self.assertTrue(narrows('foob|fooz', 'foo|bar'))
+        self.assertTrue(narrows('public&active', 'active&public'))
+        self.assertFalse(narrows('foo', 'foob'))
+        self.assertFalse(narrows('!~foob', '!~foo'))
+        self.assertFalse(narrows('fo', 'name=foo'))
+        self.assertFalse(narrows('foo', 'foo&private'))
+        self.assertFalse(narrows('all', 'foo'))
+        self.assertFalse(narrows('foob|baz', 'foo'))
+        self.assertFalse(narrows('path~foo', 'name~foo'))
+
+
+class TestIncrementalFilter(unittest.TestCase):
+    class CountingTorrentFilter(TorrentFilter):
+        applied = []
+        def apply(self, objects):
+            objects = tuple(objects)
+            self.applied.append(len(objects))
+            return super().apply(objects)
+
+    def setUp(self):
+        self.CountingTorrentFilter.applied.clear()
+
+    def test_narrowing_filters_previous_result(self):
+        f = IncrementalFilter(tlist)
+        F = self.CountingTorrentFilter
+        self.assertEqual(getids(f.apply(F('F'))), {1, 3, 4})
+        self.assertEqual(getids(f.apply(F('Fo'))), {1, 4})
+        self.assertEqual(getids(f.apply(F('FooF'))), {4})
+        self.assertEqual(F.applied, [4, 3, 2])
+
+    def test_results_are_reused(self):
+        f = IncrementalFilter(tlist)
+        F = self.CountingTorrentFilter
+        self.assertEqual(getids(f.apply(F('Fo'))), {1, 4})
+        self.assertEqual(getids(f.apply(F('Foo'))), {1, 4})
+        self.assertEqual(getids(f.apply(F('Fo'))), {1, 4})
+        self.assertEqual(getids(f.apply(F('F'))), {1, 3, 4})
+        self.assertEqual(F.applied, [4, 2, 4])
+
+    def test_new_objects_clear_results(self):
+        f = IncrementalFilter(tlist)
+        F = self.CountingTorrentFilter
+        self.assertEqual(getids(f.apply(F('Fo'))), {1, 4})
+        f.objects = tlist[:2]
+        self.assertEqual(getids(f.apply(F('Fo'))), {1})
+        self.assertEqual(F.applied, [4, 2])
+
+    def test_maxsize(self):
+        f = IncrementalFilter(tlist, maxsize=2)
+        F = self.CountingTorrentFilter
+        for filter_str in ('Foo', 'Bar', 'Fim', 'Foo'):
+            f.apply(F(filter_str))
+        self.assertEqual(F.applied, [4, 4, 4, 4])
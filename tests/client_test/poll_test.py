@@ -104,6 +104,25 @@ class TestRequestPoller(asynctest.ClockedTestCase):
 
         await rp.stop()
 
+    async def test_remove_callback(self):
+        rp = RequestPoller(self.mock_request, loop=self.loop)
+        calls = []
+        def cb(response):
+            calls.append(response)
+
+        rp.on_response(cb)
+        rp.on_error(cb)
+        self.assertEqual(rp.has_callbacks, True)
+        await rp.start()
+        await self.advance(0)
+        self.assertEqual(calls, [1])
+
+        rp.remove_callback(cb)
+        self.assertEqual(rp.has_callbacks, False)
+        await self.advance(rp.interval)
+        self.assertEqual(calls, [1])
+        await rp.stop()
+
     async def test_callback_gets_None_when_stopped(self):
         rp = self.make_poller(self.mock_request, loop=self.loop)
         status = None
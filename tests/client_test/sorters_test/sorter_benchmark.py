@@ -0,0 +1,22 @@
+"""Measure how long it takes to sort large torrent lists
+
+Run with: python3 -m tests.client_test.sorters_test.sorter_benchmark
+"""
+
+from stig.client.sorters.torrent import TorrentSorter
+from .torrent_sorter_test import make_torrents
+
+import timeit
+
+
+SORTSTRINGS = ('size', '!progress', 'rate-down')
+
+def run(counts=(10000, 50000), repeat=5):
+    sorter = TorrentSorter(SORTSTRINGS)
+    for count in counts:
+        torrents = make_torrents(count)
+        secs = min(timeit.repeat(lambda: sorter.apply(torrents), number=1, repeat=repeat))
+        print('Sorted {:>6} items by {}: {:8.2f}ms'.format(count, sorter, secs*1e3))
+
+if __name__ == '__main__':
+    run()
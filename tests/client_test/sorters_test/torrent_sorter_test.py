@@ -0,0 +1,82 @@
+from stig.client.sorters.torrent import TorrentSorter
+
+import unittest
+import random
+
+
+def make_torrents(count, seed=0):
+    rng = random.Random(seed)
+    return [{'id': i,
+             'name': rng.choice(('Foo', 'bar', 'Baz', 'qux')) + str(rng.randrange(count)),
+             'rate-down': rng.choice((0, 0, 0, 100, 2000, rng.randrange(1e6))),
+             'size-final': rng.choice((10, 20, rng.randrange(1e9))),
+             '%downloaded': rng.choice((0, 50, 100, rng.random() * 100)),
+             '%metadata': rng.choice((0, 100)),
+             '%verified': rng.choice((0, 100))}
+            for i in range(count)]
+
+
+def sort_multipass(torrents, *sortstrings):
+    # Sort by each key function separately, least significant first
+    sortstrings = ('name',) + sortstrings
+    for sortstring in sortstrings:
+        reverse = sortstring[0] == '!'
+        sortspec = TorrentSorter.SORTSPECS[sortstring.lstrip('!')]
+        for keyfunc in sortspec._keyfuncs:
+            torrents = sorted(torrents, key=keyfunc, reverse=reverse)
+    return [t['id'] for t in torrents]
+
+
+class TestTorrentSorter(unittest.TestCase):
+    def assert_sorted_like_multipass(self, *sortstrings):
+        torrents = make_torrents(200)
+        result = TorrentSorter(sortstrings).apply(torrents)
+        self.assertEqual([t['id'] for t in result],
+                         sort_multipass(torrents, *sortstrings))
+
+    def test_default_sort(self):
+        self.assert_sorted_like_multipass()
+
+    def test_single_sort_order(self):
+        self.assert_sorted_like_multipass('size')
+        self.assert_sorted_like_multipass('!size')
+
+    def test_multiple_sort_orders(self):
+        self.assert_sorted_like_multipass('size', 'rate-down')
+        self.assert_sorted_like_multipass('!size', 'rate-down')
+        self.assert_sorted_like_multipass('size', '!rate-down')
+        self.assert_sorted_like_multipass('!name', 'size', '!rate-down')
+
+    def test_sort_order_with_multiple_key_functions(self):
+        self.assert_sorted_like_multipass('progress')
+        self.assert_sorted_like_multipass('!progress', 'size')
+        self.assert_sorted_like_multipass('size', '!progress')
+
+    def test_inplace(self):
+        torrents = make_torrents(50)
+        expected = sort_multipass(torrents, '!rate-down')
+        self.assertEqual(TorrentSorter(('!rate-down',)).apply(torrents, inplace=True), None)
+        self.assertEqual([t['id'] for t in torrents], expected)
+
+    def test_item_getter(self):
+        torrents = make_torrents(50)
+        items = [(t,) for t in torrents]
+        result = TorrentSorter(('size',)).apply(items, item_getter=lambda item: item[0])
+        self.assertEqual([item[0]['id'] for item in result],
+                         sort_multipass(torrents, 'size'))
+
+    def test_key_functions_are_called_once_per_item(self):
+        torrents = make_torrents(50)
+        calls = []
+        def item_getter(t):
+            calls.append(t['id'])
+            return t
+        TorrentSorter(('progress', '!size')).apply(torrents, item_getter=item_getter)
+        self.assertEqual(sorted(calls), list(range(50)))
+
+    def test_get_key(self):
+        torrents = make_torrents(200)
+        for sortstrings in (('size',), ('!size', 'rate-down'), ('!progress', '!name')):
+            sorter = TorrentSorter(sortstrings)
+            self.assertEqual([t['id'] for t in sorted(torrents, key=sorter.get_key)],
+                             [t['id'] for t in sorter.apply(torrents)])
@@ -1,7 +1,7 @@
 from stig.client.trequestpool import TorrentRequestPool
 from stig.client.aiotransmission.torrent import Torrent
 from stig.client.filters.torrent import TorrentFilter
-from stig.client.utils import Response
+from stig.client.utils import (Response, Worker)
 
 import asynctest
 import asyncio
@@ -27,6 +27,10 @@ class FakeTorrentAPI():
         self.exc = None
         self.tlist = FAKE_TORRENTS
         self.delay = 0
+        self.cache_update_callbacks = []
+
+    def on_cache_update(self, callback, autoremove=True):
+        self.cache_update_callbacks.append(callback)
 
     async def torrents(self, torrents=None, keys='ALL'):
         if self.delay:
@@ -75,6 +79,7 @@ class TestTorrentRequestPool(asynctest.ClockedTestCase):
     async def setUp(self):
         self.api = FakeTorrentAPI()
         srvapi = SimpleNamespace(torrent=self.api,
+                                 worker=Worker(loop=self.loop),
                                  loop=self.loop)
         self.rp = TorrentRequestPool(srvapi)
         self.assertEqual(self.rp.running, False)
@@ -128,6 +133,20 @@ class TestTorrentRequestPool(asynctest.ClockedTestCase):
 
         await self.rp.stop()
 
+    async def test_combining_requests_drops_narrower_filters(self):
+        await self.rp.start()
+        foo = Subscriber('name~foo', 'name')
+        self.rp.register('foo', foo.callback, keys=foo.keys, tfilter=foo.tfilter)
+        foo_private = Subscriber('name~foo&private', 'name')
+        self.rp.register('foo_private', foo_private.callback,
+                         keys=foo_private.keys, tfilter=foo_private.tfilter)
+        foo_bar = Subscriber('name~foobar', 'name')
+        self.rp.register('foo_bar', foo_bar.callback, keys=foo_bar.keys, tfilter=foo_bar.tfilter)
+        await self.advance(self.rp.interval)
+        self.assert_api_request(tfilter=TorrentFilter('name~foo'))
+        self.assertEqual(str(self.api.arg_torrents), '~foo')
+        await self.rp.stop()
+
     async def test_autoremoving_requests(self):
         await self.rp.start()
         self.assertEqual(self.rp.running, True)
@@ -182,6 +201,52 @@ class TestTorrentRequestPool(asynctest.ClockedTestCase):
 
         await self.rp.stop()
 
+    async def test_single_subscriber_gets_torrents_filtered_by_api(self):
+        worker_calls = []
+        run = self.rp._worker.run
+        async def run_spy(*args, **kwargs):
+            worker_calls.append(args)
+            return await run(*args, **kwargs)
+        self.rp._worker.run = run_spy
+
+        await self.rp.start()
+        foo = Subscriber('name~foo', 'name')
+        self.rp.register('foo', foo.callback, keys=foo.keys, tfilter=foo.tfilter)
+        await self.advance(0)
+        self.assert_api_request(calls=1, tfilter=foo.tfilter)
+        # The API applied the filter, so the torrents are not filtered again
+        self.assertEqual(tuple(foo.callback.args), FAKE_TORRENTS)
+        self.assertEqual(worker_calls, [])
+
+        bar = Subscriber('name~bar', 'name')
+        self.rp.register('bar', bar.callback, keys=bar.keys, tfilter=bar.tfilter)
+        await self.advance(self.rp.interval)
+        self.assertEqual(tuple(foo.callback.args), (FAKE_TORRENTS[0],))
+        self.assertEqual(tuple(bar.callback.args), (FAKE_TORRENTS[1],))
+        self.assertEqual(len(worker_calls), 1)
+
+        await self.rp.stop()
+
+    async def test_local_cache_updates_are_sent_to_callbacks(self):
+        await self.rp.start()
+        foo = Subscriber('name~foo', 'name')
+        thelot = Subscriber(None, 'name')
+        self.rp.register('foo', foo.callback, keys=foo.keys, tfilter=foo.tfilter)
+        self.rp.register('all', thelot.callback, keys=thelot.keys, tfilter=thelot.tfilter)
+        await self.advance(0)
+        self.assertEqual(self.api.calls, 1)
+        self.assertEqual(tuple(thelot.callback.args), FAKE_TORRENTS)
+
+        for callback in self.api.cache_update_callbacks:
+            callback(self.api, removed_ids=(1,))
+        self.assertEqual(self.api.calls, 1)
+        self.assertEqual(foo.callback.calls, 2)
+        self.assertEqual(tuple(foo.callback.args), ())
+        self.assertEqual(thelot.callback.calls, 2)
+        self.assertEqual(tuple(thelot.callback.args), FAKE_TORRENTS[1:])
+
+        await self.rp.stop()
+
     async def test_raising_fatal_exception(self):
         self.api.exc = RuntimeError('Something is wrong!')
         await self.rp.start()
@@ -236,3 +301,33 @@ class TestTorrentRequestPool(asynctest.ClockedTestCase):
         self.assertEqual(self.api.calls, apicalls+1)
 
         await self.rp.stop()
+
+
+class TestTorrentRequestPoolInWorkerThread(asynctest.TestCase):
+    async def setUp(self):
+        self.api = FakeTorrentAPI()
+        self.api.tlist = tuple(Torrent(dict(t._raw)) for t in FAKE_TORRENTS)
+        srvapi = SimpleNamespace(torrent=self.api,
+                                 worker=Worker(loop=self.loop, threaded=True),
+                                 loop=self.loop)
+        self.rp = TorrentRequestPool(srvapi)
+
+    async def tearDown(self):
+        await self.rp.stop()
+        self.rp._worker.threaded = False
+
+    async def test_callbacks_get_correct_torrents(self):
+        await self.rp.start()
+        foo = Subscriber('name~foo', 'name', 'rate-down')
+        baz = Subscriber('private', 'id', 'size-total')
+        self.rp.register('foo', foo.callback, keys=foo.keys, tfilter=foo.tfilter)
+        self.rp.register('baz', baz.callback, keys=baz.keys, tfilter=baz.tfilter)
+        while baz.callback.calls < 1:
+            await asyncio.sleep(0.001, loop=self.loop)
+
+        tlist = self.api.tlist
+        self.assertEqual(tuple(foo.callback.args), (tlist[0],))
+        self.assertIs(foo.callback.args[0], tlist[0])
+        self.assertEqual(tuple(baz.callback.args), (tlist[1], tlist[2]))
+        # Filters were applied to snapshots
+        self.assertEqual([t._cache for t in tlist], [{}, {}, {}])
@@ -285,3 +285,30 @@ class TestTorrentFilePriority(unittest.TestCase):
 
         for _ in range(10):
             self.assertEqual(sorted(shuffle(prios)), prios)
+
+
+class TestTorrentFile(unittest.TestCase):
+    def mk_tfile(self):
+        return ttypes.TorrentFile(tid=1, id=(1, 0), name='foo', path=('bar',),
+                                  size_total=100, size_downloaded=10,
+                                  is_wanted=True, priority=0)
+
+    def test_update_changed_values(self):
+        tfile = self.mk_tfile()
+        self.assertEqual(tfile['progress'], 10)
+        self.assertEqual(tfile['priority'], 'normal')
+        tfile.update({'size-downloaded': 50, 'is-wanted': False, 'priority': 0})
+        self.assertEqual(tfile['size-downloaded'], 50)
+        self.assertEqual(tfile['progress'], 50)
+        self.assertEqual(tfile['priority'], 'off')
+
+    def test_update_keeps_unchanged_values(self):
+        tfile = self.mk_tfile()
+        size_total = tfile['size-total']
+        progress = tfile['progress']
+        tfile.update({'size-downloaded': 10, 'size-total': 100})
+        self.assertIs(tfile['size-total'], size_total)
+        self.assertIs(tfile['progress'], progress)
+        tfile.update({'size-downloaded': 20})
+        self.assertIs(tfile['size-total'], size_total)
+        self.assertEqual(tfile['progress'], 20)
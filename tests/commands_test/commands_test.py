@@ -66,6 +66,19 @@ class TestCommand(asynctest.TestCase):
         with self.assertRaises(CmdArgError):
             cmdcls._argparser.parse_args(['foo', 'bar', 'baz'])
 
+    @asynctest.ignore_loop
+    def test_cached_arguments_are_not_shared(self):
+        calls = []
+        def run(self_, ITEMS):
+            calls.append(list(ITEMS))
+            ITEMS.append('changed')
+            return True
+        argspecs = ({'names': ('ITEMS',), 'nargs': '*', 'description': 'Some items'},)
+        cmdcls = make_cmdcls(run=run, argspecs=argspecs)
+        for _ in range(3):
+            cmdcls(['foo', 'bar'])
+        self.assertEqual(calls, [['foo', 'bar']] * 3)
+
     @asynctest.ignore_loop
     def test_expected_resource_available_in_run_method(self):
         argspecs = ({'names': ('A',), 'description': 'First number'},
@@ -541,6 +554,17 @@ class TestCommandManagerChainedCalls(TestCommandManagerCallsBase):
         self.assert_invalid_cmdchain_format((('true',), '&&&', ['true']))
 
 
+    @asynctest.ignore_loop
+    def test_split_cmdchain_returns_new_lists(self):
+        cmdchain = self.cmdmgr.split_cmdchain('true -a & false "-b"')
+        self.assertEqual(cmdchain, [['true', '-a'], '&', ['false', '-b']])
+        cmdchain[0].pop(0)
+        self.assertEqual(self.cmdmgr.split_cmdchain('true -a & false "-b"'),
+                         [['true', '-a'], '&', ['false', '-b']])
+        self.assert_success('true -a & true -b')
+        self.assert_success('true -a & true -b')
+        self.assertEqual(self.true_cb.calls, 4)
+
     @asynctest.ignore_loop
     def test_consecutive_operators(self):
         def assert_consecutive_ops(cmdchain, op1, op2):
@@ -35,6 +35,12 @@ class TestKey(unittest.TestCase):
         self.assertEqual(Key('alt-space'), Key('meta  '))
         self.assertEqual(Key('alt-pgup'), Key('meta page up'))
 
+    def test_equal_keys_are_identical(self):
+        self.assertIs(Key('alt-l'), Key('Meta-l'))
+        self.assertIs(Key('enter'), Key('return'))
+        self.assertIs(Key('<ctrl-e>'), Key('ctrl-E'))
+        self.assertIsNot(Key('alt-l'), Key('alt-L'))
+
     def test_compare_Key_with_str(self):
         self.assertEqual(Key('enter'), '\n')
         self.assertEqual(Key('enter'), 'return')
@@ -204,6 +210,20 @@ class TestKeyMapped(unittest.TestCase):
         self.assert_lines(lst_widget, size, exp_lines=('1  ', '2  ', '3  '), exp_focus_pos=1)
         self.assertEqual(lst_got_j.callnum, 1)
 
+    def test_keys_are_offered_to_parent_only_once(self):
+        class CountingText(urwid.Text):
+            keys = []
+            def selectable(self):
+                return True
+            def keypress(self, size, key):
+                self.keys.append(key)
+                return key
+        widget = self.mk_widget(CountingText, 'foo', context='item')
+        widget.keypress((3,), 'x')
+        self.assertEqual(CountingText.keys, ['x'])
+        widget.keypress((3,), 'meta x')
+        self.assertEqual(CountingText.keys, ['x', 'meta x', Key('alt-x')])
+
 
 class TestKeyMap_with_single_keys(unittest.TestCase):
     def setUp(self):
@@ -513,6 +533,27 @@ class TestKeyMap_with_keychains(unittest.TestCase):
                            widget_text='bar2',
                            active_keychains=())
 
+    def test_binding_after_evaluation(self):
+        self.km.bind('alt-1 alt-2', 'foo')
+        self.widget.keypress((80,), 'alt-1')
+        self.widget.keypress((80,), 'alt-2')
+        self.assert_status(keys_given=(), widget_text='foo1', active_keychains=())
+
+        self.km.bind('alt-1 alt-3', 'bar')
+        self.widget.keypress((80,), 'alt-1')
+        self.assert_status(keys_given=('alt-1',),
+                           widget_text='foo1',
+                           active_keychains=((('alt-1', 'alt-2'), 'foo'),
+                                             (('alt-1', 'alt-3'), 'bar')))
+        self.widget.keypress((80,), 'alt-3')
+        self.assert_status(keys_given=(), widget_text='bar2', active_keychains=())
+
+        self.km.unbind('alt-1 alt-3')
+        self.widget.keypress((80,), 'alt-1')
+        self.assert_status(keys_given=('alt-1',),
+                           widget_text='bar2',
+                           active_keychains=((('alt-1', 'alt-2'), 'foo'),))
+
 
 class TestKeyMap_with_nested_widgets(unittest.TestCase):
     def setUp(self):
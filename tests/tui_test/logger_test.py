@@ -0,0 +1,101 @@
+from stig.tui.logger import (LogWidget, LogEntry)
+
+import unittest
+from unittest.mock import (Mock, patch)
+import logging
+import urwid
+
+from .resources_tui import get_canvas_text
+
+
+def mkrecord(msg, level=logging.INFO):
+    return logging.LogRecord('test', level, __file__, 1, msg, (), None)
+
+
+class TestLogWidget(unittest.TestCase):
+    def setUp(self):
+        root_logger = logging.getLogger()
+        handler = logging.NullHandler()
+        root_logger.addHandler(handler)
+        self.addCleanup(root_logger.removeHandler, handler)
+
+        # Showing the log temporarily needs the complete TUI
+        patcher = patch.object(LogWidget, '_maybe_show_temporarily')
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.logwidget = LogWidget(height=5, max_entries=3, autohide_delay=0, loop=Mock())
+
+    def get_messages(self):
+        return [entry.text for entry in self.logwidget.entries]
+
+    def test_duplicate_messages_are_counted(self):
+        for msg in ('foo', 'foo', 'bar', 'foo', 'foo', 'foo'):
+            self.logwidget.add(mkrecord(msg))
+        self.assertEqual(self.get_messages(), ['foo', 'bar', 'foo'])
+        self.assertEqual([entry.dupes for entry in self.logwidget.entries], [1, 0, 2])
+
+    def test_old_entries_are_removed(self):
+        for i in range(10):
+            self.logwidget.add(mkrecord('msg%d' % i))
+        self.assertEqual(self.get_messages(), ['msg7', 'msg8', 'msg9'])
+
+        self.logwidget.max_entries = 2
+        self.assertEqual(self.get_messages(), ['msg8', 'msg9'])
+        self.logwidget.add(mkrecord('msg10'))
+        self.assertEqual(self.get_messages(), ['msg9', 'msg10'])
+
+        with self.assertRaises(ValueError):
+            self.logwidget.max_entries = 0
+
+    def test_old_entries_are_removed_in_batches(self):
+        self.logwidget.max_entries = 20
+        for i in range(20):
+            self.logwidget.add(mkrecord('msg%d' % i))
+        self.assertEqual(len(self.get_messages()), 20)
+        self.logwidget.add(mkrecord('msg20'))
+        self.assertEqual(self.get_messages(), ['msg%d' % i for i in range(3, 21)])
+        self.logwidget.add(mkrecord('msg21'))
+        self.logwidget.add(mkrecord('msg22'))
+        self.assertEqual(self.get_messages(), ['msg%d' % i for i in range(3, 23)])
+
+        self.logwidget.max_entries = 10
+        self.assertEqual(self.get_messages(), ['msg%d' % i for i in range(14, 23)])
+
+    def test_rows_are_limited_by_height(self):
+        self.logwidget.max_entries = 100
+        self.logwidget.add(mkrecord('foo'))
+        self.assertEqual(self.logwidget.rows((20,)), 1)
+        for i in range(10):
+            self.logwidget.add(mkrecord('msg%d' % i))
+        self.assertEqual(self.logwidget.rows((20,)), 5)
+        canv = self.logwidget.render((20,))
+        self.assertEqual(canv.rows(), 5)
+        self.assertIn('msg9', get_canvas_text(list(canv.content())[-1]))
+
+
+class TestLogEntry(unittest.TestCase):
+    def assert_rows_like_render(self, entry, maxcol):
+        rendered = LogEntry(entry.text, 'info')
+        rendered._dupes, rendered._timestamp = entry._dupes, entry._timestamp
+        self.assertEqual(entry.rows((maxcol,)), rendered.render((maxcol,)).rows())
+
+    def test_widgets_are_created_when_rendered(self):
+        entry = LogEntry('a long message that needs more than one line', 'info')
+        for maxcol in (80, 30, 20, 12):
+            self.assert_rows_like_render(entry, maxcol)
+        entry.dupes = 10
+        for maxcol in (80, 30, 20, 14):
+            self.assert_rows_like_render(entry, maxcol)
+        self.assertIsNone(entry._columns)
+
+        canv = entry.render((60,))
+        self.assertIsNotNone(entry._columns)
+        text = get_canvas_text(next(canv.content()))
+        self.assertEqual(text, (entry._timestamp + ' x11 a long message that needs more than one line').ljust(60))
+
+    def test_dupes_of_rendered_entry(self):
+        entry = LogEntry('foo', 'info')
+        entry.render((20,))
+        entry.dupes = 1
+        text = get_canvas_text(next(entry.render((20,)).content()))
+        self.assertEqual(text, (entry._timestamp + ' x2 foo').ljust(20))
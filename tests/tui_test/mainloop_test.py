@@ -0,0 +1,115 @@
+from stig.tui.mainloop import MainLoop
+
+import unittest
+from unittest.mock import patch
+from types import SimpleNamespace
+import urwid
+
+
+class FakeScreen(urwid.display_common.BaseScreen):
+    def __init__(self):
+        super().__init__()
+        self.draws = 0
+
+    def get_cols_rows(self):
+        return (20, 3)
+
+    def draw_screen(self, size, canvas):
+        self.draws += 1
+        self.canvas = canvas  # Keep canvas in the cache like raw_display does
+
+    def hook_event_loop(self, event_loop, callback):
+        pass
+
+    def unhook_event_loop(self, event_loop):
+        pass
+
+    def get_input_descriptors(self):
+        return []
+
+
+class FakeEventLoop():
+    def __init__(self):
+        self.alarms = []
+
+    def alarm(self, seconds, callback):
+        handle = [seconds, callback]
+        self.alarms.append(handle)
+        return handle
+
+    def remove_alarm(self, handle):
+        self.alarms.remove(handle)
+
+    def enter_idle(self, callback):
+        pass
+
+    def remove_enter_idle(self, handle):
+        pass
+
+    def run_alarms(self):
+        alarms, self.alarms = self.alarms, []
+        for seconds, callback in alarms:
+            callback()
+
+
+class TestMainLoop(unittest.TestCase):
+    def setUp(self):
+        self.now = 1000
+        patcher = patch('stig.tui.mainloop.time',
+                        SimpleNamespace(monotonic=lambda: self.now))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.text = urwid.Text('foo')
+        widget = urwid.Filler(urwid.Pile([urwid.Edit('> '), self.text]))
+        self.screen = FakeScreen()
+        self.event_loop = FakeEventLoop()
+        self.loop = MainLoop(widget, screen=self.screen, event_loop=self.event_loop,
+                             handle_mouse=False, fps=10)
+        self.loop.start()
+        self.loop.entering_idle()
+        self.assertEqual(self.screen.draws, 1)
+
+    def test_no_redraw_without_changes(self):
+        for _ in range(10):
+            self.now += 1
+            self.loop.entering_idle()
+        self.assertEqual(self.screen.draws, 1)
+        self.assertEqual(self.event_loop.alarms, [])
+
+    def test_redraw_after_change(self):
+        self.now += 1
+        self.text.set_text('bar')
+        self.loop.entering_idle()
+        self.assertEqual(self.screen.draws, 2)
+
+    def test_redraws_are_limited_by_fps(self):
+        self.now += 0.02
+        self.text.set_text('bar')
+        self.loop.entering_idle()
+        self.assertEqual(self.screen.draws, 1)
+        self.assertEqual(len(self.event_loop.alarms), 1)
+        self.assertAlmostEqual(self.event_loop.alarms[0][0], 0.08)
+
+        # More changes are drawn by the same redraw
+        self.now += 0.02
+        self.text.set_text('baz')
+        self.loop.entering_idle()
+        self.assertEqual(len(self.event_loop.alarms), 1)
+
+        self.now += 0.06
+        self.event_loop.run_alarms()
+        self.assertEqual(self.screen.draws, 2)
+
+    def test_input_is_drawn_immediately(self):
+        self.now += 0.01
+        self.text.set_text('bar')
+        self.loop.entering_idle()
+        self.assertEqual(len(self.event_loop.alarms), 1)
+        self.loop._update(['x'], [ord('x')])
+        self.assertEqual(self.screen.draws, 2)
+        self.assertEqual(self.event_loop.alarms, [])
+
+    def test_invalid_fps(self):
+        with self.assertRaises(ValueError):
+            self.loop.fps = 0
@@ -251,6 +251,45 @@ class TestScrollable(unittest.TestCase):
                                                      't5'.ljust(size[0])))
 
 
+    def test_pile_renders_only_visible_items(self):
+        class CountingText(urwid.Text):
+            renders = 0
+            def render(self, size, focus=False):
+                CountingText.renders += 1
+                return super().render(size, focus)
+
+        def mkpile():
+            return urwid.Pile([CountingText('%d\n%d' % (i, i)) if i % 3 == 0 else CountingText(str(i))
+                               for i in range(1000)])
+
+        w = Scrollable(mkpile())
+        w.render_margin = 2
+        size = (5, 4)
+        for pos in (0, 1, 500, -1):
+            # Compare with full render of an identical Pile
+            w.set_scrollpos(pos)
+            full = urwid.CompositeCanvas(mkpile().render((size[0],)))
+            CountingText.renders = 0
+            canv = w.render(size, focus=True)
+            self.assertLessEqual(CountingText.renders, size[1] + 2 * w.render_margin)
+            trim_top = w.get_scrollpos(size)
+            full.trim(trim_top, size[1])
+            self.assertEqual(list(canv.content()), list(full.content()))
+
+        w.set_scrollpos(0)
+        for _ in range(3):
+            w.keypress(size, 'page down')
+            w.render(size, focus=True)
+        self.check(w, size, text=('6    ', '7    ', '8    ', '9    '))
+        self.assertEqual(w.get_scrollpos(size), 9)
+
+    def test_pile_with_selectable_item_is_rendered_completely(self):
+        w = Scrollable(urwid.Pile([urwid.Text('t%d' % i) for i in range(10)]
+                                  + [urwid.Edit('e')]))
+        self.assertEqual(w._get_item_rows((5,), False), None)
+        w.set_scrollpos(-1)
+        self.check(w, size=(5, 3), text=('t8   ', 't9   ', 'e    '))
+
 
 class TestScrollBarWithScrollable(unittest.TestCase):
     def setUp(self):
@@ -0,0 +1,142 @@
+from stig.tui.table import (Table, FlatRow, fit_text)
+
+import unittest
+import urwid
+
+from .resources_tui import get_canvas_text
+
+
+class Cell(urwid.WidgetWrap):
+    header = urwid.Text('')
+    width = ('weight', 100)
+    align = 'left'
+    may_have_wide_chars = True
+
+    def __init__(self):
+        self.text = urwid.Text('', wrap='clip', align=self.align)
+        super().__init__(urwid.AttrMap(self.text, 'cell'))
+
+    def update(self, data):
+        self.text.set_text(data[self.key])
+
+    def markup(self, width):
+        return [('cell', fit_text(self.text.text, width, self.align, self.may_have_wide_chars))]
+
+class Foo(Cell):
+    key = 'foo'
+    width = 5
+
+class Bar(Cell):
+    key = 'bar'
+    align = 'right'
+
+class Baz(Cell):
+    key = 'baz'
+    width = ('weight', 50)
+    align = 'center'
+
+
+class TestFitText(unittest.TestCase):
+    def assert_like_urwid(self, text, width, wide_chars=False):
+        for align in ('left', 'right', 'center'):
+            exp = get_canvas_text(urwid.Text(text, align=align, wrap='clip').render((width,)).content().__next__())
+            self.assertEqual(fit_text(text, width, align, wide_chars), exp)
+
+    def test_padding(self):
+        self.assert_like_urwid('foo', 10)
+        self.assert_like_urwid('foo', 4)
+        self.assert_like_urwid('foo', 3)
+
+    def test_cropping(self):
+        self.assert_like_urwid('abcdefghij', 6)
+        self.assert_like_urwid('abcdefghij', 1)
+
+    def test_wide_chars(self):
+        for width in (7, 6, 5, 4, 3, 2):
+            self.assert_like_urwid('日本語', width, wide_chars=True)
+            self.assert_like_urwid('a日本語b', width, wide_chars=True)
+        self.assertEqual(fit_text('日本語', 4, 'left', wide_chars=True), '日本')
+        self.assertEqual(fit_text('日本語', 4, 'right', wide_chars=True), '本語')
+        self.assertEqual(fit_text('日本語', 7, 'right', wide_chars=True), ' 日本語')
+
+
+class TestFlatRow(unittest.TestCase):
+    def setUp(self):
+        self.data = {'foo': 'a', 'bar': 'this is bar', 'baz': 'bazzz'}
+        self.tables = {}
+        for flat in (False, True):
+            table = Table(flat_rows=flat, foo=Foo, bar=Bar, baz=Baz)
+            table.columns = ('foo', 'bar', 'baz')
+            table.register(1)
+            self.tables[flat] = table
+        self.update(self.data)
+
+    def update(self, data):
+        for table in self.tables.values():
+            row = table.get_row(1)
+            row.update_columns()
+            for cell in row.widgets:
+                cell.update(data)
+            if isinstance(row, FlatRow):
+                row._invalidate()
+
+    def assert_same_render(self, width):
+        canvases = [table.get_row(1).render((width,)) for table in self.tables.values()]
+        group_canv, flat_canv = canvases
+        self.assertEqual(list(flat_canv.content()), list(group_canv.content()))
+        return [get_canvas_text(row) for row in flat_canv.content()]
+
+    def test_row_type(self):
+        self.assertIsInstance(self.tables[True].get_row(1), FlatRow)
+        self.assertNotIsInstance(self.tables[False].get_row(1), FlatRow)
+
+    def test_render_like_columns(self):
+        for width in (40, 21, 13, 8):
+            self.assert_same_render(width)
+        self.assertEqual(self.assert_same_render(23), ['a     this is bar bazzz'])
+
+    def test_cell_changes(self):
+        self.assert_same_render(30)
+        self.update({'foo': 'x', 'bar': 'y', 'baz': 'z'})
+        self.assertEqual(self.assert_same_render(30), ['x                   y     z   '])
+
+    def test_wide_chars(self):
+        self.update({'foo': '日本語', 'bar': 'this is 日本語', 'baz': '日本語'})
+        for width in (40, 23, 21, 13, 8):
+            self.assert_same_render(width)
+
+    def test_empty_markup_segments(self):
+        table = self.tables[True]
+        table.get_row(1).bar.markup = lambda width: [('empty', ''), ('cell', 'x'*width)]
+        table.get_row(1)._invalidate()
+        self.assertEqual(get_canvas_text(table.get_row(1).render((23,)).content().__next__()),
+                         'a     xxxxxxxxxxx bazzz')
+
+    def test_changing_columns(self):
+        for table in self.tables.values():
+            table.columns = ('baz', 'foo')
+        self.update(self.data)
+        self.assertEqual(self.assert_same_render(20), ['     bazzz     a    '])
+        self.assertEqual(self.tables[True].get_row(1).exists('bar'), False)
+        self.assertIsInstance(self.tables[True].get_row(1).baz, Baz)
+
+    def test_columns_are_changed_lazily(self):
+        for flat,table in self.tables.items():
+            row = table.get_row(1)
+            foo, bar = row.foo, row.bar
+            table.columns = ('bar', 'baz', 'foo')
+            self.assertEqual(tuple(row.names), ('foo', 'bar', 'baz'))
+
+            self.assertEqual(row.update_columns(), True)
+            self.assertEqual(tuple(row.names), ('bar', 'baz', 'foo'))
+            self.assertIs(row.foo, foo)
+            self.assertIs(row.bar, bar)
+            self.assertEqual(row.update_columns(), False)
+
+            table.columns = ('foo',)
+            row.update_columns()
+            self.assertEqual(tuple(row.names), ('foo',))
+            self.assertIs(row.foo, foo)
+
+            table.register(2)
+            self.assertEqual(tuple(table.get_row(2).names), ('foo',))
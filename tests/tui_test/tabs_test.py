@@ -366,3 +366,98 @@ class TestTabsKeyPress(unittest.TestCase):
         self.check(tab_pos=1, content_pos=None, edit_pos=0)
         self.tabs.keypress(self.size, 'left')
         self.check(tab_pos=0, content_pos=0, edit_pos=0)
+
+
+class HibernatingText(urwid.Text):
+    hibernating = False
+
+    def hibernate(self):
+        self.hibernating = True
+
+    def wake_up(self):
+        self.hibernating = False
+
+
+class FakeHandle():
+    def __init__(self, when, callback, args):
+        self.when, self.callback, self.args = when, callback, args
+        self.cancelled = False
+
+    def cancel(self):
+        self.cancelled = True
+
+
+class FakeLoop():
+    def __init__(self):
+        self.time = 0
+        self.handles = []
+
+    def call_later(self, delay, callback, *args):
+        handle = FakeHandle(self.time + delay, callback, args)
+        self.handles.append(handle)
+        return handle
+
+    def advance(self, seconds):
+        self.time += seconds
+        for handle in tuple(self.handles):
+            if handle.when <= self.time:
+                self.handles.remove(handle)
+                if not handle.cancelled:
+                    handle.callback(*handle.args)
+
+
+class TestTabsHibernation(unittest.TestCase):
+    def setUp(self):
+        self.loop = FakeLoop()
+        self.contents = [HibernatingText('Tab %d' % i) for i in range(3)]
+        self.tabs = Tabs(*((urwid.Text('Tab %d' % i), w) for i,w in enumerate(self.contents)),
+                         hibernate_after=10, loop=self.loop)
+
+    def hibernating(self):
+        return [w.hibernating for w in self.contents]
+
+    def test_unfocused_tabs_hibernate(self):
+        self.assertEqual(self.tabs.focus_position, 2)
+        self.loop.advance(9)
+        self.assertEqual(self.hibernating(), [False, False, False])
+        self.loop.advance(1)
+        self.assertEqual(self.hibernating(), [True, True, False])
+
+    def test_focused_tab_wakes_up(self):
+        self.loop.advance(10)
+        self.tabs.focus_position = 0
+        self.assertEqual(self.hibernating(), [False, True, False])
+        self.loop.advance(10)
+        self.assertEqual(self.hibernating(), [False, True, True])
+
+    def test_refocused_tab_does_not_hibernate(self):
+        self.loop.advance(5)
+        self.tabs.focus_position = 0
+        self.loop.advance(5)
+        self.tabs.focus_position = 2
+        self.loop.advance(5)
+        self.assertEqual(self.hibernating(), [False, True, False])
+
+    def test_removed_tab_does_not_hibernate(self):
+        self.tabs.remove(0)
+        self.loop.advance(10)
+        self.assertEqual(self.hibernating(), [False, True, False])
+
+    def test_new_content_in_background_tab(self):
+        new_content = HibernatingText('New')
+        self.loop.advance(5)
+        self.tabs.set_content(new_content, position=0)
+        self.loop.advance(5)
+        self.assertEqual(new_content.hibernating, False)
+        self.loop.advance(5)
+        self.assertEqual(new_content.hibernating, True)
+
+    def test_disable_hibernation(self):
+        self.tabs.hibernate_after = 0
+        self.loop.advance(100)
+        self.assertEqual(self.hibernating(), [False, False, False])
+        self.tabs.hibernate_after = 20
+        self.loop.advance(20)
+        self.assertEqual(self.hibernating(), [True, True, False])
+        with self.assertRaises(ValueError):
+            self.tabs.hibernate_after = -1
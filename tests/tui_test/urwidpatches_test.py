@@ -57,3 +57,44 @@ class TestListBox_scrolling_API(unittest.TestCase):
         for i in range(3):
             self.assertEqual(listbox.get_scrollpos(size), top_pos)
             listbox.keypress(size, 'top')
+
+    def test_row_index_is_cached(self):
+        class CountingText(urwid.Text):
+            calls = 0
+            def rows(self, size, focus=False):
+                CountingText.calls += 1
+                return super().rows(size, focus)
+
+        listbox = self.mk_test_subjects(*(CountingText(str(i)) for i in range(10)))
+        size = (10, 5)
+        self.assertEqual(listbox.rows_max(size), 10)
+        self.assertEqual(listbox.get_scrollpos(size), 0)
+        calls = CountingText.calls
+        for _ in range(3):
+            self.assertEqual(listbox.rows_max(size), 10)
+            self.assertEqual(listbox.get_scrollpos(size), 0)
+        # Only items around the focus are asked for their rows
+        self.assertLess(CountingText.calls - calls, 3 * 10)
+
+        # Changing the body resets the index
+        listbox.body.append(CountingText('a\nb'))
+        self.assertEqual(listbox.rows_max(size), 12)
+        listbox.body = urwid.SimpleListWalker([urwid.Text('x')])
+        self.assertEqual(listbox.rows_max(size), 1)
+        listbox.body.append(urwid.Text('y'))
+        self.assertEqual(listbox.rows_max(size), 2)
+
+    def test_row_index_of_versioned_body(self):
+        class VersionedWalker(urwid.SimpleListWalker):
+            version = 0
+
+        body = VersionedWalker([urwid.Text('1'), urwid.Text('2')])
+        listbox = urwid.ListBox(body)
+        size = (10, 1)
+        self.assertEqual(listbox.rows_max(size), 2)
+        body.set_focus(1)
+        self.assertEqual(listbox.get_scrollpos(size), 1)
+        body.append(urwid.Text('3\n4'))
+        self.assertEqual(listbox.rows_max(size), 2)  # Version didn't change
+        body.version += 1
+        self.assertEqual(listbox.rows_max(size), 4)
@@ -0,0 +1,95 @@
+from stig.tui.views.file_list import FileListWidget
+from stig.tui.keymap import KeyMap
+from stig.client.utils import Response
+
+import unittest
+
+from .._handle_urwidpatches import (setUpModule, tearDownModule)
+from .resources_views import (FakeSrvAPI, make_torrent_with_files, get_rows)
+
+
+class TestFileListWidget(unittest.TestCase):
+    def setUp(self):
+        self.srvapi = FakeSrvAPI()
+        self.flist = FileListWidget(self.srvapi, KeyMap(), tfilter=None, ffilter=None,
+                                    columns=('name',))
+        self.torrent = make_torrent_with_files(1, 'Foo', 'Foo/a', 'Foo/bar/b', 'Foo/bar/c', 'Foo/d')
+        self.srvapi.pollers[0].send(Response(success=True, torrents=(self.torrent,)))
+        self.size = (30, 10)
+
+    def get_names(self):
+        return [row.strip(' │├└─➤') for row in get_rows(self.flist, self.size)[1:]
+                if row.strip()]
+
+    def press_enter(self):
+        get_rows(self.flist, self.size)
+        self.assertEqual(self.flist.keypress(self.size, 'enter'), None)
+
+    def test_directories_are_collapsed(self):
+        self.assertEqual(self.get_names(), ['▸ Foo'])
+        self.assertEqual(self.flist.count, 4)
+        self.assertEqual(self.flist._filetree.visible_count, 1)
+
+    def test_children_are_created_when_expanded(self):
+        root = self.flist._filetree._tree._nodes[0]
+        self.assertEqual(root._children, None)
+        self.press_enter()
+        self.get_names()
+        self.assertEqual([node.content['name'] for node in root._children], ['a', 'bar', 'd'])
+        bar = root._children[1]
+        self.assertEqual(bar._children, None)
+
+    def test_expanding_and_collapsing(self):
+        self.press_enter()
+        self.assertEqual(self.get_names(), ['▾ Foo', 'a', '▸ bar', 'd'])
+
+        self.flist.focus_position = 2
+        self.press_enter()
+        self.assertEqual(self.get_names(), ['▾ Foo', 'a', '▾ bar', 'b', 'c', 'd'])
+
+        self.flist.focus_position = 0
+        self.press_enter()
+        self.assertEqual(self.get_names(), ['▸ Foo'])
+
+        # Expanded subdirectories are remembered
+        self.press_enter()
+        self.assertEqual(self.get_names(), ['▾ Foo', 'a', '▾ bar', 'b', 'c', 'd'])
+
+    def test_activating_file_does_nothing(self):
+        self.press_enter()
+        self.flist.focus_position = 1
+        get_rows(self.flist, self.size)
+        self.assertEqual(self.flist.keypress(self.size, 'enter'), 'enter')
+        self.assertEqual(self.get_names(), ['▾ Foo', 'a', '▸ bar', 'd'])
+
+    def test_index_and_position_round_trip(self):
+        self.press_enter()
+        self.flist.focus_position = 2
+        self.press_enter()
+        filetree = self.flist._filetree
+        positions = [filetree.get_position(i) for i in range(filetree.visible_count)]
+        self.assertEqual(positions, [(0,), (0, 0), (0, 1), (0, 1, 0), (0, 1, 1), (0, 2)])
+        self.assertEqual([filetree.get_index(pos) for pos in positions], list(range(6)))
+
+        for i in range(6):
+            self.flist.focus_position = i
+            self.assertEqual(self.flist.focus_position, i)
+            self.assertEqual(self.flist._listbox.focus_position, positions[i])
+        self.flist.focus_position = 100
+        self.assertEqual(self.flist.focus_position, 5)
+
+    def test_expanded_directories_survive_updates(self):
+        self.press_enter()
+        self.srvapi.pollers[0].send(Response(success=True, torrents=(self.torrent,)))
+        self.assertEqual(self.get_names(), ['▾ Foo', 'a', '▸ bar', 'd'])
+
+    def test_focus_is_restored_after_hibernation(self):
+        self.press_enter()
+        self.flist.focus_position = 2
+        get_rows(self.flist, self.size)
+        self.flist.hibernate()
+        self.assertEqual(self.get_names(), [])
+        self.flist.wake_up()
+        self.srvapi.pollers[-1].send(Response(success=True, torrents=(self.torrent,)))
+        self.assertEqual(self.get_names(), ['▾ Foo', 'a', '▸ bar', 'd'])
+        self.assertEqual(self.flist.focus_position, 2)
@@ -0,0 +1,176 @@
+from stig.tui.views import VirtualListWalker
+from stig.tui.views.torrent_list import TorrentListWidget
+from stig.tui.keymap import KeyMap
+
+import unittest
+import urwid
+
+from .._handle_urwidpatches import (setUpModule, tearDownModule)
+from .resources_views import (FakeSrvAPI, make_torrent, get_rows)
+
+
+class ItemWidget(urwid.WidgetWrap):
+    def __init__(self, data):
+        self.text = urwid.Text('')
+        super().__init__(self.text)
+        self.update(data)
+
+    def update(self, data):
+        self.data = data
+        self.text.set_text(data['name'])
+
+    def selectable(self):
+        return True
+
+    def keypress(self, size, key):
+        return key
+
+    @property
+    def id(self):
+        return self.data['id']
+
+
+class TestVirtualListWalker(unittest.TestCase):
+    def setUp(self):
+        self.created = []
+        self.reused = []
+        self.walker = VirtualListWalker(self.make_widget, max_widgets=10, item_rows=1)
+        self.listbox = urwid.ListBox(self.walker)
+
+    def make_widget(self, data, unused):
+        if unused is None:
+            widget = ItemWidget(data)
+            self.created.append(widget)
+            return widget
+        else:
+            unused.update(data)
+            self.reused.append(unused)
+            return unused
+
+    def make_data(self, ids):
+        return {id:{'id': id, 'name': 'item%d' % id} for id in ids}
+
+    def render(self, rows=5):
+        return [row.rstrip() for row in get_rows(self.listbox, (10, rows))]
+
+    def test_widgets_are_created_lazily(self):
+        self.walker.set_data(self.make_data(range(1000)))
+        self.assertEqual(self.created, [])
+        self.assertEqual(self.render(), ['item0', 'item1', 'item2', 'item3', 'item4'])
+        self.assertLessEqual(len(self.created), 7)
+        self.assertEqual(len(self.walker), 1000)
+
+    def test_widgets_are_recycled(self):
+        self.walker.set_data(self.make_data(range(1000)))
+        for _ in range(100):
+            self.listbox.keypress((10, 5), 'down')
+            self.render()
+        self.assertEqual(self.render(), ['item96', 'item97', 'item98', 'item99', 'item100'])
+        self.assertLessEqual(len(self.created), 10)
+        self.assertEqual(len(self.walker.widgets()), len(self.created))
+        self.assertGreater(len(self.reused), 0)
+        self.assertEqual(self.listbox.focus.id, 100)
+
+    def test_removed_items_release_their_widgets(self):
+        self.walker.set_data(self.make_data(range(5)))
+        self.render()
+        created = len(self.created)
+        self.walker.set_data(self.make_data(range(5, 10)))
+        self.assertEqual(self.render(), ['item5', 'item6', 'item7', 'item8', 'item9'])
+        self.assertEqual(len(self.created), created)
+
+    def test_existing_widgets_are_updated(self):
+        self.walker.set_data(self.make_data(range(3)))
+        self.render()
+        data = self.make_data(range(3))
+        data[1]['name'] = 'foo'
+        self.walker.set_data(data)
+        self.assertEqual(self.render(rows=3), ['item0', 'foo', 'item2'])
+
+    def test_focus_is_kept_after_set_data(self):
+        self.walker.set_data(self.make_data(range(10)))
+        self.listbox.focus_position = 5
+        self.render()
+
+        # Removing items before the focused item
+        self.walker.set_data(self.make_data(range(3, 10)))
+        self.assertEqual(self.walker.focus_id, 5)
+        self.assertEqual(self.listbox.focus_position, 2)
+
+        # Adding items
+        self.walker.set_data(self.make_data(range(0, 20)))
+        self.assertEqual(self.walker.focus_id, 5)
+
+        # Reordering items
+        self.walker.set_order(reversed(self.walker.ids))
+        self.assertEqual(self.walker.focus_id, 5)
+
+    def test_focus_when_focused_item_is_removed(self):
+        self.walker.set_data(self.make_data(range(10)))
+        self.render()
+        self.listbox.focus_position = 9
+        self.walker.set_data(self.make_data(range(5)))
+        self.assertEqual(self.walker.focus_id, 4)
+        self.assertEqual(self.render(rows=2), ['item3', 'item4'])
+        self.walker.set_data({})
+        self.assertEqual(self.walker.focus_id, None)
+        self.assertEqual(self.render(rows=2), ['', ''])
+
+
+class TestListWidgetMarking(unittest.TestCase):
+    def setUp(self):
+        self.srvapi = FakeSrvAPI()
+        self.tlist = TorrentListWidget(self.srvapi, KeyMap(), columns=('marked', 'name'))
+        self.srvapi.treqpool.send(self.tlist.id, (make_torrent(id, 'torrent%d' % id)
+                                                  for id in range(1000)))
+        self.size = (30, 5)
+        get_rows(self.tlist, self.size)
+
+    def test_marking_all_items_does_not_create_widgets(self):
+        walker = self.tlist._listbox.body
+        widgets = walker.widgets()
+        self.tlist.mark(all=True)
+        self.assertEqual(set(self.tlist.marked_ids), set(range(1000)))
+        self.assertEqual(set(self.tlist.marked_torrent_ids), set(range(1000)))
+        self.assertEqual(len(tuple(self.tlist.marked)), 1000)
+        self.assertEqual(set(walker.widgets()), set(widgets))
+        self.assertTrue(all(w.is_marked for w in widgets))
+
+    def test_marks_are_applied_to_new_widgets(self):
+        self.tlist.mark(all=True)
+        self.tlist.unmark()
+        self.tlist.focus_position = 500
+        get_rows(self.tlist, self.size)
+        self.assertTrue(self.tlist.focused_widget.is_marked)
+        self.tlist.focus_position = 0
+        get_rows(self.tlist, self.size)
+        self.assertFalse(self.tlist.focused_widget.is_marked)
+        self.assertEqual(len(self.tlist.marked_ids), 999)
+
+    def test_removed_items_are_unmarked(self):
+        self.tlist.mark(all=True)
+        self.srvapi.treqpool.send(self.tlist.id, (make_torrent(id, 'torrent%d' % id)
+                                                  for id in range(10)))
+        get_rows(self.tlist, self.size)
+        self.assertEqual(set(self.tlist.marked_ids), set(range(10)))
+
+
+class TestListWidgetColumns(unittest.TestCase):
+    def setUp(self):
+        self.srvapi = FakeSrvAPI()
+        self.tlist = TorrentListWidget(self.srvapi, KeyMap(), columns=('name',))
+        self.srvapi.treqpool.send(self.tlist.id, (make_torrent(id, 'torrent%d' % id)
+                                                  for id in range(2)))
+        self.size = (30, 3)
+
+    def test_changing_columns_updates_displayed_rows(self):
+        self.assertEqual(get_rows(self.tlist, self.size)[1].split(), ['torrent0'])
+        self.tlist.columns = ('path', 'name')
+        self.assertEqual(get_rows(self.tlist, self.size)[1].split(), ['/foo', 'torrent0'])
+
+    def test_changing_columns_keeps_other_canvases(self):
+        get_rows(self.tlist, self.size)
+        other = urwid.Text('foo')
+        canvas = other.render((10,))
+        self.tlist.columns = ('path', 'name')
+        self.assertIs(other.render((10,)), canvas)
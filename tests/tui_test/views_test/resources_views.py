@@ -0,0 +1,89 @@
+from stig.client.aiotransmission.torrent import Torrent
+from stig.client.utils import Worker
+
+import asyncio
+from types import SimpleNamespace
+
+
+class FakeTorrentRequestPool():
+    def __init__(self):
+        self.requests = {}
+        self.polls = 0
+
+    def register(self, sid, callback, keys=(), tfilter=None):
+        self.requests[sid] = {'callback': callback, 'keys': tuple(keys), 'tfilter': tfilter}
+
+    def remove(self, sid):
+        self.requests.pop(sid, None)
+
+    def poll(self):
+        self.polls += 1
+
+    def send(self, sid, torrents):
+        self.requests[sid]['callback'](tuple(torrents))
+
+
+class FakeRequestPoller():
+    def __init__(self, request, *args, **kwargs):
+        self.request = request
+        self.args = args
+        self.kwargs = kwargs
+        self.callbacks = []
+        self.polls = 0
+
+    def set_request(self, request, *args, **kwargs):
+        self.request = request
+        self.args = args
+        self.kwargs = kwargs
+
+    def on_response(self, callback):
+        self.callbacks.append(callback)
+
+    def remove_callback(self, callback):
+        self.callbacks.remove(callback)
+
+    def poll(self):
+        self.polls += 1
+
+    def send(self, response):
+        for callback in self.callbacks:
+            callback(response)
+
+
+class FakeSrvAPI():
+    def __init__(self, loop=None):
+        self.loop = loop or asyncio.get_event_loop()
+        self.treqpool = FakeTorrentRequestPool()
+        self.torrent = SimpleNamespace(torrents=None)
+        self.worker = Worker(loop=self.loop)
+        self.pollers = []
+
+    def create_poller(self, *args, **kwargs):
+        poller = FakeRequestPoller(*args, **kwargs)
+        self.pollers.append(poller)
+        return poller
+
+    def manage_pollers_now(self):
+        pass
+
+
+def make_torrent(id, name, **raw):
+    raw_torrent = {'id': id, 'name': name, 'status': 0, 'percentDone': 0,
+                   'metadataPercentComplete': 1, 'recheckProgress': 0,
+                   'rateDownload': 0, 'rateUpload': 0, 'peersConnected': 0,
+                   'trackerStats': [], 'isPrivate': False, 'sizeWhenDone': 1000,
+                   'downloadDir': '/foo'}
+    raw_torrent.update(raw)
+    return Torrent(raw_torrent)
+
+
+def make_torrent_with_files(id, name, *files):
+    raw_files = [{'name': filename, 'length': 100, 'bytesCompleted': 0}
+                 for filename in files]
+    raw_fileStats = [{'wanted': True, 'priority': 0, 'bytesCompleted': 0}
+                     for filename in files]
+    return make_torrent(id, name, files=raw_files, fileStats=raw_fileStats)
+
+
+def get_rows(widget, size):
+    return [row.decode('utf-8') for row in widget.render(size, focus=True).text]
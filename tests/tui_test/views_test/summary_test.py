@@ -0,0 +1,199 @@
+from stig.tui.views.summary import (TorrentSummaryWidget, HEAVY_INTERVAL)
+from stig.client.utils import Response
+
+import unittest
+import urwid
+import asyncio
+from types import SimpleNamespace
+
+from .._handle_urwidpatches import (setUpModule, tearDownModule)
+from .resources_views import (FakeSrvAPI, get_rows)
+
+
+class TestTorrentSummaryWidget(unittest.TestCase):
+    def setUp(self):
+        self.srvapi = FakeSrvAPI()
+        self.summary = TorrentSummaryWidget(self.srvapi, 1)
+        self.poller = self.srvapi.pollers[0]
+        self.size = (60, 10)
+
+    def send(self, **torrent):
+        torrent.setdefault('id', 1)
+        torrent.setdefault('name', 'Foo')
+        self.poller.send(Response(success=True, torrents=(torrent,)))
+
+    def get_titles(self):
+        return [section.title for section in self.summary._visible_sections]
+
+    def get_value(self, title, label):
+        for item,value_w in self.summary._sections[title]._value_widgets.items():
+            if item.label == label:
+                return value_w.text
+        raise ValueError(label)
+
+    def get_keys(self):
+        return self.poller.kwargs['keys']
+
+    def render(self):
+        rows = get_rows(self.summary, self.size)
+        # Run callbacks scheduled by render()
+        self.srvapi.loop.run_until_complete(asyncio.sleep(0))
+        return rows
+
+    def scroll_to(self, position):
+        self.summary._scrollable.set_scrollpos(position)
+        return self.render()
+
+    def assert_keys_of_sections(self, *titles):
+        exp_keys = set(('name',))
+        for title in titles:
+            exp_keys.update(self.summary._sections[title].needed_keys)
+        self.assertEqual(self.get_keys(), tuple(sorted(exp_keys)))
+
+    def test_all_sections_are_requested_initially(self):
+        self.assertEqual(self.get_titles(), ['Torrent', 'Status', 'Limits', 'Peers', 'Dates and Times'])
+        self.assertEqual(self.poller.request, self.srvapi.torrent.torrents)
+        self.assertEqual(self.poller.args, ((1,),))
+        self.assert_keys_of_sections('Torrent', 'Status', 'Limits', 'Peers', 'Dates and Times')
+
+    def test_only_visible_sections_are_requested(self):
+        self.render()
+        self.assertEqual(self.get_titles(), ['Torrent'])
+        self.assert_keys_of_sections('Torrent')
+
+        self.scroll_to(20)
+        self.assertEqual(self.get_titles(), ['Limits', 'Peers', 'Dates and Times'])
+        self.assert_keys_of_sections('Limits', 'Peers', 'Dates and Times')
+
+    def test_all_sections_are_visible_if_they_fit(self):
+        self.size = (200, 30)
+        self.render()
+        self.assertEqual(self.get_titles(), ['Torrent', 'Status', 'Limits', 'Peers', 'Dates and Times'])
+        self.assert_keys_of_sections('Torrent', 'Status', 'Limits', 'Peers', 'Dates and Times')
+
+    def test_section_is_updated_when_scrolled_back_into_view(self):
+        self.render()
+        self.send(name='Foo')
+        rows = self.scroll_to(0)
+        self.assertIn('Name: Foo', rows[1])
+
+        self.scroll_to(20)
+        self.assertNotIn('Torrent', self.get_titles())
+        self.send(name='Bar')
+        self.assertEqual(self.get_value('Torrent', 'Name'), 'Foo')
+
+        rows = self.scroll_to(0)
+        self.assertEqual(self.get_titles(), ['Torrent'])
+        self.assertIn('Name: Bar', rows[1])
+        self.assert_keys_of_sections('Torrent')
+
+    def test_newly_visible_section_with_missing_values_polls_immediately(self):
+        self.render()
+        self.send()
+        polls = self.poller.polls
+        self.scroll_to(20)
+        self.assertEqual(self.poller.polls, polls + 1)
+
+    def test_newly_visible_section_with_known_values_polls_immediately(self):
+        size = SimpleNamespace(with_unit='1 kB')
+        torrent = {key: 'x' for key in self.summary._sections['Torrent'].needed_keys}
+        torrent.update({'size-total': size, 'size-final': size, 'size-piece': size,
+                        'count-pieces': 1, 'files': SimpleNamespace(files=())})
+        self.render()
+        self.send(**torrent)
+        self.scroll_to(20)
+        self.send(**torrent)
+        polls = self.poller.polls
+        self.scroll_to(0)
+        self.assertEqual(self.get_titles(), ['Torrent'])
+        self.assertEqual(self.poller.polls, polls + 1)
+
+    def test_hidden_sections_do_not_poll(self):
+        polls = self.poller.polls
+        self.render()
+        self.assertEqual(self.get_titles(), ['Torrent'])
+        self.assert_keys_of_sections('Torrent')
+        self.assertEqual(self.poller.polls, polls)
+
+    def test_rendering_does_not_change_request(self):
+        get_rows(self.summary, self.size)
+        self.assertEqual(self.get_titles(), ['Torrent'])
+        self.assert_keys_of_sections('Torrent', 'Status', 'Limits', 'Peers', 'Dates and Times')
+        self.srvapi.loop.run_until_complete(asyncio.sleep(0))
+        self.assert_keys_of_sections('Torrent')
+
+    def test_visibility_changes_between_polls_are_handled_once(self):
+        self.render()
+        self.send()
+        polls = self.poller.polls
+        self.summary._scrollable.set_scrollpos(20)
+        get_rows(self.summary, self.size)
+        self.summary._scrollable.set_scrollpos(0)
+        get_rows(self.summary, self.size)
+        self.srvapi.loop.run_until_complete(asyncio.sleep(0))
+        self.assertEqual(self.get_titles(), ['Torrent'])
+        self.assert_keys_of_sections('Torrent')
+        self.assertEqual(self.poller.polls, polls + 1)
+
+    def test_heavy_keys_are_requested_every_HEAVY_INTERVAL_polls(self):
+        self.render()
+        self.assertIn('files', self.get_keys())
+        self.send(files=SimpleNamespace(files=()))
+        self.assertNotIn('files', self.get_keys())
+        for _ in range(HEAVY_INTERVAL - 2):
+            self.send(files=SimpleNamespace(files=()))
+            self.assertNotIn('files', self.get_keys())
+        self.send(files=SimpleNamespace(files=()))
+        self.assertIn('files', self.get_keys())
+        self.send(files=SimpleNamespace(files=()))
+        self.assertNotIn('files', self.get_keys())
+
+    def test_heavy_keys_are_requested_until_received(self):
+        self.render()
+        self.send()
+        self.assertIn('files', self.get_keys())
+        self.send()
+        self.assertIn('files', self.get_keys())
+
+    def test_unchanged_values_are_not_set(self):
+        self.render()
+        section = self.summary._sections['Torrent']
+        set_texts = []
+        for item,value_w in section._value_widgets.items():
+            def set_text(text, value_w=value_w, orig=value_w.set_text):
+                set_texts.append(text)
+                orig(text)
+            value_w.set_text = set_text
+
+        self.send(name='Foo')
+        self.assertEqual(sorted(set_texts), ['1', 'Foo'])
+        self.send(name='Foo')
+        self.assertEqual(sorted(set_texts), ['1', 'Foo'])
+        self.send(name='Bar')
+        self.assertEqual(sorted(set_texts), ['1', 'Bar', 'Foo'])
+
+    def test_title(self):
+        titles = []
+        self.summary.title_updater = titles.append
+        self.assertEqual(self.summary.title, 'No title')
+        self.send(name='Foo')
+        self.assertEqual(titles, ['Foo'])
+        self.assertEqual(self.summary.focused_torrent_id, 1)
+
+    def test_failed_response(self):
+        self.send(name='Foo')
+        self.poller.send(Response(success=False, torrents=()))
+        self.assertEqual(self.summary.title, 'No title')
+        self.assertEqual(self.summary.focused_torrent_id, None)
+
+    def test_all_sections_are_visible_if_GridFlow_internals_change(self):
+        self.render()
+        self.assertEqual(self.get_titles(), ['Torrent'])
+
+        self.summary._grid.get_display_widget = lambda size: urwid.Text('foo')
+        self.scroll_to(20)
+        self.assertEqual(self.get_titles(), ['Torrent', 'Status', 'Limits', 'Peers', 'Dates and Times'])
+
+        self.summary._grid.get_display_widget = lambda size: urwid.Pile([urwid.Text('foo')])
+        self.scroll_to(0)
+        self.assertEqual(self.get_titles(), ['Torrent', 'Status', 'Limits', 'Peers', 'Dates and Times'])
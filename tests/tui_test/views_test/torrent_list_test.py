@@ -0,0 +1,269 @@
+from stig.tui.views.torrent_list import TorrentListWidget
+from stig.tui.keymap import KeyMap
+from stig.client import TorrentSorter
+from stig.tui.table import (FlatRow, TableRow)
+
+import unittest
+import asyncio
+from urwid.util import calc_width
+
+from .._handle_urwidpatches import (setUpModule, tearDownModule)
+from .resources_views import (FakeSrvAPI, make_torrent, get_rows)
+
+
+class TestTorrentListWidget(unittest.TestCase):
+    def setUp(self):
+        self.srvapi = FakeSrvAPI()
+        self.tlist = TorrentListWidget(self.srvapi, KeyMap(), columns=('name',),
+                                       sort=TorrentSorter(('name',)))
+        self.torrents = (make_torrent(1, 'Foo'), make_torrent(2, 'Bar'), make_torrent(3, 'Foobar'))
+
+    def send_torrents(self, torrents):
+        self.srvapi.treqpool.send(self.tlist.id, torrents)
+
+    def get_names(self):
+        get_rows(self.tlist, (30, 10))
+        return [t['name'] for t in self.tlist._listbox.body.values()]
+
+    def test_render_before_torrents_arrive(self):
+        rows = get_rows(self.tlist, (30, 3))
+        self.assertEqual(len(rows), 3)
+        self.assertEqual(self.tlist.count, 0)
+        self.assertEqual(self.tlist.focused_id, None)
+
+        self.send_torrents(self.torrents)
+        self.assertEqual(self.get_names(), ['Bar', 'Foo', 'Foobar'])
+        self.assertEqual(self.tlist.count, 3)
+
+    def test_sort_keys_are_computed_in_worker_thread(self):
+        self.srvapi.worker.threaded = True
+        self.addCleanup(setattr, self.srvapi.worker, 'threaded', False)
+        def wait_for_worker():
+            while self.tlist._sort_pending is not None:
+                self.srvapi.loop.run_until_complete(asyncio.sleep(0.001))
+                get_rows(self.tlist, (30, 10))
+
+        self.send_torrents(self.torrents)
+        # Items are sorted when the worker is done
+        self.assertEqual(self.get_names(), ['Foo', 'Bar', 'Foobar'])
+        wait_for_worker()
+        self.assertEqual(self.get_names(), ['Bar', 'Foo', 'Foobar'])
+
+        self.send_torrents((make_torrent(1, 'Zoo'),) + self.torrents[1:])
+        self.assertEqual(self.get_names(), ['Bar', 'Zoo', 'Foobar'])
+        wait_for_worker()
+        self.assertEqual(self.get_names(), ['Bar', 'Foobar', 'Zoo'])
+
+    def test_livefilter_narrows_previous_result(self):
+        self.send_torrents(self.torrents)
+        applied = []
+        results = self.tlist._livefilter_results
+        orig_apply = results.apply
+        def apply(filterchain):
+            result = orig_apply(filterchain)
+            applied.append((str(filterchain), result))
+            return result
+        results.apply = apply
+
+        self.tlist.livefilter = 'name~Fo'
+        self.assertEqual(self.get_names(), ['Foo', 'Foobar'])
+        self.tlist.livefilter = 'name~Foob'
+        self.assertEqual(self.get_names(), ['Foobar'])
+        self.tlist.livefilter = 'name~Fo'
+        self.assertEqual(self.get_names(), ['Foo', 'Foobar'])
+        self.assertEqual([f for f,r in applied], ['~Fo', '~Foob', '~Fo'])
+        # Per-prefix results are remembered
+        self.assertIs(applied[0][1], applied[2][1])
+
+    def test_livefilter_is_applied_to_new_torrents(self):
+        self.send_torrents(self.torrents)
+        self.tlist.livefilter = 'name~Bar'
+        self.assertEqual(self.get_names(), ['Bar'])
+        self.send_torrents(self.torrents + (make_torrent(4, 'Barfoo'),))
+        self.assertEqual(self.get_names(), ['Bar', 'Barfoo'])
+
+    def test_clearing_livefilter_restores_list(self):
+        self.send_torrents(self.torrents)
+        self.tlist.livefilter = 'name~Bar'
+        self.assertEqual(self.get_names(), ['Bar'])
+        self.tlist.livefilter = None
+        self.assertEqual(self.get_names(), ['Bar', 'Foo', 'Foobar'])
+
+    def test_livefilter_with_unrequested_keys(self):
+        self.send_torrents(self.torrents)
+        self.assertNotIn('path', self.srvapi.treqpool.requests[self.tlist.id]['keys'])
+        polls = self.srvapi.treqpool.polls
+        self.tlist.livefilter = 'path=/bar'
+        self.assertIn('path', self.srvapi.treqpool.requests[self.tlist.id]['keys'])
+        self.assertEqual(self.srvapi.treqpool.polls, polls + 1)
+        self.send_torrents((make_torrent(1, 'Foo', downloadDir='/bar'),) + self.torrents[1:])
+        self.assertEqual(self.get_names(), ['Foo'])
+
+    def test_invalid_livefilter(self):
+        with self.assertRaises(ValueError):
+            self.tlist.livefilter = 'foo='
+        self.assertEqual(self.tlist.livefilter, None)
+
+    def test_livefilter_is_shown_in_title(self):
+        titles = []
+        self.tlist.title_updater = lambda title, count: titles.append((title, count))
+        self.send_torrents(self.torrents)
+        self.assertEqual(titles[-1], ('all', ' [3]'))
+        self.tlist.livefilter = 'name~Fo'
+        self.assertEqual(titles[-1], ('all /~Fo', ' [2]'))
+        self.tlist.livefilter = None
+        self.assertEqual(titles[-1], ('all', ' [3]'))
+
+
+class TestTorrentListHibernation(unittest.TestCase):
+    def setUp(self):
+        self.srvapi = FakeSrvAPI()
+        self.tlist = TorrentListWidget(self.srvapi, KeyMap(), columns=('name',),
+                                       sort=TorrentSorter(('name',)))
+        self.torrents = tuple(make_torrent(i, 'Torrent %03d' % i) for i in range(1, 6))
+
+    def send_torrents(self, torrents):
+        self.srvapi.treqpool.send(self.tlist.id, torrents)
+        get_rows(self.tlist, (30, 10))
+
+    def hibernate(self, focus_position):
+        self.send_torrents(self.torrents)
+        self.tlist.focus_position = focus_position
+        get_rows(self.tlist, (30, 10))
+        self.tlist.hibernate()
+        self.assertNotIn(self.tlist.id, self.srvapi.treqpool.requests)
+        self.assertEqual(self.tlist.count, 0)
+        self.tlist.wake_up()
+
+    def test_focus_is_restored_by_id(self):
+        self.hibernate(focus_position=2)
+        self.send_torrents((make_torrent(10, 'A torrent'),) + self.torrents)
+        self.assertEqual(self.tlist.focused_id, 3)
+        self.assertEqual(self.tlist.focus_position, 3)
+
+    def test_focus_is_restored_by_position_if_focused_item_was_removed(self):
+        self.hibernate(focus_position=4)
+        self.send_torrents(self.torrents[:2])
+        self.assertEqual(self.tlist.focused_id, 2)
+
+    def test_focus_position_is_kept_if_focused_item_was_removed(self):
+        self.hibernate(focus_position=1)
+        self.send_torrents(self.torrents[2:])
+        self.assertEqual(self.tlist.focused_id, 4)
+
+    def test_focus_is_restored_while_sorting(self):
+        self.torrents = tuple(make_torrent(i, 'Torrent %03d' % i) for i in range(1, 201))
+        self.hibernate(focus_position=150)
+        self.tlist._SORT_TIMESLICE = 0
+        self.send_torrents(tuple(reversed(self.torrents)))
+        self.assertIsNotNone(self.tlist._sort_pending)
+        self.assertEqual(self.tlist.focused_id, 151)
+        while self.tlist._sort_pending is not None:
+            get_rows(self.tlist, (30, 10))
+        self.assertEqual(self.tlist.focused_id, 151)
+        self.assertEqual(self.tlist.focus_position, 150)
+
+    def test_hibernating_forgets_livefilter_results(self):
+        self.send_torrents(self.torrents)
+        self.tlist.livefilter = 'name~00'
+        self.tlist.hibernate()
+        self.assertEqual(self.tlist._livefilter_results.objects, ())
+        self.tlist.wake_up()
+        self.send_torrents(self.torrents)
+        self.assertEqual(self.tlist.count, 5)
+
+
+class TestTorrentListFlatRows(unittest.TestCase):
+    def setUp(self):
+        self.srvapi = FakeSrvAPI()
+        self.tlist = TorrentListWidget(self.srvapi, KeyMap(), columns=('marked', 'name'),
+                                       sort=TorrentSorter(('name',)))
+        self.srvapi.treqpool.send(self.tlist.id, (make_torrent(1, 'Foo'), make_torrent(2, 'Bar'),
+                                                  make_torrent(3, 'Baz')))
+        self.size = (30, 5)
+        get_rows(self.tlist, self.size)
+
+    def get_row_types(self):
+        return set(type(widget._cells_group) for widget in self.tlist._listbox.body.widgets())
+
+    def test_switching_rows(self):
+        self.assertEqual(self.tlist.flat_rows, True)
+        self.assertEqual(self.get_row_types(), {FlatRow})
+        self.tlist.focus_position = 2
+        self.tlist.mark()
+        rows = get_rows(self.tlist, self.size)
+
+        self.tlist.flat_rows = False
+        self.assertEqual(self.tlist.flat_rows, False)
+        self.assertEqual(get_rows(self.tlist, self.size), rows)
+        self.assertEqual(self.get_row_types(), {TableRow})
+        self.assertEqual(self.tlist.focused_id, 1)
+        self.assertEqual(self.tlist.marked_ids, (1,))
+        self.assertEqual(self.srvapi.treqpool.polls, 1)
+
+        self.tlist.flat_rows = True
+        self.assertEqual(get_rows(self.tlist, self.size), rows)
+        self.assertEqual(self.get_row_types(), {FlatRow})
+
+    def test_new_lists_use_class_default(self):
+        TorrentListWidget.use_flat_rows = False
+        try:
+            tlist = TorrentListWidget(self.srvapi, KeyMap(), columns=('name',))
+        finally:
+            del TorrentListWidget.use_flat_rows
+        self.assertEqual(tlist.flat_rows, False)
+
+    def test_unsupported_flat_rows(self):
+        class TorrentList(TorrentListWidget):
+            flat_rows_supported = False
+        tlist = TorrentList(self.srvapi, KeyMap(), columns=('name',))
+        self.assertEqual(tlist.flat_rows, False)
+        tlist.flat_rows = True
+        self.assertEqual(tlist.flat_rows, False)
+
+
+class TestTorrentListRowCanvases(unittest.TestCase):
+    flat_rows = True
+
+    def setUp(self):
+        class TorrentList(TorrentListWidget):
+            use_flat_rows = self.flat_rows
+        self.srvapi = FakeSrvAPI()
+        self.tlist = TorrentList(self.srvapi, KeyMap(), columns=('name', 'path'))
+        self.send_torrents('Foo', 'Bar')
+        get_rows(self.tlist, (30, 5))
+
+    def send_torrents(self, *names):
+        self.srvapi.treqpool.send(self.tlist.id, (make_torrent(id, name)
+                                                  for id,name in enumerate(names)))
+
+    def render_row(self, id):
+        widget = self.tlist._listbox.body.get_widget(id)
+        return widget.render((30,), focus=self.tlist.focused_id == id)
+
+    def test_unchanged_row_keeps_its_canvas(self):
+        canvas = self.render_row(0)
+        self.assertIs(self.render_row(0), canvas)
+        self.send_torrents('Foo', 'Bar')
+        get_rows(self.tlist, (30, 5))
+        self.assertIs(self.render_row(0), canvas)
+
+    def test_changed_row_is_rendered(self):
+        canvas0, canvas1 = self.render_row(0), self.render_row(1)
+        self.send_torrents('Foo', 'Baz')
+        get_rows(self.tlist, (30, 5))
+        self.assertIs(self.render_row(0), canvas0)
+        canvas1_new = self.render_row(1)
+        self.assertIsNot(canvas1_new, canvas1)
+        self.assertEqual(canvas1_new.text[0].decode().split(), ['Baz', '/foo'])
+
+    def test_wide_chars_dont_shift_columns(self):
+        self.send_torrents('Foo', '日本語の名前がとても長いトレント', 'Bar')
+        rows = get_rows(self.tlist, (30, 5))[1:4]
+        path_cols = [calc_width(row, 0, row.index('/foo')) for row in rows]
+        self.assertEqual(path_cols, [path_cols[0]] * 3)
+        self.assertEqual([calc_width(row, 0, len(row)) for row in rows], [30] * 3)
+
+
+class TestTorrentListRowCanvasesWithColumns(TestTorrentListRowCanvases):
+    flat_rows = False